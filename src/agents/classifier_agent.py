@@ -98,7 +98,6 @@ class ClassifierAgent:
             duration_ms = (time.time() - start_time) * 1000
             log_agent_execution(
                 agent_name="ClassifierAgent",
-                lead_id=lead.lead_id,
                 action="classify",
                 duration_ms=duration_ms,
                 intent=result.intent,
@@ -146,7 +146,6 @@ class DirectorService:
             duration_ms = (time.time() - start_time) * 1000
             log_agent_execution(
                 agent_name="DirectorAgent",
-                lead_id=lead.lead_id,
                 action="decide_strategy",
                 duration_ms=duration_ms,
                 strategic_action=result.action,
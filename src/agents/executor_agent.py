@@ -116,7 +116,6 @@ class ExecutorService:
             duration_ms = (time.time() - start_time) * 1000
             log_agent_execution(
                 agent_name="ExecutorAgent",
-                lead_id=lead.lead_id,
                 action="craft_message",
                 duration_ms=duration_ms,
                 agreement_level=result.agreement_level
@@ -337,6 +337,7 @@ async def lifespan(app: FastAPI):
             except asyncio.CancelledError:
                 logger.info(f"Stopped {name}")
 
+    await twilio_service.close()
     await orchestrator.shutdown()
     logger.info("Shutdown complete")
 
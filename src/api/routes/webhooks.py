@@ -160,36 +160,34 @@ async def twilio_webhook(
         rate_limiter: InMemoryRateLimiter = request.app.state.rate_limiter
         message_buffer: MessageBuffer = request.app.state.message_buffer
 
-        # Check if lead is banned
-        is_banned = await rate_limiter.is_banned(phone)
-        if is_banned:
-            ban_info = await rate_limiter.get_ban_info(phone)
-            if ban_info:
-                ban_until, ban_reason = ban_info
-
-                logger.warning(
-                    f"Blocked message from banned lead",
-                    extra={"phone": phone, "ban_reason": ban_reason}
-                )
-
-                # Send ban notification to user
-                await twilio_service.send_whatsapp_message(
-                    to_number=phone,
-                    message="Your account is temporarily restricted. Please try again later."
-                )
-
-                return JSONResponse(
-                    status_code=429,
-                    content={
-                        "status": "banned",
-                        "phone": phone,
-                        "ban_until": ban_until.isoformat(),
-                        "reason": ban_reason
-                    }
-                )
-
-        # Check rate limit
-        rate_limit_result = await rate_limiter.check_rate_limit(phone)
+        # Check ban, rate limit and (only if auto-ban is on) spikes in one pass
+        rate_limit_result, spike_detected = await rate_limiter.check_and_detect(
+            phone, spike_check=settings.rate_limit_auto_ban_on_spike
+        )
+
+        if rate_limit_result.banned:
+            ban_reason = rate_limit_result.reason
+
+            logger.warning(
+                f"Blocked message from banned lead",
+                extra={"phone": phone, "ban_reason": ban_reason}
+            )
+
+            # Send ban notification to user
+            await twilio_service.send_whatsapp_message(
+                to_number=phone,
+                message="Your account is temporarily restricted. Please try again later."
+            )
+
+            return JSONResponse(
+                status_code=429,
+                content={
+                    "status": "banned",
+                    "phone": phone,
+                    "ban_until": rate_limit_result.reset_at.isoformat(),
+                    "reason": ban_reason
+                }
+            )
 
         if not rate_limit_result.allowed:
             logger.warning(
@@ -216,34 +214,32 @@ async def twilio_webhook(
                 }
             )
 
-        # Detect spike and auto-ban if configured
-        if settings.rate_limit_auto_ban_on_spike:
-            spike_detected = await rate_limiter.detect_spike(phone)
-            if spike_detected:
-                await rate_limiter.ban_lead(
-                    phone,
-                    settings.rate_limit_ban_duration_seconds,
-                    "Spike detected: Too many messages in short period"
-                )
-
-                logger.warning(
-                    f"Lead auto-banned due to spike",
-                    extra={"phone": phone}
-                )
-
-                await twilio_service.send_whatsapp_message(
-                    to_number=phone,
-                    message="You've been sending too many messages. Your account is temporarily restricted."
-                )
-
-                return JSONResponse(
-                    status_code=429,
-                    content={
-                        "status": "banned",
-                        "phone": phone,
-                        "reason": "Spike detected"
-                    }
-                )
+        # Auto-ban on spike; only detected when configured
+        if spike_detected:
+            await rate_limiter.ban_lead(
+                phone,
+                settings.rate_limit_ban_duration_seconds,
+                "Spike detected: Too many messages in short period"
+            )
+
+            logger.warning(
+                f"Lead auto-banned due to spike",
+                extra={"phone": phone}
+            )
+
+            await twilio_service.send_whatsapp_message(
+                to_number=phone,
+                message="You've been sending too many messages. Your account is temporarily restricted."
+            )
+
+            return JSONResponse(
+                status_code=429,
+                content={
+                    "status": "banned",
+                    "phone": phone,
+                    "reason": "Spike detected"
+                }
+            )
 
         # Add to message buffer (handles WhatsApp burst messages)
         # Buffer will concatenate rapid messages and enqueue after delay
@@ -53,6 +53,9 @@ class Settings(BaseSettings):
     max_retries: int = 3
     retry_min_wait_seconds: int = 2
     retry_max_wait_seconds: int = 10
+    openai_requests_per_second: float = 10.0  # Client-side token bucket rate
+    max_concurrent_llm_calls: int = 20  # In-flight agent runs across the process
+    twilio_messages_per_second: float = 10.0  # Client-side token bucket rate
 
     # ============================================
     # COMPLIANCE & SECURITY
@@ -16,7 +16,7 @@ from src.agents.classifier_agent import ClassifierAgent
 from src.agents.director_agent import DirectorService
 from src.agents.executor_agent import ExecutorService
 from src.models.director_response import StrategicAction
-from src.utils.observability import log_agent_execution
+from src.utils.observability import log_agent_execution, request_context
 from src.repositories import db_manager, LeadRepository, MessageRepository
 from src.utils.security_validator import SecurityValidator, ValidationResult
 from src.services.handoff_service import HandoffService, get_handoff_service
@@ -178,6 +178,17 @@ class ConversationOrchestrator:
             SecurityException: If security threats detected and message blocked
             Exception: If any critical step fails and fallbacks don't work
         """
+        # lead_id is attached to every log record from here down, including
+        # the agents' own logs
+        with request_context(lead.lead_id):
+            return await self._process_message(message_content, lead)
+
+    async def _process_message(
+        self,
+        message_content: str,
+        lead: Lead
+    ) -> OrchestrationResult:
+        """Run the pipeline for process_message() inside the lead's log context."""
         start_time = time.time()
 
         logger.info(f"🎬 Starting orchestration for lead: {lead.lead_id}")
@@ -276,7 +287,6 @@ class ConversationOrchestrator:
 
                 log_agent_execution(
                     agent_name="ConversationOrchestrator",
-                    lead_id=lead.lead_id,
                     action="handoff_triggered",
                     duration_ms=total_duration_ms,
                     intent=classification.intent,
@@ -336,7 +346,6 @@ class ConversationOrchestrator:
             # Log orchestration completion
             log_agent_execution(
                 agent_name="ConversationOrchestrator",
-                lead_id=lead.lead_id,
                 action="process_message",
                 duration_ms=total_duration_ms,
                 intent=classification.intent,
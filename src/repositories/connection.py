@@ -117,10 +117,14 @@ class DatabaseManager:
         )
 
         # Messages collection indexes
+        # Includes _id so (timestamp, _id) history cursors are served by the index
         await db.messages.create_index(
-            [("lead_id", 1), ("timestamp", -1)],
-            name="idx_lead_messages"
+            [("lead_id", 1), ("timestamp", -1), ("_id", -1)],
+            name="idx_lead_messages_cursor"
         )
+        # Superseded by idx_lead_messages_cursor; drop it from existing databases
+        if "idx_lead_messages" in await db.messages.index_information():
+            await db.messages.drop_index("idx_lead_messages")
         await db.messages.create_index(
             "timestamp",
             name="idx_timestamp"
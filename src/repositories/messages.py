@@ -2,14 +2,18 @@
 Message Repository
 Time-series message storage and conversation history retrieval.
 """
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from motor.motor_asyncio import AsyncIOMotorDatabase
+from bson import ObjectId
 import datetime as dt
 
 from .base import BaseRepository
 from ..models.message import Message, MessageRole
 from ..utils.observability import logger
 
+# Keyset pagination cursor: (timestamp, _id) of the oldest message already seen
+HistoryCursor = Tuple[dt.datetime, ObjectId]
+
 
 class MessageRepository(BaseRepository[Message]):
     """
@@ -25,36 +29,57 @@ class MessageRepository(BaseRepository[Message]):
         self,
         lead_id: str,
         limit: int = 100,
-        before: Optional[dt.datetime] = None
-    ) -> List[Message]:
+        before: Optional[HistoryCursor] = None
+    ) -> Tuple[List[Message], Optional[HistoryCursor]]:
         """
-        Retrieve full conversation history for a lead.
+        Retrieve conversation history for a lead, paginating backwards in time.
+
+        Pagination uses a composite (timestamp, _id) cursor so messages that
+        share the same timestamp are never skipped or returned twice.
+
+        Without a cursor this returns the newest `limit` messages, not the
+        oldest: the first page is the most recent one, and each following
+        page is older. The result is a (messages, cursor) tuple rather than
+        a bare list.
 
         Args:
             lead_id: Lead's phone number
             limit: Maximum number of messages to return
-            before: Get messages before this timestamp (pagination)
+            before: Cursor returned by a previous call; only messages strictly
+                older than it are returned
 
         Returns:
-            List of Message instances sorted by timestamp (oldest first)
+            Tuple of (messages sorted by timestamp oldest first, cursor for the
+            next older page or None when there are no more messages)
         """
-        filter_dict = {"lead_id": lead_id}
+        filter_dict: Dict[str, Any] = {"lead_id": lead_id}
 
         if before:
-            filter_dict["timestamp"] = {"$lt": before}
+            before_ts, before_id = before
+            filter_dict["$or"] = [
+                {"timestamp": {"$lt": before_ts}},
+                {"timestamp": before_ts, "_id": {"$lt": before_id}},
+            ]
 
+        # Newest first so the page is the one adjacent to the cursor
         messages = await self.find_many(
             filter_dict=filter_dict,
             limit=limit,
-            sort=[("timestamp", 1)]  # Chronological order
+            sort=[("timestamp", -1), ("_id", -1)]
         )
+        messages.reverse()  # Chronological order
+
+        next_cursor: Optional[HistoryCursor] = None
+        if messages and len(messages) == limit:
+            oldest = messages[0]
+            next_cursor = (oldest.timestamp, ObjectId(oldest.id))
 
         logger.debug(
             f"Retrieved conversation history for {lead_id}",
             extra={"lead_id": lead_id, "message_count": len(messages)}
         )
 
-        return messages
+        return messages, next_cursor
 
     async def get_recent_messages(
         self,
@@ -242,22 +267,43 @@ class MessageRepository(BaseRepository[Message]):
 
         return sum(response_times) / len(response_times)
 
-    async def delete_messages_for_lead(self, lead_id: str) -> int:
+    async def delete_messages_for_lead(
+        self,
+        lead_id: str,
+        batch_size: int = 1000
+    ) -> int:
         """
         Delete all messages for a lead.
         Use cautiously - intended for GDPR compliance or data cleanup.
 
+        Deletes in batches of _ids so large purges don't hold one long
+        operation and other queries can interleave between batches.
+
         Args:
             lead_id: Lead's phone number
+            batch_size: Maximum messages deleted per round-trip
 
         Returns:
             Number of messages deleted
         """
-        result = await self.collection.delete_many({"lead_id": lead_id})
+        deleted_count = 0
+
+        while True:
+            docs = await self.collection.find(
+                {"lead_id": lead_id}, {"_id": 1}
+            ).limit(batch_size).to_list(length=batch_size)
+
+            if not docs:
+                break
+
+            result = await self.collection.delete_many(
+                {"_id": {"$in": [doc["_id"] for doc in docs]}}
+            )
+            deleted_count += result.deleted_count
 
         logger.warning(
             f"Deleted all messages for lead {lead_id}",
-            extra={"lead_id": lead_id, "deleted_count": result.deleted_count}
+            extra={"lead_id": lead_id, "deleted_count": deleted_count}
         )
 
-        return result.deleted_count
+        return deleted_count
@@ -9,7 +9,8 @@ maximize conversion opportunities.
 import datetime as dt
 from enum import StrEnum
 from dataclasses import dataclass
-from typing import Optional
+from functools import lru_cache
+from typing import NamedTuple, Optional
 from src.config import get_settings
 from src.models.lead import Lead, SalesStage
 from src.utils.observability import logger
@@ -24,6 +25,31 @@ class FollowUpType(StrEnum):
     FINAL_ATTEMPT = "final_attempt"  # Last chance before going cold
 
 
+class _FollowUpConfig(NamedTuple):
+    """Immutable snapshot of follow-up settings."""
+    initial_delay_hours: int
+    max_attempts: int
+    escalation_hours: tuple[int, ...]
+
+
+@lru_cache(maxsize=1)
+def _followup_config() -> _FollowUpConfig:
+    """Read follow-up settings once per process."""
+    settings = get_settings()
+    return _FollowUpConfig(
+        initial_delay_hours=settings.followup_initial_delay_hours,
+        max_attempts=settings.followup_max_attempts,
+        escalation_hours=tuple(settings.followup_escalation_hours),
+    )
+
+
+# Stable ordinal per stage so stage-set checks are integer bit tests
+_STAGE_IX = {stage: i for i, stage in enumerate(SalesStage)}
+
+# Display label per stage, used when building follow-up reasons
+_STAGE_LABEL: dict[SalesStage, str] = {stage: str(stage.value) for stage in SalesStage}
+
+
 @dataclass
 class FollowUpAction:
     """Scheduled follow-up action for a lead."""
@@ -68,11 +94,14 @@ class FollowUpScheduler:
         SalesStage.LOST,
     }
 
+    # Bitmask of stages skipped by get_next_followup (terminal + ON_HOLD)
+    _SKIP_MASK = sum(1 << _STAGE_IX[s] for s in TERMINAL_STAGES | {SalesStage.ON_HOLD})
+
     def __init__(self):
-        settings = get_settings()
-        self._initial_delay_hours = settings.followup_initial_delay_hours
-        self._max_attempts = settings.followup_max_attempts
-        self._escalation_hours = settings.followup_escalation_hours
+        config = _followup_config()
+        self._initial_delay_hours = config.initial_delay_hours
+        self._max_attempts = config.max_attempts
+        self._escalation_hours = config.escalation_hours
 
     def get_next_followup(self, lead: Lead) -> Optional[FollowUpAction]:
         """
@@ -84,12 +113,8 @@ class FollowUpScheduler:
         Returns:
             FollowUpAction if follow-up needed, None otherwise
         """
-        # Skip terminal stages
-        if lead.current_stage in self.TERMINAL_STAGES:
-            return None
-
-        # Skip ON_HOLD (requires manual intervention)
-        if lead.current_stage == SalesStage.ON_HOLD:
+        # Skip terminal stages and ON_HOLD (requires manual intervention)
+        if self._SKIP_MASK & (1 << _STAGE_IX[lead.current_stage]):
             return None
 
         # Calculate inactivity
@@ -180,10 +205,11 @@ class FollowUpScheduler:
 
         Counts signals with 'followup' in confidence reasoning.
         """
-        followup_count = sum(
-            1 for s in lead.signals
-            if "followup" in (s.confidence.reasoning or "").lower()
-        )
+        followup_count = 0
+        for signal in lead.signals:
+            reasoning = signal.confidence.reasoning
+            if reasoning and "followup" in reasoning.lower():
+                followup_count += 1
         return followup_count + 1
 
     def _get_delay_for_attempt(self, attempt: int) -> int:
@@ -213,10 +239,10 @@ class FollowUpScheduler:
 
     def _generate_reason(self, lead: Lead, attempt: int, hours_inactive: float) -> str:
         """Generate human-readable reason for follow-up."""
-        days = int(hours_inactive / 24)
+        days = int(hours_inactive) // 24
         return (
             f"Lead inactive for {days} days. "
-            f"Stage: {lead.current_stage.value}. "
+            f"Stage: {_STAGE_LABEL[lead.current_stage]}. "
             f"Follow-up attempt {attempt}/{self._max_attempts}."
         )
 
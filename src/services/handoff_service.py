@@ -30,8 +30,13 @@ class HandoffNotifier(Protocol):
     Protocol for handoff notification channels.
 
     Implement this to add new notification channels (email, SMS, etc.)
+
+    Notifiers that discard the conversation summary can set
+    `needs_full_context = False` so HandoffService skips building it.
     """
 
+    needs_full_context: bool = True
+
     async def notify(self, request: HandoffRequest) -> bool:
         """
         Send handoff notification.
@@ -52,6 +57,8 @@ class SlackHandoffNotifier:
     Sends formatted messages to a Slack channel when handoff is triggered.
     """
 
+    needs_full_context = True
+
     def __init__(self, webhook_url: Optional[str] = None):
         settings = get_settings()
         self._webhook_url = webhook_url or settings.slack_handoff_webhook_url
@@ -168,6 +175,9 @@ class LogOnlyNotifier:
     Used when no external notification channel is configured.
     """
 
+    # Only logs metadata, so the conversation summary is never read
+    needs_full_context = False
+
     async def notify(self, request: HandoffRequest) -> bool:
         """Log handoff request."""
         logger.warning(
@@ -247,12 +257,18 @@ class HandoffService:
             extra={"lead_id": lead.lead_id, "reason": reason, "urgency": urgency}
         )
 
+        # Skip formatting history when the notifier won't use it
+        if getattr(self._notifier, "needs_full_context", True):
+            conversation_summary = lead.format_history(limit=5)
+        else:
+            conversation_summary = ""
+
         # Build handoff request
         request = HandoffRequest(
             lead_id=lead.lead_id,
             lead_name=lead.full_name,
             reason=reason,
-            conversation_summary=lead.format_history(limit=5),
+            conversation_summary=conversation_summary,
             urgency=urgency
         )
 
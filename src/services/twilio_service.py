@@ -2,11 +2,48 @@
 Twilio WhatsApp messaging service.
 Handles sending messages via Twilio Messages API.
 """
-from twilio.rest import Client
+import asyncio
+import httpx
 from loguru import logger
-from typing import Optional
+from typing import Optional, Set, Tuple
 
 from src.config import settings
+from src.utils.rate_limiter import get_twilio_bucket
+
+
+TWILIO_API_BASE_URL = "https://api.twilio.com/2010-04-01"
+
+# Matches the connection pool size so a batch never queues inside httpx
+MAX_CONCURRENT_SENDS = 100
+
+# (to_number, message, max_retries, result future)
+_QueuedSend = Tuple[str, str, int, asyncio.Future]
+
+
+class TwilioAPIError(httpx.HTTPStatusError):
+    """
+    Non-2xx response from the Twilio API.
+
+    Carries Twilio's error code and message from the response body, e.g.
+    21211 for an invalid 'To' number.
+    """
+
+    def __init__(self, response: httpx.Response):
+        try:
+            body = response.json()
+        except ValueError:
+            body = {}
+        if not isinstance(body, dict):
+            body = {}
+
+        self.status_code = response.status_code
+        self.code: Optional[int] = body.get("code")
+        self.twilio_message: str = body.get("message") or response.text
+        super().__init__(
+            f"Twilio API error {self.status_code} (code {self.code}): {self.twilio_message}",
+            request=response.request,
+            response=response
+        )
 
 
 class TwilioService:
@@ -17,21 +54,118 @@ class TwilioService:
     - Sending outbound messages to leads
     - Handling Twilio API errors
     - Rate limiting and retries
+
+    Messages are posted directly to the REST API through a pooled
+    httpx.AsyncClient, so sends never block the event loop and keep-alive
+    connections are reused across messages.
+
+    Sends are funnelled through a queue drained by a background sender,
+    which starts each message as soon as it is dequeued (up to the pool
+    size in flight). A single message costs the same round-trip; bursts
+    fan out across the pool instead of going one at a time, and a slow
+    send never holds up the messages queued behind it.
     """
 
     def __init__(self):
-        """Initialize Twilio client with credentials from settings."""
+        """Initialize pooled HTTP client with credentials from settings."""
         # Allow for testing without credentials
         if settings.twilio_account_sid and settings.twilio_auth_token:
-            self.client = Client(
-                settings.twilio_account_sid,
-                settings.twilio_auth_token
+            self.client: Optional[httpx.AsyncClient] = httpx.AsyncClient(
+                base_url=f"{TWILIO_API_BASE_URL}/Accounts/{settings.twilio_account_sid}",
+                auth=(settings.twilio_account_sid, settings.twilio_auth_token),
+                limits=httpx.Limits(
+                    max_connections=MAX_CONCURRENT_SENDS,
+                    max_keepalive_connections=50
+                ),
+                timeout=15.0
             )
         else:
             self.client = None
             logger.warning("Twilio credentials not configured - service will not be functional")
 
         self.from_number = settings.twilio_whatsapp_from
+        # Fields shared by every send are bound once
+        self._log = logger.bind(component="twilio", from_=self.from_number)
+
+        # Created lazily on the running event loop
+        self._queue: Optional[asyncio.Queue] = None
+        self._sender_task: Optional[asyncio.Task] = None
+        self._in_flight: Set[asyncio.Task] = set()
+
+    async def close(self) -> None:
+        """
+        Stop the sender and close pooled connections. Called on application shutdown.
+
+        Messages still queued or in flight are failed, so their callers
+        get an exception instead of waiting forever.
+        """
+        if self._sender_task is not None:
+            self._sender_task.cancel()
+            try:
+                await self._sender_task
+            except asyncio.CancelledError:
+                pass
+            self._sender_task = None
+
+            for task in self._in_flight:
+                task.cancel()
+            await asyncio.gather(*self._in_flight, return_exceptions=True)
+
+            while not self._queue.empty():
+                *_, future = self._queue.get_nowait()
+                self._fail(future)
+            self._queue = None
+
+        if self.client is not None:
+            await self.client.aclose()
+
+    def _ensure_sender(self) -> asyncio.Queue:
+        """Start the background sender on the current loop if it isn't running."""
+        task = self._sender_task
+        if task is None or task.done() or task.get_loop() is not asyncio.get_running_loop():
+            self._queue = asyncio.Queue()
+            self._sender_task = asyncio.create_task(self._sender_loop(self._queue))
+        return self._queue
+
+    async def _sender_loop(self, queue: asyncio.Queue) -> None:
+        """Start a send for each queued message, keeping at most MAX_CONCURRENT_SENDS in flight."""
+        slots = asyncio.Semaphore(MAX_CONCURRENT_SENDS)
+        while True:
+            # Take a slot before dequeuing so a cancelled sender leaves the
+            # message in the queue for close() to fail
+            await slots.acquire()
+            try:
+                item = await queue.get()
+            except asyncio.CancelledError:
+                slots.release()
+                raise
+
+            task = asyncio.create_task(self._dispatch(item, slots))
+            self._in_flight.add(task)
+            task.add_done_callback(self._in_flight.discard)
+
+    async def _dispatch(self, item: _QueuedSend, slots: asyncio.Semaphore) -> None:
+        """Send one queued message, resolve its future and free its slot."""
+        to_number, message, max_retries, future = item
+        try:
+            result = await self._send_with_retry(to_number, message, max_retries)
+        except asyncio.CancelledError:
+            self._fail(future)
+            raise
+        except Exception as e:
+            if not future.done():
+                future.set_exception(e)
+        else:
+            if not future.done():
+                future.set_result(result)
+        finally:
+            slots.release()
+
+    @staticmethod
+    def _fail(future: asyncio.Future) -> None:
+        """Fail a pending send because the service is shutting down."""
+        if not future.done():
+            future.set_exception(Exception("Twilio service closed before message was sent"))
 
     async def send_whatsapp_message(
         self,
@@ -60,44 +194,62 @@ class TwilioService:
         if not to_number.startswith("whatsapp:"):
             to_number = f"whatsapp:{to_number}"
 
-        logger.info(
-            f"📤 Sending WhatsApp message",
-            extra={
-                "to": to_number,
-                "message_length": len(message),
-                "from": self.from_number
-            }
-        )
+        queue = self._ensure_sender()
+        future = asyncio.get_running_loop().create_future()
+        queue.put_nowait((to_number, message, max_retries, future))
+        return await future
+
+    async def _send_with_retry(
+        self,
+        to_number: str,
+        message: str,
+        max_retries: int
+    ) -> Optional[str]:
+        """
+        Post a message to the Twilio API, retrying on failure.
+
+        Args:
+            to_number: Recipient with whatsapp: prefix
+            message: Message content to send
+            max_retries: Maximum number of retry attempts
+
+        Returns:
+            Message SID if successful, None if failed
+        """
+        # Bind the recipient once per message; positional args are only
+        # formatted if a sink accepts the record
+        log = self._log.bind(to=to_number)
+        log.info("📤 Sending WhatsApp message length={}", len(message))
 
         for attempt in range(max_retries):
             try:
-                # Send message via Twilio API
-                message_response = self.client.messages.create(
-                    body=message,
-                    from_=self.from_number,
-                    to=to_number
-                )
+                # Pace sends client-side so bursts don't trigger 429s
+                await get_twilio_bucket().acquire()
 
-                logger.info(
-                    f"✅ Message sent successfully",
-                    extra={
-                        "message_sid": message_response.sid,
-                        "to": to_number,
-                        "status": message_response.status
+                # Send message via Twilio Messages API
+                response = await self.client.post(
+                    "/Messages.json",
+                    data={
+                        "To": to_number,
+                        "From": self.from_number,
+                        "Body": message
                     }
                 )
+                if response.is_error:
+                    raise TwilioAPIError(response)
+                message_response = response.json()
+
+                log.info(
+                    "✅ Message sent successfully sid={} status={}",
+                    message_response["sid"], message_response.get("status")
+                )
 
-                return message_response.sid
+                return message_response["sid"]
 
             except Exception as e:
-                logger.error(
-                    f"❌ Failed to send message (attempt {attempt + 1}/{max_retries})",
-                    extra={
-                        "to": to_number,
-                        "error": str(e),
-                        "attempt": attempt + 1
-                    },
-                    exc_info=True
+                log.error(
+                    "❌ Failed to send message (attempt {}/{}): {}",
+                    attempt + 1, max_retries, e
                 )
 
                 # If last attempt, raise the exception
@@ -6,8 +6,9 @@ When failures exceed threshold, circuit opens and returns fallback responses
 immediately without hitting the API.
 """
 
-import asyncio
-from enum import Enum
+import threading
+import time
+from enum import IntEnum
 from datetime import datetime, timezone
 from dataclasses import dataclass
 from typing import Optional, Callable, TypeVar, Awaitable
@@ -17,24 +18,51 @@ from src.utils.observability import logger
 T = TypeVar("T")
 
 
-class CircuitState(str, Enum):
-    """Circuit breaker states."""
-    CLOSED = "closed"      # Normal operation, requests flow through
-    OPEN = "open"          # Failing, reject requests immediately
-    HALF_OPEN = "half_open"  # Testing if service recovered
+class CircuitState(IntEnum):
+    """Circuit breaker states. Ints keep hot-path comparisons cheap."""
+    CLOSED = 0      # Normal operation, requests flow through
+    OPEN = 1        # Failing, reject requests immediately
+    HALF_OPEN = 2   # Testing if service recovered
+
+    @property
+    def label(self) -> str:
+        """Lowercase state name for logs and status output."""
+        return self.name.lower()
+
+
+def _monotonic_to_wall(mono: Optional[float]) -> Optional[datetime]:
+    """Convert a time.monotonic() reading to an approximate UTC datetime."""
+    if mono is None:
+        return None
+    return datetime.fromtimestamp(time.time() - (time.monotonic() - mono), timezone.utc)
 
 
 @dataclass
 class CircuitStats:
-    """Circuit breaker statistics."""
+    """
+    Circuit breaker statistics.
+
+    Call timestamps are kept as time.monotonic() readings on the hot path
+    and converted to wall-clock datetimes only when read.
+    """
     consecutive_failures: int = 0
     total_failures: int = 0
     total_successes: int = 0
-    last_failure_time: Optional[datetime] = None
-    last_success_time: Optional[datetime] = None
-    opened_at: Optional[datetime] = None
+    last_failure_mono: Optional[float] = None
+    last_success_mono: Optional[float] = None
+    opened_at: Optional[datetime] = None  # Wall-clock, for display only
     state_changes: int = 0
 
+    @property
+    def last_failure_time(self) -> Optional[datetime]:
+        """Wall-clock time of the last failure."""
+        return _monotonic_to_wall(self.last_failure_mono)
+
+    @property
+    def last_success_time(self) -> Optional[datetime]:
+        """Wall-clock time of the last success."""
+        return _monotonic_to_wall(self.last_success_mono)
+
 
 class CircuitOpenError(Exception):
     """Raised when circuit is open and request is rejected."""
@@ -88,7 +116,10 @@ class CircuitBreaker:
         self._state = CircuitState.CLOSED
         self._stats = CircuitStats()
         self._half_open_calls = 0
-        self._lock = asyncio.Lock()
+        self._opened_at_mono: Optional[float] = None
+        # Guards state + counters. Only ever held for synchronous bookkeeping,
+        # never across an await, so concurrent callers don't queue behind it.
+        self._lock = threading.Lock()
 
     @property
     def state(self) -> CircuitState:
@@ -118,26 +149,31 @@ class CircuitBreaker:
         Raises:
             CircuitOpenError: When circuit is open (after returning fallback)
         """
-        async with self._lock:
-            await self._check_state_transition()
-
-            if self._state == CircuitState.OPEN:
+        # Fast path: CLOSED has no timed transition and no call budget, so
+        # healthy calls skip the lock entirely
+        if self._state is CircuitState.CLOSED:
+            admitted = True
+        else:
+            # Decide under the lock, but build fallbacks outside it
+            with self._lock:
+                self._check_state_transition()
+                state = self._state
+                admitted = self._reserve_call_slot()
+
+        if not admitted:
+            if state == CircuitState.OPEN:
                 logger.warning(f"Circuit '{self.name}' is OPEN, using fallback")
-                return fallback()
-
-            if self._state == CircuitState.HALF_OPEN:
-                if self._half_open_calls >= self._half_open_max_calls:
-                    logger.warning(f"Circuit '{self.name}' HALF_OPEN limit reached, using fallback")
-                    return fallback()
-                self._half_open_calls += 1
+            else:
+                logger.warning(f"Circuit '{self.name}' HALF_OPEN limit reached, using fallback")
+            return fallback()
 
         # Execute outside lock to allow concurrency
         try:
             result = await func()
-            await self._record_success()
+            self._record_success()
             return result
         except Exception as e:
-            await self._record_failure(e)
+            self._record_failure(e)
             raise
 
     async def call_with_fallback(
@@ -163,47 +199,88 @@ class CircuitBreaker:
             logger.error(f"Circuit '{self.name}' call failed, using fallback: {e}")
             return fallback()
 
-    async def _check_state_transition(self) -> None:
-        """Check if state should transition based on time."""
+    def _check_state_transition(self) -> None:
+        """Check if state should transition based on time. Caller holds the lock."""
         if self._state != CircuitState.OPEN:
             return
 
-        if not self._stats.opened_at:
+        if self._opened_at_mono is None:
             return
 
-        elapsed = (datetime.now(timezone.utc) - self._stats.opened_at).total_seconds()
-        if elapsed >= self._recovery_timeout:
-            self._transition_to(CircuitState.HALF_OPEN)
-            self._half_open_calls = 0
+        if time.monotonic() - self._opened_at_mono >= self._recovery_timeout:
+            if self._transition_if(CircuitState.OPEN, CircuitState.HALF_OPEN):
+                self._half_open_calls = 0
 
-    async def _record_success(self) -> None:
+    def _reserve_call_slot(self) -> bool:
+        """
+        Decide whether a call may go through. Caller holds the lock.
+
+        Returns:
+            False when OPEN or the HALF_OPEN probe budget is used up
+        """
+        if self._state == CircuitState.OPEN:
+            return False
+
+        if self._state == CircuitState.HALF_OPEN:
+            if self._half_open_calls >= self._half_open_max_calls:
+                return False
+            self._half_open_calls += 1
+
+        return True
+
+    def _record_success(self) -> None:
         """Record successful call."""
-        async with self._lock:
+        # Fast path: nothing to reset or transition while healthy. These
+        # counters are monitoring-only, so an unlocked increment is fine.
+        if self._state is CircuitState.CLOSED and not self._stats.consecutive_failures:
+            self._stats.total_successes += 1
+            self._stats.last_success_mono = time.monotonic()
+            return
+
+        with self._lock:
             self._stats.consecutive_failures = 0
             self._stats.total_successes += 1
-            self._stats.last_success_time = datetime.now(timezone.utc)
+            self._stats.last_success_mono = time.monotonic()
+            recovered = self._transition_if(CircuitState.HALF_OPEN, CircuitState.CLOSED)
 
-            if self._state == CircuitState.HALF_OPEN:
-                logger.info(f"Circuit '{self.name}' recovered, closing")
-                self._transition_to(CircuitState.CLOSED)
+        if recovered:
+            logger.info(f"Circuit '{self.name}' recovered, closing")
 
-    async def _record_failure(self, error: Exception) -> None:
+    def _record_failure(self, error: Exception) -> None:
         """Record failed call."""
-        async with self._lock:
+        with self._lock:
             self._stats.consecutive_failures += 1
             self._stats.total_failures += 1
-            self._stats.last_failure_time = datetime.now(timezone.utc)
-
-            logger.warning(
-                f"Circuit '{self.name}' failure {self._stats.consecutive_failures}/{self._failure_threshold}: {error}"
+            self._stats.last_failure_mono = time.monotonic()
+            failures = self._stats.consecutive_failures
+
+            reopened = self._transition_if(CircuitState.HALF_OPEN, CircuitState.OPEN)
+            opened = (
+                not reopened
+                and failures >= self._failure_threshold
+                and self._transition_if(CircuitState.CLOSED, CircuitState.OPEN)
             )
 
-            if self._state == CircuitState.HALF_OPEN:
-                logger.warning(f"Circuit '{self.name}' probe failed, reopening")
-                self._transition_to(CircuitState.OPEN)
-            elif self._stats.consecutive_failures >= self._failure_threshold:
-                logger.error(f"Circuit '{self.name}' threshold reached, opening")
-                self._transition_to(CircuitState.OPEN)
+        logger.warning(
+            "Circuit '{}' failure {}/{}: {}",
+            self.name, failures, self._failure_threshold, error
+        )
+        if reopened:
+            logger.warning(f"Circuit '{self.name}' probe failed, reopening")
+        elif opened:
+            logger.error(f"Circuit '{self.name}' threshold reached, opening")
+
+    def _transition_if(self, expected: CircuitState, new_state: CircuitState) -> bool:
+        """
+        Compare-and-set state transition. Caller holds the lock.
+
+        Returns:
+            True if the circuit was in `expected` and moved to `new_state`
+        """
+        if self._state != expected:
+            return False
+        self._transition_to(new_state)
+        return True
 
     def _transition_to(self, new_state: CircuitState) -> None:
         """Transition to new state."""
@@ -212,34 +289,37 @@ class CircuitBreaker:
         self._stats.state_changes += 1
 
         if new_state == CircuitState.OPEN:
+            self._opened_at_mono = time.monotonic()
             self._stats.opened_at = datetime.now(timezone.utc)
 
-        logger.info(f"Circuit '{self.name}' state: {old_state.value} -> {new_state.value}")
+        logger.info(f"Circuit '{self.name}' state: {old_state.label} -> {new_state.label}")
 
     async def reset(self) -> None:
         """Manually reset circuit to closed state."""
-        async with self._lock:
+        with self._lock:
             self._transition_to(CircuitState.CLOSED)
             self._stats.consecutive_failures = 0
             self._half_open_calls = 0
 
     async def force_open(self) -> None:
         """Manually open circuit (for testing/maintenance)."""
-        async with self._lock:
+        with self._lock:
             self._transition_to(CircuitState.OPEN)
 
     def get_status(self) -> dict:
         """Get circuit status for monitoring."""
+        last_failure = self._stats.last_failure_time
+        last_success = self._stats.last_success_time
         return {
             "name": self.name,
-            "state": self._state.value,
+            "state": self._state.label,
             "consecutive_failures": self._stats.consecutive_failures,
             "total_failures": self._stats.total_failures,
             "total_successes": self._stats.total_successes,
             "failure_threshold": self._failure_threshold,
             "recovery_timeout_seconds": self._recovery_timeout,
-            "last_failure": self._stats.last_failure_time.isoformat() if self._stats.last_failure_time else None,
-            "last_success": self._stats.last_success_time.isoformat() if self._stats.last_success_time else None,
+            "last_failure": last_failure.isoformat() if last_failure else None,
+            "last_success": last_success.isoformat() if last_success else None,
             "opened_at": self._stats.opened_at.isoformat() if self._stats.opened_at else None,
         }
 
@@ -2,19 +2,34 @@
 Cost Tracking & Budget Management
 Monitors LLM token usage and prevents runaway costs.
 """
-import datetime as dt
-from dataclasses import dataclass, field
-from typing import Dict
+import time
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import DefaultDict, Dict
 from loguru import logger
 from src.config import get_settings
 
 
+# Costs are accumulated as integers in units of 1e-12 USD (micro-USD per
+# 1M tokens), which represents every published per-token price exactly.
+COST_UNITS_PER_USD = 10**12
+
+# Sliding window sizes in one-minute buckets
+_HOUR_MINUTES = 60
+_DAY_MINUTES = 24 * 60
+
+
 @dataclass
 class ModelPricing:
     """Pricing per 1M tokens (USD) as of Late 2025."""
     input_cost: float
     output_cost: float
 
+    def __post_init__(self):
+        # Integer micro-USD per 1M tokens; tokens * micros gives cost units
+        self.input_micros = round(self.input_cost * 1_000_000)
+        self.output_micros = round(self.output_cost * 1_000_000)
+
 
 # Official OpenAI Pricing
 PRICING: Dict[str, ModelPricing] = {
@@ -28,10 +43,14 @@ PRICING: Dict[str, ModelPricing] = {
 @dataclass
 class UsageWindow:
     """Tracks usage over a time window."""
-    total_cost: float = 0.0
+    cost_units: int = 0  # Exact cost in 1e-12 USD
     total_tokens: int = 0
     call_count: int = 0
-    window_start: dt.datetime = field(default_factory=lambda: dt.datetime.now(dt.UTC))
+
+    @property
+    def total_cost(self) -> float:
+        """Window cost in USD."""
+        return self.cost_units / COST_UNITS_PER_USD
 
 
 class CostTracker:
@@ -40,26 +59,61 @@ class CostTracker:
 
     Tracks usage at multiple time granularities (hourly, daily)
     and raises alerts when approaching limits.
+
+    The hourly and daily windows slide: usage is bucketed per minute in a
+    24h ring, and buckets that age out of a window are subtracted from its
+    running total. This avoids the boundary burst of fixed windows, where
+    nearly twice the limit could be spent around a reset.
     """
 
     def __init__(self):
         self.settings = get_settings()
-        self.hourly_usage = UsageWindow()
-        self.daily_usage = UsageWindow()
+        # Snapshot limits once; they are read on every completion
+        self._hourly_limit = self.settings.hourly_cost_limit_usd
+        self._daily_limit = self.settings.daily_cost_limit_usd
+        self._enforce_budget = self.settings.environment != "test"
         self.lifetime_usage = UsageWindow()
+        self.reset_windows()
 
         # Track per-agent costs for debugging
-        self.per_agent_costs: Dict[str, float] = {}
+        self.per_agent_costs: DefaultDict[str, float] = defaultdict(float)
 
-    def _reset_window_if_needed(self, window: UsageWindow, hours: int) -> UsageWindow:
-        """Reset usage window if it's expired."""
-        now = dt.datetime.now(dt.UTC)
-        elapsed = (now - window.window_start).total_seconds() / 3600
+    def reset_windows(self) -> None:
+        """Clear the hourly and daily sliding windows."""
+        self.hourly_usage = UsageWindow()
+        self.daily_usage = UsageWindow()
+        # Per-minute (cost_units, tokens, calls) buckets, indexed by minute % size
+        self._bucket_cost = [0] * _DAY_MINUTES
+        self._bucket_tokens = [0] * _DAY_MINUTES
+        self._bucket_calls = [0] * _DAY_MINUTES
+        self._current_minute = int(time.monotonic() // 60)
+
+    def _expire_bucket(self, window: UsageWindow, ix: int) -> None:
+        """Subtract one minute bucket from a window's running totals."""
+        window.cost_units -= self._bucket_cost[ix]
+        window.total_tokens -= self._bucket_tokens[ix]
+        window.call_count -= self._bucket_calls[ix]
+
+    def _advance(self, minute: int) -> None:
+        """Slide both windows forward to `minute`, expiring aged-out buckets."""
+        elapsed = minute - self._current_minute
+        if elapsed <= 0:
+            return
+        if elapsed >= _DAY_MINUTES:
+            logger.debug("Usage windows idle for 24h, resetting")
+            self.reset_windows()
+            return
 
-        if elapsed >= hours:
-            logger.debug(f"Resetting {hours}h usage window")
-            return UsageWindow()
-        return window
+        for m in range(self._current_minute + 1, minute + 1):
+            # Bucket m-60 leaves the hourly window
+            self._expire_bucket(self.hourly_usage, (m - _HOUR_MINUTES) % _DAY_MINUTES)
+            # Bucket m-1440 shares m's slot: it leaves the daily window and is reused
+            ix = m % _DAY_MINUTES
+            self._expire_bucket(self.daily_usage, ix)
+            self._bucket_cost[ix] = 0
+            self._bucket_tokens[ix] = 0
+            self._bucket_calls[ix] = 0
+        self._current_minute = minute
 
     def track_completion(
         self,
@@ -83,9 +137,8 @@ class CostTracker:
         Raises:
             RuntimeError: If hourly or daily budget exceeded
         """
-        # Reset windows if needed
-        self.hourly_usage = self._reset_window_if_needed(self.hourly_usage, 1)
-        self.daily_usage = self._reset_window_if_needed(self.daily_usage, 24)
+        # Slide windows forward to the current minute
+        self._advance(int(time.monotonic() // 60))
 
         # Extract model name (handle "openai:gpt-4o" format)
         model_name = model.split(":")[-1] if ":" in model else model
@@ -96,22 +149,24 @@ class CostTracker:
             logger.warning(f"⚠️ Unknown model pricing: {model_name}, assuming gpt-4o rates")
             pricing = PRICING["gpt-4o"]
 
-        # Calculate cost
-        cost = (
-            (input_tokens / 1_000_000) * pricing.input_cost +
-            (output_tokens / 1_000_000) * pricing.output_cost
-        )
+        # Calculate cost in exact integer units
+        cost_units = input_tokens * pricing.input_micros + output_tokens * pricing.output_micros
+        cost = cost_units / COST_UNITS_PER_USD
         total_tokens = input_tokens + output_tokens
 
-        # Update all windows
-        for usage_window in [self.hourly_usage, self.daily_usage, self.lifetime_usage]:
-            usage_window.total_cost += cost
+        # Update all windows and the current minute bucket
+        for usage_window in (self.hourly_usage, self.daily_usage, self.lifetime_usage):
+            usage_window.cost_units += cost_units
             usage_window.total_tokens += total_tokens
             usage_window.call_count += 1
+        ix = self._current_minute % _DAY_MINUTES
+        self._bucket_cost[ix] += cost_units
+        self._bucket_tokens[ix] += total_tokens
+        self._bucket_calls[ix] += 1
 
         # Per-agent tracking
         if agent_name:
-            self.per_agent_costs[agent_name] = self.per_agent_costs.get(agent_name, 0.0) + cost
+            self.per_agent_costs[agent_name] += cost
 
         # Budget enforcement
         self._check_budget_limits()
@@ -126,51 +181,53 @@ class CostTracker:
 
     def _check_budget_limits(self):
         """Check if we're approaching or exceeding budget limits."""
-        if self.settings.environment == "test":
+        if not self._enforce_budget:
             return
         # Hourly check
-        
-        hourly_pct = (self.hourly_usage.total_cost / self.settings.hourly_cost_limit_usd) * 100
+        hourly_limit = self._hourly_limit
+        hourly_pct = (self.hourly_usage.total_cost / hourly_limit) * 100
         if hourly_pct >= 100:
             raise RuntimeError(
                 f"🚨 HOURLY BUDGET EXCEEDED: ${self.hourly_usage.total_cost:.2f} "
-                f"/ ${self.settings.hourly_cost_limit_usd:.2f}"
+                f"/ ${hourly_limit:.2f}"
             )
         elif hourly_pct >= 80:
             logger.warning(
                 f"⚠️ Hourly budget at {hourly_pct:.0f}%: "
-                f"${self.hourly_usage.total_cost:.2f} / ${self.settings.hourly_cost_limit_usd:.2f}"
+                f"${self.hourly_usage.total_cost:.2f} / ${hourly_limit:.2f}"
             )
 
         # Daily check
-        daily_pct = (self.daily_usage.total_cost / self.settings.daily_cost_limit_usd) * 100
+        daily_limit = self._daily_limit
+        daily_pct = (self.daily_usage.total_cost / daily_limit) * 100
         if daily_pct >= 100:
             raise RuntimeError(
                 f"🚨 DAILY BUDGET EXCEEDED: ${self.daily_usage.total_cost:.2f} "
-                f"/ ${self.settings.daily_cost_limit_usd:.2f}"
+                f"/ ${daily_limit:.2f}"
             )
         elif daily_pct >= 80:
             logger.warning(
                 f"⚠️ Daily budget at {daily_pct:.0f}%: "
-                f"${self.daily_usage.total_cost:.2f} / ${self.settings.daily_cost_limit_usd:.2f}"
+                f"${self.daily_usage.total_cost:.2f} / ${daily_limit:.2f}"
             )
 
     def get_summary(self) -> Dict[str, any]:
         """Get a summary of current usage statistics."""
+        self._advance(int(time.monotonic() // 60))
         return {
             "hourly": {
                 "cost_usd": round(self.hourly_usage.total_cost, 4),
                 "tokens": self.hourly_usage.total_tokens,
                 "calls": self.hourly_usage.call_count,
-                "limit_usd": self.settings.hourly_cost_limit_usd,
-                "pct_used": round((self.hourly_usage.total_cost / self.settings.hourly_cost_limit_usd) * 100, 1)
+                "limit_usd": self._hourly_limit,
+                "pct_used": round((self.hourly_usage.total_cost / self._hourly_limit) * 100, 1)
             },
             "daily": {
                 "cost_usd": round(self.daily_usage.total_cost, 4),
                 "tokens": self.daily_usage.total_tokens,
                 "calls": self.daily_usage.call_count,
-                "limit_usd": self.settings.daily_cost_limit_usd,
-                "pct_used": round((self.daily_usage.total_cost / self.settings.daily_cost_limit_usd) * 100, 1)
+                "limit_usd": self._daily_limit,
+                "pct_used": round((self.daily_usage.total_cost / self._daily_limit) * 100, 1)
             },
             "lifetime": {
                 "cost_usd": round(self.lifetime_usage.total_cost, 2),
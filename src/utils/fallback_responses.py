@@ -22,6 +22,67 @@ from src.models.executor_response import (
 from src.models.intelligence import Sentiment, BANTDimension
 
 
+# Fallbacks are static, so they are built once at import time and shared.
+# Callers only read them; treat the returned instances as read-only.
+
+_FALLBACK_CLASSIFICATION = ClassifierResponse(
+    intent=Intent.UNCLEAR,
+    intent_confidence=0.0,
+    topic="Unable to classify - service degraded",
+    topic_confidence=0.0,
+    urgency=UrgencyLevel.UNCLEAR,
+    urgency_confidence=0.0,
+    language="spanish",  # Default to Spanish for Mexico market
+    sentiment=Sentiment.NEUTRAL,
+    engagement_level="medium",
+    requires_human_escalation=True,  # Flag for human review
+    reasoning="Classification unavailable due to service degradation. Flagged for human review.",
+    new_signals=[],
+)
+
+_FALLBACK_STRATEGY = DirectorResponse(
+    action=StrategicAction.HELP,
+    strategic_reasoning="Strategy engine unavailable. Defaulting to helpful response.",
+    message_strategy=MessageStrategy(
+        tone="warm and helpful",
+        language="spanish",
+        empathy_points=["Acknowledge their message", "Show we're here to help"],
+        key_points=["We received their message", "We'll follow up shortly"],
+        conversational_goal="Maintain rapport while service recovers",
+    ),
+    focus_dimension=BANTDimension.NEED,
+    suggested_stage_transition=None,
+    scheduling_instruction=None,
+)
+
+_FALLBACK_MESSAGE_SPANISH = ExecutorResponse(
+    message=OutboundMessage(
+        content="Gracias por tu mensaje. En este momento estamos experimentando "
+                "algunas dificultades tecnicas. Te respondere en breve.",
+        persona_reasoning="Service degradation fallback - maintains warmth while buying time",
+    ),
+    agreement_level=0.5,
+    feedback_for_director="Executor unavailable - used fallback response",
+    execution_summary="Fallback: Technical difficulties message (Spanish)",
+)
+
+_FALLBACK_MESSAGE_ENGLISH = ExecutorResponse(
+    message=OutboundMessage(
+        content="Thank you for your message. We're experiencing some technical "
+                "difficulties at the moment. I'll get back to you shortly.",
+        persona_reasoning="Service degradation fallback - maintains warmth while buying time",
+    ),
+    agreement_level=0.5,
+    feedback_for_director="Executor unavailable - used fallback response",
+    execution_summary="Fallback: Technical difficulties message (English)",
+)
+
+_FALLBACK_MESSAGE_BY_LANGUAGE = {
+    "spanish": _FALLBACK_MESSAGE_SPANISH,
+    "english": _FALLBACK_MESSAGE_ENGLISH,
+}
+
+
 def get_fallback_classification() -> ClassifierResponse:
     """
     Safe classification when Classifier agent fails.
@@ -29,20 +90,7 @@ def get_fallback_classification() -> ClassifierResponse:
     Returns unclear/neutral classification that won't
     trigger aggressive sales actions.
     """
-    return ClassifierResponse(
-        intent=Intent.UNCLEAR,
-        intent_confidence=0.0,
-        topic="Unable to classify - service degraded",
-        topic_confidence=0.0,
-        urgency=UrgencyLevel.UNCLEAR,
-        urgency_confidence=0.0,
-        language="spanish",  # Default to Spanish for Mexico market
-        sentiment=Sentiment.NEUTRAL,
-        engagement_level="medium",
-        requires_human_escalation=True,  # Flag for human review
-        reasoning="Classification unavailable due to service degradation. Flagged for human review.",
-        new_signals=[],
-    )
+    return _FALLBACK_CLASSIFICATION
 
 
 def get_fallback_strategy() -> DirectorResponse:
@@ -52,20 +100,7 @@ def get_fallback_strategy() -> DirectorResponse:
     Returns a helpful, non-pushy nurture action
     that keeps the conversation warm.
     """
-    return DirectorResponse(
-        action=StrategicAction.HELP,
-        strategic_reasoning="Strategy engine unavailable. Defaulting to helpful response.",
-        message_strategy=MessageStrategy(
-            tone="warm and helpful",
-            language="spanish",
-            empathy_points=["Acknowledge their message", "Show we're here to help"],
-            key_points=["We received their message", "We'll follow up shortly"],
-            conversational_goal="Maintain rapport while service recovers",
-        ),
-        focus_dimension=BANTDimension.NEED,
-        suggested_stage_transition=None,
-        scheduling_instruction=None,
-    )
+    return _FALLBACK_STRATEGY
 
 
 def get_fallback_message_spanish() -> ExecutorResponse:
@@ -74,16 +109,7 @@ def get_fallback_message_spanish() -> ExecutorResponse:
 
     Polite acknowledgment that doesn't promise anything specific.
     """
-    return ExecutorResponse(
-        message=OutboundMessage(
-            content="Gracias por tu mensaje. En este momento estamos experimentando "
-                    "algunas dificultades tecnicas. Te respondere en breve.",
-            persona_reasoning="Service degradation fallback - maintains warmth while buying time",
-        ),
-        agreement_level=0.5,
-        feedback_for_director="Executor unavailable - used fallback response",
-        execution_summary="Fallback: Technical difficulties message (Spanish)",
-    )
+    return _FALLBACK_MESSAGE_SPANISH
 
 
 def get_fallback_message_english() -> ExecutorResponse:
@@ -92,16 +118,7 @@ def get_fallback_message_english() -> ExecutorResponse:
 
     Polite acknowledgment that doesn't promise anything specific.
     """
-    return ExecutorResponse(
-        message=OutboundMessage(
-            content="Thank you for your message. We're experiencing some technical "
-                    "difficulties at the moment. I'll get back to you shortly.",
-            persona_reasoning="Service degradation fallback - maintains warmth while buying time",
-        ),
-        agreement_level=0.5,
-        feedback_for_director="Executor unavailable - used fallback response",
-        execution_summary="Fallback: Technical difficulties message (English)",
-    )
+    return _FALLBACK_MESSAGE_ENGLISH
 
 
 def get_fallback_message(language: str = "spanish") -> ExecutorResponse:
@@ -114,6 +131,4 @@ def get_fallback_message(language: str = "spanish") -> ExecutorResponse:
     Returns:
         ExecutorResponse with appropriate language
     """
-    if language == "english":
-        return get_fallback_message_english()
-    return get_fallback_message_spanish()
+    return _FALLBACK_MESSAGE_BY_LANGUAGE.get(language, _FALLBACK_MESSAGE_SPANISH)
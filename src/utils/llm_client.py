@@ -4,16 +4,130 @@ Provides resilient LLM execution with exponential backoff and circuit breaker.
 """
 import asyncio
 import random
-from typing import TypeVar, Any
+import re
+from functools import lru_cache
+from typing import TypeVar, Any, Optional, Tuple
+import httpx
+import openai
 from loguru import logger
 from pydantic_ai import Agent
 from src.config import get_settings
 from src.utils.circuit_breaker import get_openai_circuit, CircuitState
+from src.utils.rate_limiter import get_openai_bucket
+from src.utils.metrics import metrics
 
 # Type variable for generic agent output
 T = TypeVar('T')
 
 
+# Caps concurrent agent runs; created lazily on first use
+_llm_semaphore: Optional[asyncio.Semaphore] = None
+
+# Dedicated RNG for retry jitter so backoff doesn't share the module-level
+# random state with the rest of the process
+_jitter_rng = random.Random()
+
+# Provider exception types that mean the request timed out
+_TIMEOUT_ERRORS = (TimeoutError, httpx.TimeoutException, openai.APITimeoutError)
+
+# HTTP status -> error category for provider errors that carry a status code
+_STATUS_CATEGORIES = {
+    400: "invalid_request",
+    401: "auth",
+    403: "auth",
+    408: "timeout",
+    422: "invalid_request",
+    429: "rate_limit",
+    500: "server_error",
+    502: "server_error",
+    503: "server_error",
+    504: "server_error",
+}
+
+# Fallback for errors from unknown libraries: every keyword the categorizer
+# cares about, matched in a single case-insensitive pass over the message.
+_ERROR_KEYWORDS_RE = re.compile(
+    r"(?P<rate>rate)|(?P<limit>limit)|(?P<timeout>timeout|timed out)"
+    r"|(?P<server>50[0234])|(?P<auth>authentication|api key|401)"
+    r"|(?P<invalid>invalid)|(?P<request>request)",
+    re.IGNORECASE,
+)
+
+
+def _status_code(error: Exception) -> Optional[int]:
+    """
+    HTTP status carried by a provider error, if any.
+
+    Covers pydantic-ai's ModelHTTPError and openai's APIStatusError
+    (status_code) as well as httpx.HTTPStatusError (response.status_code).
+    """
+    status = getattr(error, "status_code", None)
+    if status is None and isinstance(error, httpx.HTTPStatusError):
+        status = error.response.status_code
+    return status if isinstance(status, int) else None
+
+
+def _categorize_error(error: Exception) -> str:
+    """
+    Bucket an agent exception by type, falling back to its message.
+
+    Returns:
+        One of "rate_limit", "timeout", "server_error", "auth",
+        "invalid_request" or "unknown"
+    """
+    if isinstance(error, _TIMEOUT_ERRORS):
+        return "timeout"
+
+    status = _status_code(error)
+    if status is not None and status in _STATUS_CATEGORIES:
+        return _STATUS_CATEGORIES[status]
+
+    found = {m.lastgroup for m in _ERROR_KEYWORDS_RE.finditer(str(error))}
+
+    if "rate" in found and "limit" in found:
+        return "rate_limit"
+    if "timeout" in found:
+        return "timeout"
+    if "server" in found:
+        return "server_error"
+    if "auth" in found:
+        return "auth"
+    if "invalid" in found and "request" in found:
+        return "invalid_request"
+    return "unknown"
+
+
+# Error categories that abort without retrying, with the error prefix
+_CRITICAL_ERRORS = {
+    "auth": "Authentication failed",
+    "invalid_request": "Invalid request",
+}
+
+# Known recoverable error categories and their retry log message
+_RETRYABLE_ERRORS = {
+    "rate_limit": "⏱️ Rate limit hit",
+    "timeout": "⏱️ Timeout",
+    "server_error": "🔧 Server error",
+}
+
+
+@lru_cache(maxsize=8)
+def _backoff_schedule(min_wait: float, max_wait: float, attempts: int) -> Tuple[float, ...]:
+    """Base wait before each retry: exponential from min_wait, capped at max_wait."""
+    return tuple(min(min_wait * (1 << i), max_wait) for i in range(attempts))
+
+
+def _publish_backoff_schedule(schedule: Tuple[float, ...]) -> None:
+    """
+    Publish the backoff schedule as a gauge so it is visible to tooling.
+
+    Set on every run rather than inside the cached computation, so the
+    gauge is repopulated after the metrics registry is reset.
+    """
+    for attempt, wait in enumerate(schedule, start=1):
+        metrics.retry_backoff_seconds.set(wait, attempt=str(attempt))
+
+
 class LLMError(Exception):
     """Recoverable LLM errors that should trigger retries."""
     pass
@@ -55,60 +169,39 @@ async def run_agent_with_retry(
     max_attempts = max_retries or settings.max_retries
     min_wait = settings.retry_min_wait_seconds
     max_wait = settings.retry_max_wait_seconds
+    backoff_schedule = _backoff_schedule(min_wait, max_wait, max_attempts)
+    _publish_backoff_schedule(backoff_schedule)
 
     last_error = None
 
     for attempt in range(1, max_attempts + 1):
         try:
             logger.debug(f"LLM attempt {attempt}/{max_attempts}")
-
-            # Execute the agent
-            if deps is not None:
-                result = await agent.run(prompt, deps=deps)
-            else:
-                result = await agent.run(prompt)
-
-            return result.output
+            return await _run_once(agent, prompt, deps)
 
         except Exception as e:
             last_error = e
-            error_msg = str(e).lower()
-
-            # Categorize the error
-            if "rate" in error_msg and "limit" in error_msg:
-                logger.warning(f"⏱️ Rate limit hit (attempt {attempt}/{max_attempts})")
-                error_type = "rate_limit"
-
-            elif "timeout" in error_msg or "timed out" in error_msg:
-                logger.warning(f"⏱️ Timeout (attempt {attempt}/{max_attempts})")
-                error_type = "timeout"
-
-            elif any(code in error_msg for code in ["500", "502", "503", "504"]):
-                logger.warning(f"🔧 Server error (attempt {attempt}/{max_attempts})")
-                error_type = "server_error"
+            error_type = _categorize_error(e)
 
-            elif "authentication" in error_msg or "api key" in error_msg or "401" in error_msg:
-                logger.error(f"🚨 Authentication failure: {e}")
-                raise LLMCriticalError(f"Authentication failed: {e}") from e
-
-            elif "invalid" in error_msg and "request" in error_msg:
-                logger.error(f"🚨 Invalid request: {e}")
-                raise LLMCriticalError(f"Invalid request: {e}") from e
+            # Non-recoverable: fail immediately
+            if error_type in _CRITICAL_ERRORS:
+                reason = _CRITICAL_ERRORS[error_type]
+                logger.error(f"🚨 {reason}: {e}")
+                raise LLMCriticalError(f"{reason}: {e}") from e
 
+            if error_type in _RETRYABLE_ERRORS:
+                logger.warning(f"{_RETRYABLE_ERRORS[error_type]} (attempt {attempt}/{max_attempts})")
             else:
                 # Unknown error - treat as recoverable but log it
                 logger.warning(f"⚠️ Unknown error (attempt {attempt}/{max_attempts}): {e}")
-                error_type = "unknown"
 
             # If this was the last attempt, raise
             if attempt == max_attempts:
                 logger.error(f"❌ Max retries ({max_attempts}) exhausted. Last error: {e}")
                 raise LLMError(f"Failed after {max_attempts} attempts: {e}") from e
 
-            # Calculate exponential backoff with jitter
-            wait_time = min(min_wait * (2 ** (attempt - 1)), max_wait)
-            # Add 20% jitter to prevent thundering herd
-            wait_time = wait_time * (0.8 + 0.4 * random.random())
+            # Exponential backoff with 20% jitter to prevent thundering herd
+            wait_time = backoff_schedule[attempt - 1] * _jitter_rng.uniform(0.8, 1.2)
 
             logger.info(f"⏳ Retrying in {wait_time:.1f}s... (error: {error_type})")
             await asyncio.sleep(wait_time)
@@ -117,6 +210,33 @@ async def run_agent_with_retry(
     raise LLMError(f"Unexpected retry loop exit. Last error: {last_error}")
 
 
+def _get_llm_semaphore() -> asyncio.Semaphore:
+    """Get or create the semaphore capping concurrent agent runs."""
+    global _llm_semaphore
+    if _llm_semaphore is None:
+        _llm_semaphore = asyncio.Semaphore(get_settings().max_concurrent_llm_calls)
+    return _llm_semaphore
+
+
+async def _run_once(agent: Agent, prompt: str, deps: Any) -> T:
+    """Run a single agent attempt, paced by the token bucket and concurrency cap."""
+    # Bound in-flight calls so spikes queue here instead of in the HTTP pool
+    async with _get_llm_semaphore():
+        # Take the token once a slot is held, so the pace applies to when
+        # the request actually goes out and bursts don't trigger 429s
+        await get_openai_bucket().acquire()
+
+        metrics.llm_inflight.inc()
+        try:
+            if deps is not None:
+                result = await agent.run(prompt, deps=deps)
+            else:
+                result = await agent.run(prompt)
+        finally:
+            metrics.llm_inflight.dec()
+    return result.output
+
+
 async def run_agent_with_fallback(
     agent: Agent,
     prompt: str,
@@ -6,7 +6,11 @@ Generates Prometheus text exposition format (text/plain; version=0.0.4).
 """
 import time
 import threading
-from typing import Dict, List, Optional
+from array import array
+from bisect import bisect_left
+from collections import deque
+from functools import lru_cache
+from typing import Any, Deque, Dict, Final, List, Optional, Tuple, Union
 from dataclasses import dataclass, field
 from enum import Enum
 
@@ -26,41 +30,236 @@ class MetricValue:
     timestamp_ms: Optional[int] = None
 
 
-class Counter:
+class _Cell:
     """
-    Prometheus Counter metric.
+    Mutable value slot for one label combination.
 
-    A counter is a cumulative metric that only goes up.
-    Used for: request counts, error counts, token usage, costs, etc.
+    Each cell carries its own lock, so updates to different label rows
+    never contend and the metric-wide lock is only taken to insert rows.
+    """
+    __slots__ = ("value", "lock")
+
+    def __init__(self, value: float = 0.0):
+        self.value = value
+        self.lock = threading.Lock()
+
+
+class _HistogramCell:
+    """
+    Bucket counts, sum and count for one label combination.
+
+    bucket_counts[i] counts observations that fell into buckets[i] only
+    (not cumulative); collect() builds the cumulative series.
+    """
+    __slots__ = ("bucket_counts", "sum", "count", "lock")
+
+    def __init__(self, bucket_count: int):
+        self.bucket_counts = [0] * bucket_count
+        self.sum = 0.0
+        self.count = 0
+        self.lock = threading.Lock()
+
+
+# Row key: label values packed in declared label order, or a sorted
+# (name, value) tuple for label sets that don't match the declaration
+LabelKey = Union[bytes, tuple]
+
+# Separator for packed label values (ASCII unit separator)
+_LABEL_SEP = "\x1f"
+
+
+def _pack_labels(*values: str) -> bytes:
+    """Pack label values, in declared label order, into one bytes key."""
+    return _LABEL_SEP.join(values).encode()
+
+
+@lru_cache(maxsize=4096)
+def _sorted_label_key(labels: frozenset) -> tuple:
+    """Canonical sorted key for a label set; label sets are few and stable."""
+    return tuple(sorted(labels))
+
+
+@lru_cache(maxsize=64)
+def _agent_label_keys(agent: str) -> Tuple[bytes, bytes, bytes]:
+    """Prebuilt packed keys for ["agent"] and ["agent", "type"] metrics."""
+    return (
+        _pack_labels(agent),
+        _pack_labels(agent, "input"),
+        _pack_labels(agent, "output"),
+    )
+
+
+@lru_cache(maxsize=8192)
+def _format_label_items(items: tuple) -> str:
+    """Format sorted label items as a Prometheus label string."""
+    if not items:
+        return ""
+    parts = [f'{k}="{v}"' for k, v in items]
+    return "{" + ",".join(parts) + "}"
+
+
+# Exposition sample: (metric name suffix, formatted label string, value)
+Sample = Tuple[str, str, float]
+
+
+# Number of lock stripes per metric; must be a power of two
+_SHARD_COUNT = 16
+
+
+class _LabeledMetric:
+    """
+    Shared storage for labeled metrics.
+
+    Rows are spread over lock-striped shards by label-key hash. A row is
+    created once per label combination under its shard's lock; after that,
+    callers update the row directly under the row's own lock.
     """
 
     def __init__(self, name: str, description: str, labels: Optional[List[str]] = None):
         self.name = name
         self.description = description
         self.label_names = labels or []
-        self._values: Dict[tuple, float] = {}
-        self._lock = threading.Lock()
+        self._shards: List[Tuple[Dict[LabelKey, Any], threading.Lock]] = [
+            ({}, threading.Lock()) for _ in range(_SHARD_COUNT)
+        ]
+
+    def _new_row(self) -> Any:
+        """Create the storage for a new label combination."""
+        return _Cell()
+
+    def _row(self, labels: Dict[str, str]) -> Any:
+        """Get the row for labels, inserting it on first use."""
+        return self._row_for_key(self._label_key(labels))
+
+    def _row_for_key(self, key: LabelKey) -> Any:
+        """Get the row for a prebuilt label key, inserting it on first use."""
+        values, lock = self._shards[hash(key) & (_SHARD_COUNT - 1)]
+        row = values.get(key)
+        if row is None:
+            with lock:
+                row = values.get(key)
+                if row is None:
+                    row = values[key] = self._new_row()
+        return row
+
+    def label_key(self, **labels: str) -> LabelKey:
+        """
+        Build the row key for a label set, for use with inc_key().
+
+        When the labels match the declared label names, their values are
+        packed in declared order into one bytes key, which hashes and
+        compares in a single call. Any other label set falls back to a
+        sorted (name, value) tuple.
+        """
+        names = self.label_names
+        if names and len(labels) == len(names):
+            try:
+                return _pack_labels(*[labels[n] for n in names])
+            except (KeyError, TypeError):
+                pass
+        return _sorted_label_key(frozenset(labels.items()))
+
+    def _label_key(self, labels: Dict[str, str]) -> LabelKey:
+        """Create hashable key from labels."""
+        return self.label_key(**labels)
+
+    def _label_items(self, key: LabelKey) -> tuple:
+        """Sorted (name, value) pairs for a row key."""
+        if isinstance(key, bytes):
+            return tuple(sorted(zip(self.label_names, key.decode().split(_LABEL_SEP))))
+        return key
+
+    def _rows(self) -> List[tuple]:
+        """
+        Snapshot of (label items, row) pairs across shards.
+
+        Safe against concurrent inserts.
+        """
+        rows = []
+        for values, _ in self._shards:
+            rows.extend((self._label_items(k), row) for k, row in list(values.items()))
+        return rows
+
+
+class Counter(_LabeledMetric):
+    """
+    Prometheus Counter metric.
+
+    A counter is a cumulative metric that only goes up.
+    Used for: request counts, error counts, token usage, costs, etc.
+    """
 
     def inc(self, amount: float = 1.0, **labels: str) -> None:
         """Increment counter by amount."""
-        key = self._label_key(labels)
-        with self._lock:
-            self._values[key] = self._values.get(key, 0.0) + amount
+        self.inc_key(self._label_key(labels), amount)
 
-    def _label_key(self, labels: Dict[str, str]) -> tuple:
-        """Create hashable key from labels."""
-        return tuple(sorted(labels.items()))
+    def inc_key(self, key: LabelKey, amount: float = 1.0) -> None:
+        """
+        Increment the row for a prebuilt label key.
+
+        Args:
+            key: Row key, as built by label_key()
+            amount: Amount to add
+        """
+        row = self._row_for_key(key)
+        with row.lock:
+            row.value += amount
 
     def collect(self) -> List[MetricValue]:
         """Collect all metric values."""
-        with self._lock:
-            return [
-                MetricValue(value=v, labels=dict(k))
-                for k, v in self._values.items()
-            ]
+        return [
+            MetricValue(value=row.value, labels=dict(k))
+            for k, row in self._rows()
+        ]
+
+    def samples(self) -> List[Sample]:
+        """Exposition samples with preformatted label strings."""
+        return [("", _format_label_items(k), row.value) for k, row in self._rows()]
+
+
+def _unexpected_labels(metric: _LabeledMetric, labels: Dict[str, str]) -> ValueError:
+    """Error for labels passed to a metric declared without any."""
+    return ValueError(f"{metric.name} has no labels, got {sorted(labels)}")
+
+
+class ScalarCounter(Counter):
+    """
+    Counter without labels, stored in a single array('d') slot.
+
+    inc() skips the label key and row lookup entirely. It still takes a
+    lock, since adding to a float is a read-modify-write. Passing labels
+    raises ValueError rather than a TypeError from a narrower signature.
+    """
+
+    def __init__(self, name: str, description: str):
+        super().__init__(name, description)
+        self._slot = array("d", [0.0])
+        self._slot_lock = threading.Lock()
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        """Increment counter by amount."""
+        if labels:
+            raise _unexpected_labels(self, labels)
+        with self._slot_lock:
+            self._slot[0] += amount
+
+    def inc_key(self, key: LabelKey, amount: float = 1.0) -> None:
+        """Increment counter by amount; key must be the empty label key."""
+        if key:
+            raise _unexpected_labels(self, dict(self._label_items(key)))
+        with self._slot_lock:
+            self._slot[0] += amount
+
+    def collect(self) -> List[MetricValue]:
+        """Collect the counter value."""
+        return [MetricValue(value=self._slot[0])]
+
+    def samples(self) -> List[Sample]:
+        """Exposition sample for the counter value."""
+        return [("", "", self._slot[0])]
 
 
-class Gauge:
+class Gauge(_LabeledMetric):
     """
     Prometheus Gauge metric.
 
@@ -68,45 +267,79 @@ class Gauge:
     Used for: queue depth, active connections, current costs, etc.
     """
 
-    def __init__(self, name: str, description: str, labels: Optional[List[str]] = None):
-        self.name = name
-        self.description = description
-        self.label_names = labels or []
-        self._values: Dict[tuple, float] = {}
-        self._lock = threading.Lock()
-
     def set(self, value: float, **labels: str) -> None:
         """Set gauge to value."""
-        key = self._label_key(labels)
-        with self._lock:
-            self._values[key] = value
+        # A plain attribute store is atomic, so set() needs no lock
+        self._row(labels).value = value
 
     def inc(self, amount: float = 1.0, **labels: str) -> None:
         """Increment gauge by amount."""
-        key = self._label_key(labels)
-        with self._lock:
-            self._values[key] = self._values.get(key, 0.0) + amount
+        row = self._row(labels)
+        with row.lock:
+            row.value += amount
 
     def dec(self, amount: float = 1.0, **labels: str) -> None:
         """Decrement gauge by amount."""
-        key = self._label_key(labels)
-        with self._lock:
-            self._values[key] = self._values.get(key, 0.0) - amount
-
-    def _label_key(self, labels: Dict[str, str]) -> tuple:
-        """Create hashable key from labels."""
-        return tuple(sorted(labels.items()))
+        row = self._row(labels)
+        with row.lock:
+            row.value -= amount
 
     def collect(self) -> List[MetricValue]:
         """Collect all metric values."""
-        with self._lock:
-            return [
-                MetricValue(value=v, labels=dict(k))
-                for k, v in self._values.items()
-            ]
+        return [
+            MetricValue(value=row.value, labels=dict(k))
+            for k, row in self._rows()
+        ]
 
+    def samples(self) -> List[Sample]:
+        """Exposition samples with preformatted label strings."""
+        return [("", _format_label_items(k), row.value) for k, row in self._rows()]
 
-class Histogram:
+
+class ScalarGauge(Gauge):
+    """
+    Gauge without labels, stored in a single array('d') slot.
+
+    set() is one slot store, atomic under the GIL, so the dominant call for
+    queue-depth and cost gauges takes no lock; inc()/dec() still lock
+    because they read-modify-write. Passing labels raises ValueError.
+    """
+
+    def __init__(self, name: str, description: str):
+        super().__init__(name, description)
+        self._slot = array("d", [0.0])
+        self._slot_lock = threading.Lock()
+
+    def set(self, value: float, **labels: str) -> None:
+        """Set gauge to value."""
+        if labels:
+            raise _unexpected_labels(self, labels)
+        self._slot[0] = value
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        """Increment gauge by amount."""
+        if labels:
+            raise _unexpected_labels(self, labels)
+        with self._slot_lock:
+            self._slot[0] += amount
+
+    def dec(self, amount: float = 1.0, **labels: str) -> None:
+        """Decrement gauge by amount."""
+        if labels:
+            raise _unexpected_labels(self, labels)
+        with self._slot_lock:
+            self._slot[0] -= amount
+
+    def collect(self) -> List[MetricValue]:
+        """Collect the gauge value."""
+        return [MetricValue(value=self._slot[0])]
+
+    def samples(self) -> List[Sample]:
+        """Exposition sample for the gauge value."""
+        return [("", "", self._slot[0])]
+
+
+class Histogram(_LabeledMetric):
     """
     Prometheus Histogram metric.
 
@@ -124,65 +357,105 @@ class Histogram:
         labels: Optional[List[str]] = None,
         buckets: Optional[tuple] = None
     ):
-        self.name = name
-        self.description = description
-        self.label_names = labels or []
-        self.buckets = buckets or self.DEFAULT_BUCKETS
-        self._values: Dict[tuple, Dict] = {}
-        self._lock = threading.Lock()
+        super().__init__(name, description, labels)
+        # Sorted so observe() can bisect for the first bucket >= value
+        self.buckets = tuple(sorted(buckets or self.DEFAULT_BUCKETS))
+        # Idle Timers for time(); deque append/pop are atomic
+        self._timer_pool: Deque["Timer"] = deque()
+        # 'le="<bound>"' fragments, formatted once
+        self._le_labels = [f'le="{b}"' for b in self.buckets] + ['le="+Inf"']
+
+    def _new_row(self) -> _HistogramCell:
+        return _HistogramCell(len(self.buckets))
 
     def observe(self, value: float, **labels: str) -> None:
         """Record an observation."""
-        key = self._label_key(labels)
-        with self._lock:
-            if key not in self._values:
-                self._values[key] = {
-                    "buckets": {b: 0 for b in self.buckets},
-                    "sum": 0.0,
-                    "count": 0
-                }
-
-            data = self._values[key]
-            data["sum"] += value
-            data["count"] += 1
-
-            for bucket in self.buckets:
-                if value <= bucket:
-                    data["buckets"][bucket] += 1
-
-    def _label_key(self, labels: Dict[str, str]) -> tuple:
-        """Create hashable key from labels."""
-        return tuple(sorted(labels.items()))
+        idx = bisect_left(self.buckets, value)
+        data = self._row(labels)
+        with data.lock:
+            data.sum += value
+            data.count += 1
+            if idx < len(data.bucket_counts):
+                data.bucket_counts[idx] += 1
+
+    def time(self, **labels: str) -> "Timer":
+        """
+        Get a pooled Timer for this histogram.
+
+        The Timer goes back to the pool when its block exits, so hot paths
+        reuse Timer objects instead of allocating one per block.
+        """
+        try:
+            timer = self._timer_pool.pop()
+        except IndexError:
+            timer = Timer(self)
+            timer._pool = self._timer_pool
+        timer.labels = labels
+        timer.start_ns = None
+        return timer
 
     def collect(self) -> List[MetricValue]:
         """Collect all metric values including buckets, sum, and count."""
         result = []
-        with self._lock:
-            for key, data in self._values.items():
-                base_labels = dict(key)
-
-                # Bucket values (already cumulative from observe())
-                for bucket in sorted(self.buckets):
-                    result.append(MetricValue(
-                        value=data["buckets"][bucket],
-                        labels={**base_labels, "le": str(bucket)}
-                    ))
-
-                # +Inf bucket
+        for key, data in self._rows():
+            base_labels = dict(key)
+            with data.lock:
+                bucket_counts = list(data.bucket_counts)
+                total = data.sum
+                count = data.count
+
+            # Cumulative bucket values
+            cumulative = 0
+            for bucket, bucket_count in zip(self.buckets, bucket_counts):
+                cumulative += bucket_count
                 result.append(MetricValue(
-                    value=data["count"],
-                    labels={**base_labels, "le": "+Inf"}
+                    value=cumulative,
+                    labels={**base_labels, "le": str(bucket)}
                 ))
 
-                # Sum and count
-                result.append(MetricValue(
-                    value=data["sum"],
-                    labels={**base_labels, "_metric": "sum"}
-                ))
-                result.append(MetricValue(
-                    value=data["count"],
-                    labels={**base_labels, "_metric": "count"}
-                ))
+            # +Inf bucket
+            result.append(MetricValue(
+                value=count,
+                labels={**base_labels, "le": "+Inf"}
+            ))
+
+            # Sum and count
+            result.append(MetricValue(
+                value=total,
+                labels={**base_labels, "_metric": "sum"}
+            ))
+            result.append(MetricValue(
+                value=count,
+                labels={**base_labels, "_metric": "count"}
+            ))
+
+        return result
+
+    def samples(self) -> List[Sample]:
+        """
+        Exposition samples: cumulative _bucket lines, then _sum and _count.
+
+        Bucket label strings are assembled from the row's preformatted
+        labels and the cached le fragments, without copying label dicts.
+        """
+        result: List[Sample] = []
+        for key, data in self._rows():
+            with data.lock:
+                bucket_counts = list(data.bucket_counts)
+                total = data.sum
+                count = data.count
+
+            label_str = _format_label_items(key)
+            bucket_open = "{" + label_str[1:-1] + "," if label_str else "{"
+
+            cumulative = 0
+            for le, bucket_count in zip(self._le_labels, bucket_counts):
+                cumulative += bucket_count
+                result.append(("_bucket", f"{bucket_open}{le}}}", cumulative))
+            result.append(("_bucket", f"{bucket_open}{self._le_labels[-1]}}}", count))
+
+            result.append(("_sum", label_str, total))
+            result.append(("_count", label_str, count))
 
         return result
 
@@ -193,42 +466,42 @@ class Timer:
     def __init__(self, histogram: Histogram, **labels: str):
         self.histogram = histogram
         self.labels = labels
-        self.start_time: Optional[float] = None
+        self.start_ns: Optional[int] = None
+        # Set when owned by Histogram.time()'s pool
+        self._pool: Optional[Deque["Timer"]] = None
 
     def __enter__(self) -> "Timer":
-        self.start_time = time.perf_counter()
+        self._observe = self.histogram.observe
+        self.start_ns = time.perf_counter_ns()
         return self
 
     def __exit__(self, *args) -> None:
-        if self.start_time is not None:
-            duration = time.perf_counter() - self.start_time
-            self.histogram.observe(duration, **self.labels)
+        if self.start_ns is not None:
+            # Integer delta; converted to seconds once, before observe() locks
+            duration = (time.perf_counter_ns() - self.start_ns) * 1e-9
+            self._observe(duration, **self.labels)
+        if self._pool is not None:
+            self._pool.append(self)
 
 
 class MetricsRegistry:
     """
     Central registry for all application metrics.
 
-    Provides singleton access and Prometheus text format export.
+    Provides Prometheus text format export. The application shares the
+    module-level `metrics` instance (see get_metrics()).
     """
 
-    _instance: Optional["MetricsRegistry"] = None
-    _lock = threading.Lock()
-
-    def __new__(cls) -> "MetricsRegistry":
-        if cls._instance is None:
-            with cls._lock:
-                if cls._instance is None:
-                    cls._instance = super().__new__(cls)
-                    cls._instance._initialized = False
-        return cls._instance
+    # Queued track_agent_tokens() calls are applied once this many build up,
+    # so the queue stays bounded when /metrics is not scraped
+    PENDING_DRAIN_THRESHOLD = 256
 
     def __init__(self):
-        if self._initialized:
-            return
-
         self._metrics: Dict[str, Counter | Gauge | Histogram] = {}
-        self._initialized = True
+        # Static "# HELP"/"# TYPE" lines per metric, built at registration
+        self._headers: Dict[str, bytes] = {}
+        # Per-call token/cost deltas, applied to counters at export time
+        self._pending: Deque[Tuple[str, int, int, float, float]] = deque()
 
         # Initialize application metrics
         self._setup_metrics()
@@ -302,8 +575,21 @@ class MetricsRegistry:
             buckets=(0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
         )
 
+        self.llm_inflight = self.gauge(
+            "gp_llm_inflight",
+            "LLM agent runs currently in flight"
+        )
+
+        self.retry_backoff_seconds = self.gauge(
+            "gp_llm_retry_backoff_seconds",
+            "Base LLM retry wait before jitter, by attempt number",
+            ["attempt"]
+        )
+
         # ============================================
         # TOKEN USAGE METRICS
+        # Updated on every LLM call; applied lazily at export (see
+        # track_agent_tokens)
         # ============================================
         self.tokens_input = self.counter(
             "gp_tokens_input_total",
@@ -394,9 +680,9 @@ class MetricsRegistry:
         description: str,
         labels: Optional[List[str]] = None
     ) -> Counter:
-        """Create and register a counter."""
-        metric = Counter(name, description, labels)
-        self._metrics[name] = metric
+        """Create and register a counter (a ScalarCounter when it has no labels)."""
+        metric = Counter(name, description, labels) if labels else ScalarCounter(name, description)
+        self._register(metric, MetricType.COUNTER)
         return metric
 
     def gauge(
@@ -405,9 +691,9 @@ class MetricsRegistry:
         description: str,
         labels: Optional[List[str]] = None
     ) -> Gauge:
-        """Create and register a gauge."""
-        metric = Gauge(name, description, labels)
-        self._metrics[name] = metric
+        """Create and register a gauge (a ScalarGauge when it has no labels)."""
+        metric = Gauge(name, description, labels) if labels else ScalarGauge(name, description)
+        self._register(metric, MetricType.GAUGE)
         return metric
 
     def histogram(
@@ -419,9 +705,17 @@ class MetricsRegistry:
     ) -> Histogram:
         """Create and register a histogram."""
         metric = Histogram(name, description, labels, buckets)
-        self._metrics[name] = metric
+        self._register(metric, MetricType.HISTOGRAM)
         return metric
 
+    def _register(self, metric: Counter | Gauge | Histogram, metric_type: MetricType) -> None:
+        """Add a metric to the registry and cache its exposition header."""
+        self._metrics[metric.name] = metric
+        self._headers[metric.name] = (
+            f"# HELP {metric.name} {metric.description}\n"
+            f"# TYPE {metric.name} {metric_type.value}\n"
+        ).encode()
+
     def track_agent_tokens(
         self,
         agent: str,
@@ -433,6 +727,13 @@ class MetricsRegistry:
         """
         Convenience method to track all token and cost metrics for an agent call.
 
+        The call is only queued here; the six counters are updated when the
+        queue is drained, at export time or once PENDING_DRAIN_THRESHOLD
+        calls are queued. deque.append is atomic, so most LLM calls take no
+        locks. A scrape therefore sees every call made before it started,
+        and tokens_*/cost_* read via collect() lag by at most
+        PENDING_DRAIN_THRESHOLD calls.
+
         Args:
             agent: Agent name (classifier, director, executor)
             input_tokens: Number of input/prompt tokens
@@ -440,72 +741,78 @@ class MetricsRegistry:
             input_cost_usd: Cost of input tokens in USD
             output_cost_usd: Cost of output tokens in USD
         """
-        # Token counts
-        self.tokens_input.inc(input_tokens, agent=agent)
-        self.tokens_output.inc(output_tokens, agent=agent)
-        self.tokens_total.inc(input_tokens, agent=agent, type="input")
-        self.tokens_total.inc(output_tokens, agent=agent, type="output")
-
-        # Costs
-        total_cost = input_cost_usd + output_cost_usd
-        self.cost_input_usd.inc(input_cost_usd, agent=agent)
-        self.cost_output_usd.inc(output_cost_usd, agent=agent)
-        self.cost_usd.inc(total_cost, agent=agent)
-
-    def export(self) -> str:
+        pending = self._pending
+        pending.append(
+            (agent, input_tokens, output_tokens, input_cost_usd, output_cost_usd)
+        )
+        if len(pending) >= self.PENDING_DRAIN_THRESHOLD:
+            self._drain_pending()
+
+    def _drain_pending(self) -> None:
+        """Apply queued track_agent_tokens() calls to the token and cost counters."""
+        pending = self._pending
+        while True:
+            try:
+                agent, input_tokens, output_tokens, input_cost_usd, output_cost_usd = (
+                    pending.popleft()
+                )
+            except IndexError:
+                return
+
+            # Label keys are built once per agent and reused for every call
+            agent_key, input_key, output_key = _agent_label_keys(agent)
+
+            # Token counts
+            self.tokens_input.inc_key(agent_key, input_tokens)
+            self.tokens_output.inc_key(agent_key, output_tokens)
+            self.tokens_total.inc_key(input_key, input_tokens)
+            self.tokens_total.inc_key(output_key, output_tokens)
+
+            # Costs
+            total_cost = input_cost_usd + output_cost_usd
+            self.cost_input_usd.inc_key(agent_key, input_cost_usd)
+            self.cost_output_usd.inc_key(agent_key, output_cost_usd)
+            self.cost_usd.inc_key(agent_key, total_cost)
+
+    def export(self) -> bytes:
         """
         Export all metrics in Prometheus text exposition format.
 
+        Returns UTF-8 encoded bytes, ready to use as the HTTP response body.
+
         Format specification:
         https://prometheus.io/docs/instrumenting/exposition_formats/
         """
-        lines = []
+        self._drain_pending()
 
-        for name, metric in self._metrics.items():
-            # Add HELP and TYPE
-            lines.append(f"# HELP {name} {metric.description}")
+        parts: List[bytes] = []
 
-            if isinstance(metric, Counter):
-                lines.append(f"# TYPE {name} counter")
-            elif isinstance(metric, Gauge):
-                lines.append(f"# TYPE {name} gauge")
-            elif isinstance(metric, Histogram):
-                lines.append(f"# TYPE {name} histogram")
+        for name, metric in self._metrics.items():
+            # Add cached HELP and TYPE
+            parts.append(self._headers[name])
 
             # Add metric values
-            for mv in metric.collect():
-                if isinstance(metric, Histogram):
-                    # Handle histogram specially
-                    if "_metric" in mv.labels:
-                        suffix = "_" + mv.labels.pop("_metric")
-                        metric_name = f"{name}{suffix}"
-                    elif "le" in mv.labels:
-                        metric_name = f"{name}_bucket"
-                    else:
-                        metric_name = name
-                else:
-                    metric_name = name
-
-                label_str = self._format_labels(mv.labels)
-                lines.append(f"{metric_name}{label_str} {mv.value}")
-
-            lines.append("")  # Empty line between metrics
-
-        return "\n".join(lines)
-
-    def _format_labels(self, labels: Dict[str, str]) -> str:
-        """Format labels as Prometheus label string."""
-        if not labels:
-            return ""
-
-        parts = [f'{k}="{v}"' for k, v in sorted(labels.items())]
-        return "{" + ",".join(parts) + "}"
+            parts.extend(
+                f"{name}{suffix}{label_str} {value}\n".encode()
+                for suffix, label_str, value in metric.samples()
+            )
+
+            parts.append(b"\n")  # Empty line between metrics
+
+        return b"".join(parts)
 
     def reset(self) -> None:
         """Reset all metrics. Useful for testing."""
         self._metrics.clear()
+        self._headers.clear()
+        self._pending.clear()
         self._setup_metrics()
 
 
-# Global metrics instance
-metrics = MetricsRegistry()
+# Global metrics instance, created once at import
+metrics: Final[MetricsRegistry] = MetricsRegistry()
+
+
+def get_metrics() -> MetricsRegistry:
+    """Get the global metrics registry."""
+    return metrics
@@ -3,8 +3,10 @@ Structured Logging & Observability
 Production-grade logging that's both human-readable and machine-parseable.
 """
 import sys
+from contextlib import contextmanager
+from functools import lru_cache
 from loguru import logger
-from typing import Any, Dict
+from typing import Any, Dict, Iterator
 from src.config import get_settings
 
 
@@ -45,11 +47,42 @@ def configure_logging():
     logger.info(f"Logging configured: level={settings.log_level}, structured={settings.enable_structured_logging}")
 
 
+@contextmanager
+def request_context(lead_id: str) -> Iterator[None]:
+    """
+    Attach lead_id to every log record emitted while processing one lead.
+
+    The context lives in a contextvar, so it follows the current task across
+    awaits and is bound once per request instead of on every log call.
+
+    Args:
+        lead_id: The lead being processed
+
+    Example:
+        >>> with request_context(lead.lead_id):
+        ...     await orchestrator.process_message(text, lead)
+    """
+    with logger.contextualize(lead_id=lead_id):
+        yield
+
+
+@lru_cache(maxsize=64)
+def _agent_logger(agent_name: str):
+    """Logger bound to an agent; agent names are few and fixed."""
+    return logger.bind(agent=agent_name)
+
+
+@lru_cache(maxsize=64)
+def _llm_call_logger(agent_name: str, model: str):
+    """Logger bound to the static fields of an agent's LLM call events."""
+    return logger.bind(event_type="llm_call", agent=agent_name, model=model)
+
+
 def log_agent_execution(
     agent_name: str,
-    lead_id: str,
     action: str,
     duration_ms: float | None = None,
+    lead_id: str | None = None,
     **context
 ):
     """
@@ -57,35 +90,30 @@ def log_agent_execution(
 
     Args:
         agent_name: Name of the agent (e.g., "ClassifierAgent")
-        lead_id: The lead being processed
         action: What action was performed (e.g., "classify", "decide_strategy")
         duration_ms: Execution time in milliseconds
+        lead_id: The lead being processed, if not already set by request_context()
         **context: Additional context (stage, intent, cost, etc.)
 
     Example:
         >>> log_agent_execution(
         ...     agent_name="DirectorAgent",
-        ...     lead_id="+521...",
         ...     action="decide_strategy",
         ...     duration_ms=234.5,
         ...     stage="discovery",
         ...     intent="pricing"
         ... )
     """
-    log_data = {
-        "agent": agent_name,
-        "lead_id": lead_id,
-        "action": action,
-    }
-
     if duration_ms is not None:
-        log_data["duration_ms"] = round(duration_ms, 2)
-
-    # Merge additional context
-    log_data.update(context)
+        context["duration_ms"] = round(duration_ms, 2)
+    if lead_id is not None:
+        context["lead_id"] = lead_id
 
-    # Bind the structured data and log
-    logger.bind(**log_data).info(f"{agent_name} | {action}")
+    # Agent is pre-bound; only the per-call fields are bound here
+    _agent_logger(agent_name).bind(
+        action=action,
+        **context
+    ).info(f"{agent_name} | {action}")
 
 
 def log_llm_call(
@@ -114,9 +142,6 @@ def log_llm_call(
         error: Error message if failed
     """
     log_data = {
-        "event_type": "llm_call",
-        "agent": agent_name,
-        "model": model,
         "tokens": {
             "input": input_tokens,
             "output": output_tokens,
@@ -131,7 +156,7 @@ def log_llm_call(
         log_data["error"] = error
 
     level = "info" if success else "error"
-    logger.bind(**log_data).log(
+    _llm_call_logger(agent_name, model).bind(**log_data).log(
         level.upper(),
         f"LLM Call: {model} | {input_tokens + output_tokens} tokens | ${cost_usd:.4f}"
     )
@@ -139,7 +164,7 @@ def log_llm_call(
 
 def log_business_event(
     event_type: str,
-    lead_id: str,
+    lead_id: str | None = None,
     **details: Dict[str, Any]
 ):
     """
@@ -152,13 +177,14 @@ def log_business_event(
 
     Args:
         event_type: Type of event (e.g., "stage_transition", "demo_scheduled")
-        lead_id: The lead involved
+        lead_id: The lead involved, if not already set by request_context()
         **details: Event-specific data
     """
     log_data = {
         "event_type": event_type,
-        "lead_id": lead_id,
         **details
     }
+    if lead_id is not None:
+        log_data["lead_id"] = lead_id
 
     logger.bind(**log_data).success(f"Business Event: {event_type}")
@@ -4,18 +4,56 @@ Phone Number Normalization Service
 Handles E.164 validation, normalization, and Mexico-specific edge cases.
 Mexican mobile numbers historically had an extra "1" after country code
 that must be handled for proper deduplication.
+
+The normalizer holds no state, so it is a set of module-level functions;
+PhoneNormalizer and get_phone_normalizer() remain for existing callers.
 """
 
+import re
+import sys
 import phonenumbers
-from phonenumbers import NumberParseException, PhoneNumberFormat
-from dataclasses import dataclass
-from typing import Optional
+from phonenumbers import NumberParseException, PhoneNumber, PhoneNumberFormat
+from dataclasses import dataclass, replace
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Tuple
 from src.utils.observability import logger
 
 
-@dataclass
+# Mexico country code
+MEXICO_COUNTRY_CODE = "52"
+
+# Default region for parsing ambiguous numbers
+DEFAULT_REGION = "MX"
+
+# Everything that isn't a digit; one C-level pass in _clean_input
+_NON_DIGIT_RE = re.compile(r"\D")
+
+# Number types reported as mobile
+_MOBILE_TYPES = frozenset({
+    phonenumbers.PhoneNumberType.MOBILE,
+    phonenumbers.PhoneNumberType.FIXED_LINE_OR_MOBILE,
+})
+
+# National number length for E.164 inputs that can skip phonenumbers.parse,
+# keyed by country code: Mexico first, plus the other codes leads write from
+_E164_NATIONAL_LENGTHS = {
+    "52": 10,  # Mexico
+    "1": 10,   # US/Canada (NANP)
+    "34": 9,   # Spain
+    "44": 10,  # United Kingdom
+}
+
+# Old Mexico mobile format: optional +, country code 52, then "1" and 10 digits
+_MX_MOBILE_PREFIX_RE = re.compile(r"^(\+?52)1(\d{10})$")
+
+
+@dataclass(frozen=True, slots=True)
 class NormalizedPhone:
-    """Result of phone normalization."""
+    """
+    Result of phone normalization.
+
+    Frozen so cached results can be shared; slotted so bulk results stay small.
+    """
     original: str
     e164: str  # Normalized E.164 format
     country_code: str  # e.g., "52" for Mexico
@@ -30,218 +68,327 @@ class PhoneNormalizationError(Exception):
     pass
 
 
-class PhoneNormalizer:
+def normalize(
+    phone: str,
+    default_region: Optional[str] = None,
+) -> NormalizedPhone:
     """
-    Normalizes phone numbers to E.164 format with special handling
-    for Mexican mobile numbers.
+    Normalize a phone number to E.164 format.
 
-    Mexico Edge Case:
-    - Old format: +52 1 55 1234 5678 (mobile with "1" prefix)
-    - New format: +52 55 1234 5678 (mobile without "1" prefix)
-    - Both should normalize to: +525512345678
+    Args:
+        phone: Phone number in any format
+        default_region: ISO country code for parsing (default: MX)
 
-    Usage:
-        normalizer = PhoneNormalizer()
-        result = normalizer.normalize("+52 1 55 1234 5678")
-        print(result.e164)  # "+525512345678"
+    Returns:
+        NormalizedPhone with normalized data
+
+    Raises:
+        PhoneNormalizationError: If number is invalid
+    """
+    original = phone
+    region = default_region or DEFAULT_REGION
+
+    # Clean input
+    phone = _clean_input(phone)
+
+    # Pre-process Mexico mobile "1" prefix BEFORE parsing
+    # phonenumbers library doesn't recognize old +52 1 format
+    phone = _preprocess_mexico_mobile(phone)
+
+    try:
+        result = _parse_and_validate(phone, region)
+    except NumberParseException as e:
+        raise PhoneNormalizationError(
+            f"Cannot parse phone number '{original}': {e}"
+        )
+
+    if result is None:
+        raise PhoneNormalizationError(
+            f"Invalid phone number: {original}"
+        )
+
+    # Cached results are shared across inputs that clean to the same number
+    if result.original != original:
+        result = replace(result, original=original)
+    return result
+
+
+def normalize_many(
+    phones: Iterable[str],
+    default_region: Optional[str] = None,
+) -> List[Optional[NormalizedPhone]]:
     """
+    Normalize a batch of phone numbers, e.g. for bulk imports or dedup.
 
-    # Mexico country code
-    MEXICO_COUNTRY_CODE = "52"
+    Each distinct input is normalized once; results are returned in
+    input order, with None for numbers that cannot be normalized.
 
-    # Default region for parsing ambiguous numbers
-    DEFAULT_REGION = "MX"
+    Args:
+        phones: Phone numbers in any format
+        default_region: ISO country code for parsing (default: MX)
 
-    def normalize(
-        self,
-        phone: str,
-        default_region: Optional[str] = None,
-    ) -> NormalizedPhone:
-        """
-        Normalize a phone number to E.164 format.
+    Returns:
+        One NormalizedPhone (or None) per input
+    """
+    phones = list(phones)
+    unique: Dict[str, Optional[NormalizedPhone]] = dict.fromkeys(phones)
+    for phone in unique:
+        try:
+            unique[phone] = normalize(phone, default_region)
+        except PhoneNormalizationError:
+            pass
+    return [unique[phone] for phone in phones]
 
-        Args:
-            phone: Phone number in any format
-            default_region: ISO country code for parsing (default: MX)
 
-        Returns:
-            NormalizedPhone with normalized data
+def _clean_input(phone: str) -> str:
+    """Remove common formatting characters."""
+    # Keep + at start if present
+    if phone.startswith("+"):
+        return "+" + _NON_DIGIT_RE.sub("", phone)
+    return _NON_DIGIT_RE.sub("", phone)
 
-        Raises:
-            PhoneNormalizationError: If number is invalid
-        """
-        original = phone
-        region = default_region or self.DEFAULT_REGION
 
-        # Clean input
-        phone = self._clean_input(phone)
+def _preprocess_mexico_mobile(phone: str) -> str:
+    """
+    Remove Mexico mobile '1' prefix before parsing.
 
-        # Pre-process Mexico mobile "1" prefix BEFORE parsing
-        # phonenumbers library doesn't recognize old +52 1 format
-        phone = self._preprocess_mexico_mobile(phone)
+    The old format +52 1 XX XXXX XXXX is not recognized by
+    phonenumbers library, so we convert it to +52 XX XXXX XXXX.
 
-        try:
-            # Parse the phone number
-            parsed = phonenumbers.parse(phone, region)
-
-            # Validate
-            if not phonenumbers.is_valid_number(parsed):
-                raise PhoneNormalizationError(
-                    f"Invalid phone number: {original}"
-                )
-
-            # Get country code and national number
-            country_code = str(parsed.country_code)
-            national = str(parsed.national_number)
-
-            # Handle Mexico mobile "1" prefix edge case
-            if country_code == self.MEXICO_COUNTRY_CODE:
-                national = self._normalize_mexico_number(national)
-
-            # Reconstruct E.164 format
-            e164 = f"+{country_code}{national}"
-
-            # Determine if mobile
-            number_type = phonenumbers.number_type(parsed)
-            is_mobile = number_type in (
-                phonenumbers.PhoneNumberType.MOBILE,
-                phonenumbers.PhoneNumberType.FIXED_LINE_OR_MOBILE,
-            )
-
-            # Get region
-            region_code = phonenumbers.region_code_for_number(parsed)
-
-            result = NormalizedPhone(
-                original=original,
-                e164=e164,
-                country_code=country_code,
-                national_number=national,
-                is_mobile=is_mobile,
-                is_valid=True,
-                region=region_code or region,
-            )
-
-            logger.debug(
-                f"Normalized phone: {original} -> {e164}",
-                extra={"region": region_code, "is_mobile": is_mobile}
-            )
-
-            return result
-
-        except NumberParseException as e:
-            raise PhoneNormalizationError(
-                f"Cannot parse phone number '{original}': {e}"
-            )
-
-    def _clean_input(self, phone: str) -> str:
-        """Remove common formatting characters."""
-        # Keep + at start if present
-        if phone.startswith("+"):
-            return "+" + "".join(c for c in phone[1:] if c.isdigit())
-        return "".join(c for c in phone if c.isdigit())
-
-    def _preprocess_mexico_mobile(self, phone: str) -> str:
-        """
-        Remove Mexico mobile '1' prefix before parsing.
-
-        The old format +52 1 XX XXXX XXXX is not recognized by
-        phonenumbers library, so we convert it to +52 XX XXXX XXXX.
-
-        Args:
-            phone: Cleaned phone number
-
-        Returns:
-            Phone with Mexico '1' prefix removed if applicable
-        """
-        # Check for +521 followed by 10 digits (old Mexico mobile format)
-        if phone.startswith("+521") and len(phone) == 14:
-            normalized = "+52" + phone[4:]
-            logger.debug(f"Pre-processed Mexico mobile: {phone} -> {normalized}")
-            return normalized
-
-        # Check for 521 followed by 10 digits (without +)
-        if phone.startswith("521") and len(phone) == 13:
-            normalized = "52" + phone[3:]
-            logger.debug(f"Pre-processed Mexico mobile: {phone} -> {normalized}")
-            return normalized
+    Args:
+        phone: Cleaned phone number
 
+    Returns:
+        Phone with Mexico '1' prefix removed if applicable
+    """
+    # [+]521 followed by 10 digits (old Mexico mobile format)
+    match = _MX_MOBILE_PREFIX_RE.match(phone)
+    if match is None:
         return phone
 
-    def _normalize_mexico_number(self, national: str) -> str:
-        """
-        Ensure Mexico national number is 10 digits.
+    normalized = match.group(1) + match.group(2)
+    logger.debug("Pre-processed Mexico mobile: {} -> {}", phone, normalized)
+    return normalized
 
-        After preprocessing removes the "1" prefix, this method
-        handles any edge cases that might slip through.
 
-        Args:
-            national: National number (without country code)
+def _normalize_mexico_number(national: str) -> str:
+    """
+    Ensure Mexico national number is 10 digits.
 
-        Returns:
-            Normalized national number (10 digits for Mexico)
-        """
-        # Mexican numbers should be 10 digits after preprocessing
-        # This handles any edge cases that slip through
-        if len(national) == 11 and national.startswith("1"):
-            normalized = national[1:]
-            logger.debug(f"Removed Mexico mobile '1' prefix: {national} -> {normalized}")
-            return normalized
-        return national
+    After preprocessing removes the "1" prefix, this function
+    handles any edge cases that might slip through.
 
-    def are_equivalent(self, phone1: str, phone2: str) -> bool:
-        """
-        Check if two phone numbers are equivalent after normalization.
+    Args:
+        national: National number (without country code)
 
-        Useful for deduplication.
+    Returns:
+        Normalized national number (10 digits for Mexico)
+    """
+    # Mexican numbers should be 10 digits after preprocessing
+    # This handles any edge cases that slip through
+    if len(national) == 11 and national.startswith("1"):
+        normalized = national[1:]
+        logger.debug("Removed Mexico mobile '1' prefix: {} -> {}", national, normalized)
+        return normalized
+    return national
 
-        Args:
-            phone1: First phone number
-            phone2: Second phone number
 
-        Returns:
-            True if numbers are equivalent
-        """
-        try:
-            norm1 = self.normalize(phone1)
-            norm2 = self.normalize(phone2)
-            return norm1.e164 == norm2.e164
-        except PhoneNormalizationError:
-            return False
+def are_equivalent(phone1: str, phone2: str) -> bool:
+    """
+    Check if two phone numbers are equivalent after normalization.
 
-    def is_valid(self, phone: str, default_region: Optional[str] = None) -> bool:
-        """
-        Check if a phone number is valid.
+    Useful for deduplication.
 
-        Args:
-            phone: Phone number to validate
-            default_region: ISO country code for parsing
+    Args:
+        phone1: First phone number
+        phone2: Second phone number
 
-        Returns:
-            True if valid
-        """
-        try:
-            self.normalize(phone, default_region)
-            return True
-        except PhoneNormalizationError:
-            return False
+    Returns:
+        True if numbers are equivalent
+    """
+    try:
+        norm1 = normalize(phone1)
+        norm2 = normalize(phone2)
+        return norm1.e164 == norm2.e164
+    except PhoneNormalizationError:
+        return False
 
-    def format_display(self, phone: str, default_region: Optional[str] = None) -> str:
-        """
-        Format phone number for display (international format).
 
-        Args:
-            phone: Phone number
-            default_region: ISO country code for parsing
+def is_valid(phone: str, default_region: Optional[str] = None) -> bool:
+    """
+    Check if a phone number is valid.
 
-        Returns:
-            Formatted string like "+52 55 1234 5678"
-        """
-        try:
-            region = default_region or self.DEFAULT_REGION
-            parsed = phonenumbers.parse(phone, region)
-            return phonenumbers.format_number(parsed, PhoneNumberFormat.INTERNATIONAL)
-        except NumberParseException:
-            return phone  # Return original if can't format
+    Args:
+        phone: Phone number to validate
+        default_region: ISO country code for parsing
+
+    Returns:
+        True if valid
+    """
+    try:
+        normalize(phone, default_region)
+        return True
+    except PhoneNormalizationError:
+        return False
+
+
+def format_display(phone: str, default_region: Optional[str] = None) -> str:
+    """
+    Format phone number for display (international format).
+
+    Args:
+        phone: Phone number
+        default_region: ISO country code for parsing
+
+    Returns:
+        Formatted string like "+52 55 1234 5678"
+    """
+    try:
+        region = default_region or DEFAULT_REGION
+        parsed = phonenumbers.parse(phone, region)
+        return phonenumbers.format_number(parsed, PhoneNumberFormat.INTERNATIONAL)
+    except NumberParseException:
+        return phone  # Return original if can't format
+
+def _split_e164(phone: str) -> Optional[Tuple[int, int]]:
+    """
+    Split a cleaned E.164 number into (country code, national number).
+
+    Only country codes in _E164_NATIONAL_LENGTHS are recognised, and only
+    when the national number has the expected length. Country codes are
+    prefix-free, so at most one of the 1-3 digit prefixes can match.
+    National numbers starting with 0 or 1 are left to the full parser
+    (leading zeros and trunk/old mobile "1" prefixes need its handling).
+
+    Returns:
+        (country_code, national_number), or None to fall back to parsing
+    """
+    if not phone.startswith("+") or not phone[1:].isdigit():
+        return None
+
+    for cc_len in (1, 2, 3):
+        country_code = phone[1:1 + cc_len]
+        expected_length = _E164_NATIONAL_LENGTHS.get(country_code)
+        if expected_length is None:
+            continue
+        national = phone[1 + cc_len:]
+        if len(national) != expected_length or national[0] in "01":
+            return None
+        return int(country_code), int(national)
+    return None
+
+
+@lru_cache(maxsize=None)
+def _sole_region_for_country_code(country_code: int) -> Optional[str]:
+    """Region for a country code used by a single region (e.g. 52 -> MX), else None."""
+    regions = phonenumbers.region_codes_for_country_code(country_code)
+    return regions[0] if len(regions) == 1 else None
+
+
+@lru_cache(maxsize=100_000)
+def _parse_and_validate(phone: str, region: str) -> Optional[NormalizedPhone]:
+    """
+    Parse and validate a cleaned, preprocessed phone number.
+
+    Cached on (phone, region): dedup scans and webhook retries see the same
+    numbers over and over, and the phonenumbers pipeline dominates the cost
+    of normalize(). Invalid numbers are cached as None; unparseable ones
+    raise NumberParseException and are not cached.
+
+    Args:
+        phone: Output of _clean_input/_preprocess_mexico_mobile
+        region: ISO country code for parsing
+
+    Returns:
+        NormalizedPhone with original set to phone, or None if invalid
+    """
+    split = _split_e164(phone)
+    if split is not None:
+        # Already E.164 (the webhook format): build the number directly
+        # instead of running the full string parser
+        parsed = PhoneNumber(country_code=split[0], national_number=split[1])
+    else:
+        # Parse the phone number
+        parsed = phonenumbers.parse(phone, region)
+
+    # Validate
+    if not phonenumbers.is_valid_number(parsed):
+        return None
+
+    # Get country code and national number
+    country_code = str(parsed.country_code)
+    national = str(parsed.national_number)
+
+    # Handle Mexico mobile "1" prefix edge case
+    if country_code == MEXICO_COUNTRY_CODE:
+        national = _normalize_mexico_number(national)
+
+    # Reconstruct E.164 format; interned since the same few numbers recur
+    # as lead ids and dict keys across the app
+    e164 = sys.intern(f"+{country_code}{national}")
+
+    # Determine if mobile
+    number_type = phonenumbers.number_type(parsed)
+    is_mobile = number_type in _MOBILE_TYPES
+
+    # Get region; only shared country codes (e.g. +1) need the number lookup
+    region_code = (
+        _sole_region_for_country_code(parsed.country_code)
+        or phonenumbers.region_code_for_number(parsed)
+    )
+
+    # Positional args are only formatted if a sink accepts DEBUG
+    logger.debug(
+        "Normalized phone: {} -> {}", phone, e164,
+        extra={"region": region_code, "is_mobile": is_mobile}
+    )
+
+    return NormalizedPhone(
+        original=phone,
+        e164=e164,
+        country_code=country_code,
+        national_number=national,
+        is_mobile=is_mobile,
+        is_valid=True,
+        region=region_code or region,
+    )
+
+
+def _normalizer_cache_clear() -> None:
+    """Clear the normalization cache. Useful for testing."""
+    _parse_and_validate.cache_clear()
+
+
+class PhoneNormalizer:
+    """
+    Normalizes phone numbers to E.164 format with special handling
+    for Mexican mobile numbers.
+
+    Mexico Edge Case:
+    - Old format: +52 1 55 1234 5678 (mobile with "1" prefix)
+    - New format: +52 55 1234 5678 (mobile without "1" prefix)
+    - Both should normalize to: +525512345678
+
+    Kept for backward compatibility: the class holds no state, and its
+    methods are the module-level functions.
+
+    Usage:
+        normalizer = PhoneNormalizer()
+        result = normalizer.normalize("+52 1 55 1234 5678")
+        print(result.e164)  # "+525512345678"
+    """
+
+    MEXICO_COUNTRY_CODE = MEXICO_COUNTRY_CODE
+    DEFAULT_REGION = DEFAULT_REGION
+
+    normalize = staticmethod(normalize)
+    normalize_many = staticmethod(normalize_many)
+    are_equivalent = staticmethod(are_equivalent)
+    is_valid = staticmethod(is_valid)
+    format_display = staticmethod(format_display)
+    _clean_input = staticmethod(_clean_input)
+    _preprocess_mexico_mobile = staticmethod(_preprocess_mexico_mobile)
+    _normalize_mexico_number = staticmethod(_normalize_mexico_number)
 
 
 # Singleton instance
@@ -249,7 +396,7 @@ _normalizer: Optional[PhoneNormalizer] = None
 
 
 def get_phone_normalizer() -> PhoneNormalizer:
-    """Get or create the phone normalizer singleton."""
+    """Get or create the phone normalizer singleton (kept for existing callers)."""
     global _normalizer
     if _normalizer is None:
         _normalizer = PhoneNormalizer()
@@ -270,4 +417,4 @@ def normalize_phone(phone: str, default_region: str = "MX") -> str:
     Raises:
         PhoneNormalizationError: If number is invalid
     """
-    return get_phone_normalizer().normalize(phone, default_region).e164
+    return normalize(phone, default_region).e164
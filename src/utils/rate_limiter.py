@@ -1,17 +1,22 @@
 """
 Rate Limiting and Abuse Detection
 
-Provides per-lead rate limiting with Redis backend and in-memory fallback.
+Provides per-lead rate limiting with Redis backend and in-memory fallback,
+plus client-side token buckets that pace outbound provider calls.
 """
 
 import asyncio
+import sys
+import time
 from abc import ABC, abstractmethod
 from datetime import datetime, timedelta, timezone
-from typing import Optional, Dict, List
+from typing import Optional, Dict, Deque
 from dataclasses import dataclass
-from collections import defaultdict
+from collections import defaultdict, deque
 from loguru import logger
 
+from src.config import get_settings
+
 
 @dataclass
 class RateLimitResult:
@@ -24,12 +29,24 @@ class RateLimitResult:
         reset_at: When the rate limit window resets
         retry_after: Seconds to wait before retrying (if blocked)
         reason: Why the request was blocked (if applicable)
+        banned: Blocked by an active ban; reset_at is when it ends and
+            reason is the ban reason
     """
     allowed: bool
     remaining: int
     reset_at: datetime
     retry_after: Optional[int] = None
     reason: Optional[str] = None
+    banned: bool = False
+
+
+# Number of lock stripes in InMemoryRateLimiter (power of two)
+LOCK_STRIPES = 64
+
+
+def _wall_clock_in(seconds: float) -> datetime:
+    """UTC datetime `seconds` from now, for results reported to callers."""
+    return datetime.now(timezone.utc) + timedelta(seconds=seconds)
 
 
 class RateLimiter(ABC):
@@ -86,6 +103,63 @@ class RateLimiter(ABC):
         """
         pass
 
+    @abstractmethod
+    async def get_ban_info(self, lead_id: str) -> Optional[tuple[datetime, str]]:
+        """
+        Get ban information for a lead.
+
+        Args:
+            lead_id: Lead identifier
+
+        Returns:
+            Tuple of (ban_until, reason) or None if not banned
+        """
+        pass
+
+    async def admit(self, lead_id: str) -> RateLimitResult:
+        """
+        Admission check: reject banned leads, otherwise check the rate limit.
+
+        Args:
+            lead_id: Lead identifier
+
+        Returns:
+            Rate limit result, with banned=True if the lead is banned
+        """
+        ban = await self.get_ban_info(lead_id)
+        if ban is not None:
+            ban_until, reason = ban
+            remaining = (ban_until - datetime.now(timezone.utc)).total_seconds()
+            return RateLimitResult(
+                allowed=False,
+                remaining=0,
+                reset_at=ban_until,
+                retry_after=max(int(remaining), 1),
+                reason=reason,
+                banned=True
+            )
+        return await self.check_rate_limit(lead_id)
+
+    async def check_and_detect(
+        self, lead_id: str, spike_check: bool = True
+    ) -> tuple[RateLimitResult, bool]:
+        """
+        Run admit() and, if the request is allowed, detect a spike.
+
+        Args:
+            lead_id: Lead identifier
+            spike_check: Whether to run spike detection at all
+
+        Returns:
+            Tuple of (rate limit result, spike detected). Spike detection
+            is skipped (False) for requests that are not allowed, or when
+            spike_check is False.
+        """
+        result = await self.admit(lead_id)
+        if not result.allowed or not spike_check:
+            return result, False
+        return result, await self.detect_spike(lead_id)
+
 
 class InMemoryRateLimiter(RateLimiter):
     """
@@ -93,8 +167,15 @@ class InMemoryRateLimiter(RateLimiter):
 
     Uses sliding window algorithm for rate limiting.
     Suitable for single-instance deployments or testing.
+
+    Leads that go quiet and expired bans are dropped by a sweep that runs
+    every SWEEP_INTERVAL rate limit checks, so memory stays bounded by the
+    number of recently active leads.
     """
 
+    # Rate limit checks between sweeps of stale entries
+    SWEEP_INTERVAL = 10_000
+
     def __init__(
         self,
         max_requests: int = 10,
@@ -119,10 +200,20 @@ class InMemoryRateLimiter(RateLimiter):
         self.spike_window_seconds = spike_window_seconds
         self.ban_duration_seconds = ban_duration_seconds
 
-        # Storage
-        self._requests: Dict[str, List[datetime]] = defaultdict(list)
-        self._bans: Dict[str, tuple[datetime, str]] = {}  # lead_id -> (ban_until, reason)
-        self._lock = asyncio.Lock()
+        # Storage, in time.monotonic() seconds; converted to datetime only
+        # for returned results. Per-lead timestamps are appended in order,
+        # so expired ones are always at the left. Methods that insert keys
+        # intern lead_id so each lead's key string is stored once
+        self._requests: Dict[str, Deque[float]] = defaultdict(deque)
+        self._bans: Dict[str, tuple[float, str]] = {}  # lead_id -> (ban_until, reason)
+        # Striped locks: per-lead state is independent, so leads that hash
+        # to different stripes never wait on each other
+        self._locks = [asyncio.Lock() for _ in range(LOCK_STRIPES)]
+        self._checks_since_sweep = 0
+
+    def _lock_for(self, lead_id: str) -> asyncio.Lock:
+        """Lock guarding this lead's request and ban entries."""
+        return self._locks[hash(lead_id) & (LOCK_STRIPES - 1)]
 
     async def check_rate_limit(self, lead_id: str) -> RateLimitResult:
         """
@@ -136,45 +227,108 @@ class InMemoryRateLimiter(RateLimiter):
         Returns:
             Rate limit result
         """
-        async with self._lock:
-            now = datetime.now(timezone.utc)
-            window_start = now - timedelta(seconds=self.window_seconds)
+        lead_id = sys.intern(lead_id)
+        async with self._lock_for(lead_id):
+            return self._record_request(lead_id, time.monotonic())
 
-            # Clean up old requests
-            self._requests[lead_id] = [
-                ts for ts in self._requests[lead_id]
-                if ts > window_start
-            ]
+    async def admit(self, lead_id: str) -> RateLimitResult:
+        """
+        Check the ban and the rate limit under a single lock.
 
-            # Count requests in current window
-            request_count = len(self._requests[lead_id])
+        Args:
+            lead_id: Lead identifier
+
+        Returns:
+            Rate limit result, with banned=True if the lead is banned
+        """
+        lead_id = sys.intern(lead_id)
+        async with self._lock_for(lead_id):
+            now = time.monotonic()
+            return self._ban_result(lead_id, now) or self._record_request(lead_id, now)
+
+    async def check_and_detect(
+        self, lead_id: str, spike_check: bool = True
+    ) -> tuple[RateLimitResult, bool]:
+        """
+        Check the ban, the rate limit and spikes under a single lock.
 
-            if request_count >= self.max_requests:
-                # Rate limit exceeded
-                oldest_request = min(self._requests[lead_id])
-                reset_at = oldest_request + timedelta(seconds=self.window_seconds)
-                retry_after = int((reset_at - now).total_seconds())
+        Args:
+            lead_id: Lead identifier
+            spike_check: Whether to run spike detection at all
 
-                return RateLimitResult(
-                    allowed=False,
-                    remaining=0,
-                    reset_at=reset_at,
-                    retry_after=max(retry_after, 1),
-                    reason=f"Rate limit exceeded: {request_count}/{self.max_requests} requests"
-                )
+        Returns:
+            Tuple of (rate limit result, spike detected). Spike detection
+            is skipped (False) for requests that are not allowed, or when
+            spike_check is False.
+        """
+        lead_id = sys.intern(lead_id)
+        async with self._lock_for(lead_id):
+            now = time.monotonic()
+            result = self._ban_result(lead_id, now) or self._record_request(lead_id, now)
+            if not result.allowed or not spike_check:
+                return result, False
+            return result, self._spike_detected(lead_id, now)
+
+    def _ban_result(self, lead_id: str, now: float) -> Optional[RateLimitResult]:
+        """Blocked result if the lead has an active ban, else None. Caller holds the lead's lock."""
+        ban = self._bans.get(lead_id)
+        if ban is None:
+            return None
 
-            # Add current request
-            self._requests[lead_id].append(now)
+        ban_until, reason = ban
+        remaining = ban_until - now
+        if remaining < 0:
+            del self._bans[lead_id]
+            return None
 
-            # Calculate reset time
-            reset_at = now + timedelta(seconds=self.window_seconds)
+        return RateLimitResult(
+            allowed=False,
+            remaining=0,
+            reset_at=_wall_clock_in(remaining),
+            retry_after=max(int(remaining), 1),
+            reason=reason,
+            banned=True
+        )
+
+    def _record_request(self, lead_id: str, now: float) -> RateLimitResult:
+        """Sliding window check that records the request if allowed. Caller holds the lead's lock."""
+        self._checks_since_sweep += 1
+        if self._checks_since_sweep >= self.SWEEP_INTERVAL:
+            self._sweep(now)
+
+        window_start = now - self.window_seconds
+
+        # Clean up old requests
+        requests = self._requests[lead_id]
+        while requests and requests[0] <= window_start:
+            requests.popleft()
+
+        # Count requests in current window
+        request_count = len(requests)
+
+        if request_count >= self.max_requests:
+            # Rate limit exceeded
+            oldest_request = requests[0]
+            reset_in = oldest_request + self.window_seconds - now
+            retry_after = int(reset_in)
 
             return RateLimitResult(
-                allowed=True,
-                remaining=self.max_requests - (request_count + 1),
-                reset_at=reset_at
+                allowed=False,
+                remaining=0,
+                reset_at=_wall_clock_in(reset_in),
+                retry_after=max(retry_after, 1),
+                reason=f"Rate limit exceeded: {request_count}/{self.max_requests} requests"
             )
 
+        # Add current request
+        requests.append(now)
+
+        return RateLimitResult(
+            allowed=True,
+            remaining=self.max_requests - (request_count + 1),
+            reset_at=_wall_clock_in(self.window_seconds)
+        )
+
     async def is_banned(self, lead_id: str) -> bool:
         """
         Check if lead is temporarily banned.
@@ -185,14 +339,13 @@ class InMemoryRateLimiter(RateLimiter):
         Returns:
             True if banned, False otherwise
         """
-        async with self._lock:
+        async with self._lock_for(lead_id):
             if lead_id not in self._bans:
                 return False
 
             ban_until, _ = self._bans[lead_id]
-            now = datetime.now(timezone.utc)
 
-            if now > ban_until:
+            if time.monotonic() > ban_until:
                 # Ban expired
                 del self._bans[lead_id]
                 return False
@@ -208,15 +361,15 @@ class InMemoryRateLimiter(RateLimiter):
             duration_seconds: Ban duration
             reason: Reason for ban
         """
-        async with self._lock:
-            ban_until = datetime.now(timezone.utc) + timedelta(seconds=duration_seconds)
-            self._bans[lead_id] = (ban_until, reason)
+        lead_id = sys.intern(lead_id)
+        async with self._lock_for(lead_id):
+            self._bans[lead_id] = (time.monotonic() + duration_seconds, reason)
 
             logger.warning(
                 f"Lead {lead_id} banned",
                 extra={
                     "lead_id": lead_id,
-                    "ban_until": ban_until.isoformat(),
+                    "ban_until": _wall_clock_in(duration_seconds).isoformat(),
                     "reason": reason
                 }
             )
@@ -234,30 +387,70 @@ class InMemoryRateLimiter(RateLimiter):
         Returns:
             True if spike detected, False otherwise
         """
-        async with self._lock:
-            now = datetime.now(timezone.utc)
-            spike_window_start = now - timedelta(seconds=self.spike_window_seconds)
+        async with self._lock_for(lead_id):
+            return self._spike_detected(lead_id, time.monotonic())
 
-            # Count requests in spike window
-            recent_requests = [
-                ts for ts in self._requests.get(lead_id, [])
-                if ts > spike_window_start
-            ]
+    def _sweep(self, now: float) -> None:
+        """
+        Drop leads with no requests in the window and expired bans.
 
-            spike_detected = len(recent_requests) >= self.spike_threshold
+        Runs without awaiting, so no other coroutine can observe the maps
+        mid-sweep even though only one stripe lock is held.
+        """
+        self._checks_since_sweep = 0
+        window_start = now - self.window_seconds
+
+        stale_leads = [
+            lead_id for lead_id, requests in self._requests.items()
+            if not requests or requests[-1] <= window_start
+        ]
+        for lead_id in stale_leads:
+            del self._requests[lead_id]
+
+        expired_bans = [
+            lead_id for lead_id, (ban_until, _) in self._bans.items()
+            if ban_until < now
+        ]
+        for lead_id in expired_bans:
+            del self._bans[lead_id]
+
+        if stale_leads or expired_bans:
+            logger.debug(
+                "Rate limiter sweep removed {} idle leads and {} expired bans",
+                len(stale_leads), len(expired_bans)
+            )
 
-            if spike_detected:
-                logger.warning(
-                    f"Spike detected for lead {lead_id}",
-                    extra={
-                        "lead_id": lead_id,
-                        "request_count": len(recent_requests),
-                        "threshold": self.spike_threshold,
-                        "window_seconds": self.spike_window_seconds
-                    }
-                )
+    def _spike_detected(self, lead_id: str, now: float) -> bool:
+        """Spike check over the lead's recorded requests. Caller holds the lead's lock."""
+        spike_window_start = now - self.spike_window_seconds
+        requests = self._requests.get(lead_id, ())
+
+        # Timestamps are ordered, so it's a spike exactly when the
+        # spike_threshold-th newest request is inside the window
+        threshold = self.spike_threshold
+        spike_detected = len(requests) >= threshold and (
+            threshold <= 0 or requests[-threshold] > spike_window_start
+        )
+
+        if spike_detected:
+            # Full count only for the log line, newest first
+            request_count = 0
+            for ts in reversed(requests):
+                if ts <= spike_window_start:
+                    break
+                request_count += 1
 
-            return spike_detected
+            logger.warning(
+                f"Spike detected for lead {lead_id}",
+                extra={
+                    "lead_id": lead_id,
+                    "request_count": request_count,
+                    "threshold": self.spike_threshold,
+                    "window_seconds": self.spike_window_seconds
+                }
+            )
+
+        return spike_detected
 
     async def get_ban_info(self, lead_id: str) -> Optional[tuple[datetime, str]]:
         """
@@ -269,11 +462,295 @@ class InMemoryRateLimiter(RateLimiter):
         Returns:
             Tuple of (ban_until, reason) or None if not banned
         """
-        async with self._lock:
+        async with self._lock_for(lead_id):
             if lead_id in self._bans:
                 ban_until, reason = self._bans[lead_id]
-                if datetime.now(timezone.utc) <= ban_until:
-                    return (ban_until, reason)
+                remaining = ban_until - time.monotonic()
+                if remaining >= 0:
+                    return (_wall_clock_in(remaining), reason)
                 else:
                     del self._bans[lead_id]
             return None
+
+
+class TokenBucketRateLimiter(RateLimiter):
+    """
+    Token bucket rate limiter implementation.
+
+    Alternative to InMemoryRateLimiter that keeps no per-request history:
+    each lead has a bucket of max_requests tokens refilled evenly over
+    window_seconds, plus a spike bucket of spike_threshold tokens refilled
+    over spike_window_seconds. A check is O(1) and per-lead state is three
+    floats, regardless of max_requests.
+
+    Unlike the sliding window, capacity comes back gradually rather than
+    all at once when the oldest request ages out. State updates never
+    await, so no lock is needed.
+    """
+
+    # Rate limit checks between sweeps of idle leads
+    SWEEP_INTERVAL = 10_000
+
+    def __init__(
+        self,
+        max_requests: int = 10,
+        window_seconds: int = 3600,  # 1 hour
+        spike_threshold: int = 5,  # 5 messages in spike_window
+        spike_window_seconds: int = 60,  # 1 minute
+        ban_duration_seconds: int = 3600,  # 1 hour
+    ):
+        """
+        Initialize token bucket rate limiter.
+
+        Args:
+            max_requests: Bucket capacity (burst size) and requests per window
+            window_seconds: Time to refill an empty bucket
+            spike_threshold: Requests in a burst that count as a spike
+            spike_window_seconds: Time to refill an empty spike bucket
+            ban_duration_seconds: Default ban duration
+        """
+        self.max_requests = max_requests
+        self.window_seconds = window_seconds
+        self.spike_threshold = spike_threshold
+        self.spike_window_seconds = spike_window_seconds
+        self.ban_duration_seconds = ban_duration_seconds
+
+        self._refill_rate = max_requests / window_seconds
+        self._spike_refill_rate = spike_threshold / spike_window_seconds
+
+        # lead_id -> (tokens, spike tokens, last refill), in time.monotonic()
+        self._buckets: Dict[str, tuple[float, float, float]] = {}
+        self._bans: Dict[str, tuple[float, str]] = {}  # lead_id -> (ban_until, reason)
+        self._checks_since_sweep = 0
+
+    def _refill(self, lead_id: str, now: float) -> tuple[float, float]:
+        """Current (tokens, spike tokens) for a lead, refilled up to now."""
+        bucket = self._buckets.get(lead_id)
+        if bucket is None:
+            return float(self.max_requests), float(self.spike_threshold)
+
+        tokens, spike_tokens, last = bucket
+        elapsed = now - last
+        return (
+            min(self.max_requests, tokens + elapsed * self._refill_rate),
+            min(self.spike_threshold, spike_tokens + elapsed * self._spike_refill_rate),
+        )
+
+    async def check_rate_limit(self, lead_id: str) -> RateLimitResult:
+        """
+        Check if lead has exceeded rate limit.
+
+        Takes one token if available; each request also drains one token
+        from the spike bucket.
+
+        Args:
+            lead_id: Lead identifier
+
+        Returns:
+            Rate limit result
+        """
+        lead_id = sys.intern(lead_id)
+        now = time.monotonic()
+
+        self._checks_since_sweep += 1
+        if self._checks_since_sweep >= self.SWEEP_INTERVAL:
+            self._sweep(now)
+
+        tokens, spike_tokens = self._refill(lead_id, now)
+
+        if tokens < 1:
+            # Rate limit exceeded
+            self._buckets[lead_id] = (tokens, spike_tokens, now)
+            retry_in = (1 - tokens) / self._refill_rate
+
+            return RateLimitResult(
+                allowed=False,
+                remaining=0,
+                reset_at=_wall_clock_in(retry_in),
+                retry_after=max(int(retry_in), 1),
+                reason=f"Rate limit exceeded: {self.max_requests} requests per {self.window_seconds}s"
+            )
+
+        tokens -= 1
+        self._buckets[lead_id] = (tokens, max(spike_tokens - 1, 0.0), now)
+
+        return RateLimitResult(
+            allowed=True,
+            remaining=int(tokens),
+            reset_at=_wall_clock_in((self.max_requests - tokens) / self._refill_rate)
+        )
+
+    def _sweep(self, now: float) -> None:
+        """Drop leads whose buckets have refilled completely and expired bans."""
+        self._checks_since_sweep = 0
+
+        full_buckets = [
+            lead_id for lead_id in self._buckets
+            if self._refill(lead_id, now) == (self.max_requests, self.spike_threshold)
+        ]
+        for lead_id in full_buckets:
+            del self._buckets[lead_id]
+
+        expired_bans = [
+            lead_id for lead_id, (ban_until, _) in self._bans.items()
+            if ban_until < now
+        ]
+        for lead_id in expired_bans:
+            del self._bans[lead_id]
+
+    async def is_banned(self, lead_id: str) -> bool:
+        """
+        Check if lead is temporarily banned.
+
+        Args:
+            lead_id: Lead identifier
+
+        Returns:
+            True if banned, False otherwise
+        """
+        ban = self._bans.get(lead_id)
+        if ban is None:
+            return False
+
+        if time.monotonic() > ban[0]:
+            # Ban expired
+            del self._bans[lead_id]
+            return False
+
+        return True
+
+    async def ban_lead(self, lead_id: str, duration_seconds: int, reason: str) -> None:
+        """
+        Temporarily ban a lead.
+
+        Args:
+            lead_id: Lead identifier
+            duration_seconds: Ban duration
+            reason: Reason for ban
+        """
+        self._bans[sys.intern(lead_id)] = (time.monotonic() + duration_seconds, reason)
+
+        logger.warning(
+            f"Lead {lead_id} banned",
+            extra={
+                "lead_id": lead_id,
+                "ban_until": _wall_clock_in(duration_seconds).isoformat(),
+                "reason": reason
+            }
+        )
+
+    async def get_ban_info(self, lead_id: str) -> Optional[tuple[datetime, str]]:
+        """
+        Get ban information for a lead.
+
+        Args:
+            lead_id: Lead identifier
+
+        Returns:
+            Tuple of (ban_until, reason) or None if not banned
+        """
+        ban = self._bans.get(lead_id)
+        if ban is None:
+            return None
+
+        ban_until, reason = ban
+        remaining = ban_until - time.monotonic()
+        if remaining < 0:
+            del self._bans[lead_id]
+            return None
+
+        return (_wall_clock_in(remaining), reason)
+
+    async def detect_spike(self, lead_id: str) -> bool:
+        """
+        Detect sudden spike in message frequency.
+
+        A spike is detected when the lead's spike bucket is empty, i.e.
+        roughly spike_threshold requests within spike_window_seconds.
+
+        Args:
+            lead_id: Lead identifier
+
+        Returns:
+            True if spike detected, False otherwise
+        """
+        _, spike_tokens = self._refill(lead_id, time.monotonic())
+        spike_detected = spike_tokens < 1
+
+        if spike_detected:
+            logger.warning(
+                f"Spike detected for lead {lead_id}",
+                extra={
+                    "lead_id": lead_id,
+                    "threshold": self.spike_threshold,
+                    "window_seconds": self.spike_window_seconds
+                }
+            )
+
+        return spike_detected
+
+
+class TokenBucket:
+    """
+    Client-side token bucket that smooths bursts to a steady request rate.
+
+    Used in front of provider APIs (OpenAI, Twilio) so bursts are paced
+    locally instead of being rejected with 429s. The lock only guards the
+    refill arithmetic; waiting happens outside it so other callers are
+    never blocked behind a sleeping one.
+    """
+
+    __slots__ = ("_tokens", "_rate", "_cap", "_last", "_lock")
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        """
+        Initialize token bucket.
+
+        Args:
+            rate: Tokens added per second (steady-state requests per second)
+            capacity: Maximum burst size (defaults to one second of tokens)
+        """
+        self._rate = rate
+        self._cap = capacity if capacity is not None else max(1.0, rate)
+        self._tokens = self._cap
+        self._last = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        """Add tokens accrued since the last refill, up to capacity."""
+        now = time.monotonic()
+        self._tokens = min(self._cap, self._tokens + (now - self._last) * self._rate)
+        self._last = now
+
+    async def acquire(self) -> None:
+        """Wait until a token is available and consume it."""
+        while True:
+            async with self._lock:
+                self._refill()
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self._rate
+            # Sleep with the lock released so other callers can refill/acquire
+            await asyncio.sleep(wait)
+
+
+# Global provider buckets
+_openai_bucket: Optional[TokenBucket] = None
+_twilio_bucket: Optional[TokenBucket] = None
+
+
+def get_openai_bucket() -> TokenBucket:
+    """Get or create the token bucket pacing OpenAI requests."""
+    global _openai_bucket
+    if _openai_bucket is None:
+        _openai_bucket = TokenBucket(get_settings().openai_requests_per_second)
+    return _openai_bucket
+
+
+def get_twilio_bucket() -> TokenBucket:
+    """Get or create the token bucket pacing Twilio sends."""
+    global _twilio_bucket
+    if _twilio_bucket is None:
+        _twilio_bucket = TokenBucket(get_settings().twilio_messages_per_second)
+    return _twilio_bucket
@@ -3,12 +3,130 @@ Security Validation Layer
 Pre-pipeline defense against malicious inputs, prompt injection, and abuse.
 """
 import re
+from collections import Counter
 from dataclasses import dataclass
-from typing import Optional, List
+from functools import lru_cache
+from typing import Optional, List, Tuple
 from enum import StrEnum
 from loguru import logger
 
 
+# Characters that end a literal run when scanning a pattern
+_REGEX_META = frozenset(".^$*+?{}[]()|\\")
+_QUANTIFIERS = frozenset("*+?{")
+# Shorter prefixes match too many messages to be worth checking first
+_MIN_LITERAL_LENGTH = 3
+
+# Maps each digit to the digit sum of its double, for the Luhn checksum
+_LUHN_DOUBLED = str.maketrans("0123456789", "0246813579")
+_CARD_LENGTHS = frozenset({13, 14, 15, 16, 19})
+
+# Letters IGNORECASE matches to an ASCII letter that casefold() leaves
+# alone ("ı") or expands ("İ" becomes "i" plus a combining dot)
+_DOTTED_I_FOLDS = str.maketrans({"İ": "i", "ı": "i"})
+
+
+def _fold_case(message: str) -> str:
+    """
+    Case-fold a message for matching against the lowercase patterns.
+
+    Every character IGNORECASE would match to an ASCII letter ends up as
+    that letter, so "ſystem:" and "jaılbreak" are caught as "system:" and
+    "jailbreak". str.lower() alone misses "ſ", "ı", "İ".
+
+    Args:
+        message: Message content
+
+    Returns:
+        Case-folded message
+    """
+    return message.translate(_DOTTED_I_FOLDS).casefold()
+
+
+def _literal_prefix(pattern: str) -> Optional[str]:
+    """
+    Extract the literal text every match of a pattern must start with.
+
+    Args:
+        pattern: Regular expression source
+
+    Returns:
+        Lowercased literal prefix, or None if it is shorter than
+        _MIN_LITERAL_LENGTH
+    """
+    if pattern.startswith(r"\b"):
+        pattern = pattern[2:]
+
+    literal = []
+    i = 0
+    while i < len(pattern):
+        char = pattern[i]
+        if char == "\\":
+            escaped = pattern[i + 1:i + 2]
+            if not escaped or escaped.isalnum():
+                break  # Character class such as \s or \d
+            char = escaped
+            i += 2
+        elif char in _REGEX_META:
+            break
+        else:
+            i += 1
+
+        if pattern[i:i + 1] in _QUANTIFIERS:
+            break  # Optional or repeated, so not required
+        literal.append(char)
+
+    prefix = "".join(literal).lower()
+    return prefix if len(prefix) >= _MIN_LITERAL_LENGTH else None
+
+
+class _PatternSet:
+    """
+    One category of detection patterns, searched one pattern at a time.
+
+    Patterns are written in lowercase and compiled without IGNORECASE so
+    they can run on the case-folded message (see _fold_case): sre only uses
+    its fast literal-prefix scan for a case-sensitive pattern, and never for
+    an alternation of several. A pattern is skipped outright when its literal
+    prefix is absent, and the whole category when none of its listed
+    literals occur.
+    """
+
+    def __init__(
+        self,
+        patterns: Tuple[str, ...],
+        literals: Optional[Tuple[str, ...]] = None
+    ):
+        self.patterns = patterns
+        self.literals = literals
+        self._gated = tuple(
+            (_literal_prefix(pattern), re.compile(pattern)) for pattern in patterns
+        )
+
+    def search(self, text: str, message_folded: str) -> Optional[str]:
+        """
+        Search text for any pattern in the category.
+
+        Args:
+            text: Text the patterns are matched against
+            message_folded: Case-folded message used for the literal checks
+
+        Returns:
+            Source of the first matching pattern, or None if nothing matched
+        """
+        if self.literals is not None and not any(
+            literal in message_folded for literal in self.literals
+        ):
+            return None
+
+        for prefix, regex in self._gated:
+            if prefix is not None and prefix not in message_folded:
+                continue
+            if regex.search(text):
+                return regex.pattern
+        return None
+
+
 class ThreatType(StrEnum):
     """Types of security threats detected."""
     PROMPT_INJECTION = "prompt_injection"
@@ -19,7 +137,7 @@ class ThreatType(StrEnum):
     SUSPICIOUS_PATTERN = "suspicious_pattern"
 
 
-@dataclass
+@dataclass(frozen=True)
 class SecurityThreat:
     """Represents a detected security threat."""
     threat_type: ThreatType
@@ -29,12 +147,17 @@ class SecurityThreat:
     recommended_action: str = "block"  # "block", "sanitize", "warn"
 
 
-@dataclass
+@dataclass(frozen=True)
 class ValidationResult:
-    """Result of security validation."""
+    """
+    Result of security validation.
+
+    Immutable, since results are cached and shared by every caller that
+    sends the same message text.
+    """
     is_safe: bool
     sanitized_message: str
-    threats: List[SecurityThreat]
+    threats: Tuple[SecurityThreat, ...]
 
     @property
     def has_critical_threats(self) -> bool:
@@ -65,8 +188,11 @@ class SecurityValidator:
         ...     # Reject message
     """
 
+    # Detection patterns are lowercase and, except for command injection,
+    # matched against the case-folded message
+
     # Prompt injection patterns
-    JAILBREAK_PATTERNS = [
+    JAILBREAK_PATTERNS = (
         r"ignore\s+(all\s+)?previous\s+instructions?",
         r"ignore\s+above",
         r"disregard\s+(all\s+)?previous",
@@ -76,7 +202,7 @@ class SecurityValidator:
         r"system\s*:\s*",
         r"admin\s+mode",
         r"developer\s+mode",
-        r"DAN\s+mode",
+        r"dan\s+mode",
         r"jailbreak",
         r"pretend\s+you\s+are",
         r"act\s+as\s+(if\s+)?(a|an)",
@@ -85,33 +211,33 @@ class SecurityValidator:
         r"</\s*system\s*>",
         r"\[\s*system\s*\]",
         r"override\s+instructions?",
-    ]
+    )
 
     # Delimiter injection attempts
-    DELIMITER_PATTERNS = [
+    DELIMITER_PATTERNS = (
         r"```python",
         r"```javascript",
         r"```bash",
         r"<\|im_start\|>",
         r"<\|im_end\|>",
-        r"###\s*Instruction",
-        r"###\s*Response",
-    ]
+        r"###\s*instruction",
+        r"###\s*response",
+    )
 
     # SQL injection patterns
-    SQL_INJECTION_PATTERNS = [
-        r"'\s*OR\s+'?1'?\s*=\s*'?1",
-        r";\s*DROP\s+TABLE",
-        r";\s*DELETE\s+FROM",
-        r"UNION\s+SELECT",
+    SQL_INJECTION_PATTERNS = (
+        r"'\s*or\s+'?1'?\s*=\s*'?1",
+        r";\s*drop\s+table",
+        r";\s*delete\s+from",
+        r"union\s+select",
         r"exec\s*\(",
         r"execute\s*\(",
         r"--\s*$",
         r"xp_cmdshell",
-    ]
+    )
 
     # XSS patterns
-    XSS_PATTERNS = [
+    XSS_PATTERNS = (
         r"<script[^>]*>",
         r"javascript\s*:",
         r"onerror\s*=",
@@ -119,42 +245,91 @@ class SecurityValidator:
         r"onclick\s*=",
         r"<iframe",
         r"eval\s*\(",
-    ]
+    )
 
-    # Command injection patterns
-    COMMAND_INJECTION_PATTERNS = [
+    # Command injection patterns, matched case-sensitively
+    COMMAND_INJECTION_PATTERNS = (
         r";\s*rm\s+-rf",
         r";\s*cat\s+/etc/passwd",
         r"\|\s*bash",
         r"&\s*curl",
         r"`.*`",  # Backtick command substitution
-        r"\$\(.*\)",  # Command substitution
-    ]
+        # Command substitution: "$(" followed by ")" on the same line. The
+        # atomic group pins the first "$(" of each line, so a run of unclosed
+        # "$(" is scanned once rather than once per occurrence.
+        r"(?m:^(?>[^\n]*?\$\()[^\n]*\))",
+    )
+    # Every command injection match contains one of these
+    COMMAND_INJECTION_LITERALS = (";", "|", "&", "`", "$(")
 
     # Basic profanity list
-    PROFANITY_WORDS = [
+    PROFANITY_WORDS = (
         "fuck", "shit", "bitch", "asshole", "cunt", "damn",
         "piss", "bastard", "slut", "whore", "dick", "cock"
-    ]
+    )
+    # A whole word from the list; the first match is the first profane word
+    _PROFANITY_PATTERN = re.compile(
+        r"\b(?:%s)\b" % "|".join(re.escape(word) for word in PROFANITY_WORDS)
+    )
 
     # Hate speech indicators
-    HATE_SPEECH_PATTERNS = [
+    HATE_SPEECH_PATTERNS = (
         r"\bn[i1]gg[ea]r",
         r"\bf[a@]gg[o0]t",
         r"\bk[i1]ke",
         r"\bretard",
-    ]
+    )
+    # Lowercase substrings every hate speech match contains, covering the
+    # leetspeak variants the patterns accept
+    HATE_SPEECH_LITERALS = (
+        "gger", "ggar", "ggot", "gg0t", "kike", "k1ke", "retard",
+    )
 
     # PII patterns
     CREDIT_CARD_PATTERN = re.compile(r'\b\d{4}[\s-]?\d{4}[\s-]?\d{4}[\s-]?\d{4}\b')
     SSN_PATTERN = re.compile(r'\b\d{3}[-\s]?\d{2}[-\s]?\d{4}\b')
     EMAIL_PATTERN = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+    CARD_SEPARATOR_PATTERN = re.compile(r'[\s-]')
+
+    # All PII patterns in one pass, earliest match wins
+    PII_PATTERN = re.compile(
+        f"(?P<card>{CREDIT_CARD_PATTERN.pattern})"
+        f"|(?P<ssn>{SSN_PATTERN.pattern})"
+        f"|(?P<email>{EMAIL_PATTERN.pattern})"
+    )
+    # Every PII match contains a digit or an "@"; cheaper to scan for than
+    # the full pattern, and most chat messages have neither
+    PII_TRIGGER_PATTERN = re.compile(r'[\d@]')
+
+    PII_REDACTIONS = {
+        "card": "[CREDIT_CARD_REDACTED]",
+        "ssn": "[SSN_REDACTED]",
+        "email": "[EMAIL_REDACTED]",
+    }
+
+    _JAILBREAK_SET = _PatternSet(JAILBREAK_PATTERNS)
+    _DELIMITER_SET = _PatternSet(DELIMITER_PATTERNS)
+    _SQL_INJECTION_SET = _PatternSet(SQL_INJECTION_PATTERNS)
+    _XSS_SET = _PatternSet(XSS_PATTERNS)
+    _COMMAND_INJECTION_SET = _PatternSet(
+        COMMAND_INJECTION_PATTERNS, literals=COMMAND_INJECTION_LITERALS
+    )
+    _HATE_SPEECH_SET = _PatternSet(HATE_SPEECH_PATTERNS, literals=HATE_SPEECH_LITERALS)
+
+    # Results are cached per message text; longer messages are rarely
+    # repeated and would make the cache expensive to hold
+    RESULT_CACHE_SIZE = 4096
+    MAX_CACHED_MESSAGE_LENGTH = 1024
 
     # Context flooding thresholds
     MAX_MESSAGE_LENGTH = 5000  # characters
     MAX_REPEATED_CHARS = 50  # consecutive repeated characters
     MAX_WORD_REPETITION = 10  # same word repeated
 
+    # Shortest message either flooding check can flag: a full character run,
+    # or MAX_WORD_REPETITION + 1 one-character words separated by spaces
+    MIN_FLOODING_LENGTH = min(MAX_REPEATED_CHARS, 2 * MAX_WORD_REPETITION + 1)
+
     def __init__(self, max_message_length: int = MAX_MESSAGE_LENGTH):
         """
         Initialize security validator.
@@ -163,6 +338,8 @@ class SecurityValidator:
             max_message_length: Maximum allowed message length
         """
         self.max_message_length = max_message_length
+        # Per instance, since results depend on max_message_length
+        self._analyze_cached = lru_cache(maxsize=self.RESULT_CACHE_SIZE)(self._analyze)
         logger.debug("SecurityValidator initialized")
 
     def validate_message(self, message: str, lead_id: str) -> ValidationResult:
@@ -173,22 +350,53 @@ class SecurityValidator:
             message: The incoming message content
             lead_id: Lead identifier (for PII context)
 
+        Returns:
+            ValidationResult with safety assessment and sanitized message
+        """
+        if len(message) <= self.MAX_CACHED_MESSAGE_LENGTH:
+            result = self._analyze_cached(message)
+        else:
+            result = self._analyze(message)
+
+        if result.threats:
+            logger.warning(
+                f"Security threats detected in message from {lead_id}",
+                extra={
+                    "lead_id": lead_id,
+                    "threat_count": len(result.threats),
+                    "threats": [t.threat_type for t in result.threats]
+                }
+            )
+
+        return result
+
+    def _analyze(self, message: str) -> ValidationResult:
+        """
+        Run every detector over a message.
+
+        Depends only on the message text, so results are safe to share
+        between leads.
+
+        Args:
+            message: The incoming message content
+
         Returns:
             ValidationResult with safety assessment and sanitized message
         """
         threats: List[SecurityThreat] = []
-        sanitized = message
+        # Folded once and shared by every detector
+        message_folded = _fold_case(message)
 
         # Check for prompt injection
-        if threat := self.detect_prompt_injection(message):
+        if threat := self.detect_prompt_injection(message, message_folded):
             threats.append(threat)
 
         # Check for context flooding
-        if threat := self.detect_context_flooding(message):
+        if threat := self.detect_context_flooding(message, message_folded):
             threats.append(threat)
 
         # Check for PII and redact
-        has_pii, sanitized = self.detect_and_redact_pii(message, lead_id)
+        has_pii, sanitized = self.detect_and_redact_pii(message)
         if has_pii:
             threats.append(SecurityThreat(
                 threat_type=ThreatType.PII_LEAKAGE,
@@ -198,75 +406,72 @@ class SecurityValidator:
             ))
 
         # Check for profanity
-        if threat := self.detect_profanity(message):
+        if threat := self.detect_profanity(message, message_folded):
             threats.append(threat)
 
         # Check for injection attempts
-        if threat := self.detect_injection_attempts(message):
+        if threat := self.detect_injection_attempts(message, message_folded):
             threats.append(threat)
 
         # Determine if message is safe
         # Block if any threat has recommended_action="block"
         is_safe = not any(t.recommended_action == "block" for t in threats)
 
-        if threats:
-            logger.warning(
-                f"Security threats detected in message from {lead_id}",
-                extra={
-                    "lead_id": lead_id,
-                    "threat_count": len(threats),
-                    "threats": [t.threat_type for t in threats]
-                }
-            )
-
         return ValidationResult(
             is_safe=is_safe,
             sanitized_message=sanitized,
-            threats=threats
+            threats=tuple(threats)
         )
 
-    def detect_prompt_injection(self, message: str) -> Optional[SecurityThreat]:
+    def detect_prompt_injection(
+        self, message: str, message_folded: Optional[str] = None
+    ) -> Optional[SecurityThreat]:
         """
         Detect prompt injection and jailbreak attempts.
 
         Args:
             message: Message content to analyze
+            message_folded: Case-folded message, if the caller already has one
 
         Returns:
             SecurityThreat if injection detected, None otherwise
         """
-        message_lower = message.lower()
+        if message_folded is None:
+            message_folded = _fold_case(message)
 
         # Check jailbreak patterns
-        for pattern in self.JAILBREAK_PATTERNS:
-            if re.search(pattern, message_lower, re.IGNORECASE):
-                return SecurityThreat(
-                    threat_type=ThreatType.PROMPT_INJECTION,
-                    severity="critical",
-                    description="Jailbreak attempt detected",
-                    matched_pattern=pattern,
-                    recommended_action="block"
-                )
+        matched = self._JAILBREAK_SET.search(message_folded, message_folded)
+        if matched:
+            return SecurityThreat(
+                threat_type=ThreatType.PROMPT_INJECTION,
+                severity="critical",
+                description="Jailbreak attempt detected",
+                matched_pattern=matched,
+                recommended_action="block"
+            )
 
         # Check delimiter injection
-        for pattern in self.DELIMITER_PATTERNS:
-            if re.search(pattern, message, re.IGNORECASE):
-                return SecurityThreat(
-                    threat_type=ThreatType.PROMPT_INJECTION,
-                    severity="high",
-                    description="Delimiter injection attempt",
-                    matched_pattern=pattern,
-                    recommended_action="block"
-                )
+        matched = self._DELIMITER_SET.search(message_folded, message_folded)
+        if matched:
+            return SecurityThreat(
+                threat_type=ThreatType.PROMPT_INJECTION,
+                severity="high",
+                description="Delimiter injection attempt",
+                matched_pattern=matched,
+                recommended_action="block"
+            )
 
         return None
 
-    def detect_context_flooding(self, message: str) -> Optional[SecurityThreat]:
+    def detect_context_flooding(
+        self, message: str, message_folded: Optional[str] = None
+    ) -> Optional[SecurityThreat]:
         """
         Detect context window flooding attacks.
 
         Args:
             message: Message content to analyze
+            message_folded: Case-folded message, if the caller already has one
 
         Returns:
             SecurityThreat if flooding detected, None otherwise
@@ -280,23 +485,26 @@ class SecurityValidator:
                 recommended_action="block"
             )
 
+        # Short messages can't hold a run or a repeated word; skip the scans
+        if len(message) < self.MIN_FLOODING_LENGTH:
+            return None
+
         # Check for repeated characters (e.g., "aaaaaaaaaa...")
-        for char in set(message):
-            if char * self.MAX_REPEATED_CHARS in message:
-                return SecurityThreat(
-                    threat_type=ThreatType.CONTEXT_FLOODING,
-                    severity="medium",
-                    description="Repeated character spam detected",
-                    matched_pattern=char * self.MAX_REPEATED_CHARS,
-                    recommended_action="block"
-                )
+        if run := self._find_repeated_run(message):
+            return SecurityThreat(
+                threat_type=ThreatType.CONTEXT_FLOODING,
+                severity="medium",
+                description="Repeated character spam detected",
+                matched_pattern=run,
+                recommended_action="block"
+            )
 
         # Check for word repetition
-        words = message.lower().split()
-        if words:
-            from collections import Counter
-            word_counts = Counter(words)
-            max_count = max(word_counts.values())
+        if message_folded is None:
+            message_folded = _fold_case(message)
+        words = message_folded.split()
+        if len(words) > self.MAX_WORD_REPETITION:
+            max_count = max(Counter(words).values())
             if max_count > self.MAX_WORD_REPETITION:
                 return SecurityThreat(
                     threat_type=ThreatType.CONTEXT_FLOODING,
@@ -307,7 +515,30 @@ class SecurityValidator:
 
         return None
 
-    def detect_and_redact_pii(self, message: str, lead_id: str) -> tuple[bool, str]:
+    def _find_repeated_run(self, message: str) -> Optional[str]:
+        """
+        Find a run of MAX_REPEATED_CHARS identical characters.
+
+        Any such run covers a position that is a multiple of the run length,
+        so only the characters at those positions are candidates. Each is
+        checked with a C-level substring search.
+
+        Args:
+            message: Message content to analyze
+
+        Returns:
+            The repeated run if found, None otherwise
+        """
+        length = self.MAX_REPEATED_CHARS
+        for char in dict.fromkeys(message[::length]):
+            run = char * length
+            if run in message:
+                return run
+        return None
+
+    def detect_and_redact_pii(
+        self, message: str, lead_id: Optional[str] = None
+    ) -> tuple[bool, str]:
         """
         Detect and redact PII from message.
 
@@ -318,109 +549,112 @@ class SecurityValidator:
         Returns:
             Tuple of (has_pii: bool, sanitized_message: str)
         """
+        if not self.PII_TRIGGER_PATTERN.search(message):
+            return False, message
+
         has_pii = False
-        sanitized = message
-
-        # Redact credit card numbers
-        if self.CREDIT_CARD_PATTERN.search(sanitized):
-            # Validate with Luhn algorithm
-            potential_cards = self.CREDIT_CARD_PATTERN.findall(sanitized)
-            for card in potential_cards:
-                card_digits = re.sub(r'[\s-]', '', card)
-                if self._is_valid_credit_card(card_digits):
-                    sanitized = sanitized.replace(card, "[CREDIT_CARD_REDACTED]")
-                    has_pii = True
-
-        # Redact SSNs
-        if self.SSN_PATTERN.search(sanitized):
-            sanitized = self.SSN_PATTERN.sub("[SSN_REDACTED]", sanitized)
-            has_pii = True
 
-        # Redact emails
-        if self.EMAIL_PATTERN.search(sanitized):
-            sanitized = self.EMAIL_PATTERN.sub("[EMAIL_REDACTED]", sanitized)
+        def redact(match: re.Match) -> str:
+            nonlocal has_pii
+            kind = match.lastgroup
+            # Only redact card-shaped numbers that pass the Luhn check
+            if kind == "card" and not self._is_valid_credit_card(
+                self.CARD_SEPARATOR_PATTERN.sub('', match.group())
+            ):
+                return match.group()
             has_pii = True
+            return self.PII_REDACTIONS[kind]
+
+        sanitized = self.PII_PATTERN.sub(redact, message)
 
         return has_pii, sanitized
 
-    def detect_profanity(self, message: str) -> Optional[SecurityThreat]:
+    def detect_profanity(
+        self, message: str, message_folded: Optional[str] = None
+    ) -> Optional[SecurityThreat]:
         """
         Detect profanity and hate speech.
 
         Args:
             message: Message content to analyze
+            message_folded: Case-folded message, if the caller already has one
 
         Returns:
             SecurityThreat if profanity detected, None otherwise
         """
-        message_lower = message.lower()
+        if message_folded is None:
+            message_folded = _fold_case(message)
 
         # Check hate speech patterns first (higher severity)
-        for pattern in self.HATE_SPEECH_PATTERNS:
-            if re.search(pattern, message_lower, re.IGNORECASE):
-                return SecurityThreat(
-                    threat_type=ThreatType.PROFANITY,
-                    severity="critical",
-                    description="Hate speech detected",
-                    recommended_action="block"
-                )
+        matched = self._HATE_SPEECH_SET.search(message_folded, message_folded)
+        if matched:
+            return SecurityThreat(
+                threat_type=ThreatType.PROFANITY,
+                severity="critical",
+                description="Hate speech detected",
+                recommended_action="block"
+            )
 
-        # Check basic profanity
-        words = re.findall(r'\b\w+\b', message_lower)
-        for word in words:
-            if word in self.PROFANITY_WORDS:
-                return SecurityThreat(
-                    threat_type=ThreatType.PROFANITY,
-                    severity="low",
-                    description="Profanity detected",
-                    matched_pattern=word,
-                    recommended_action="warn"
-                )
+        # Check basic profanity, stopping at the first profane word
+        if match := self._PROFANITY_PATTERN.search(message_folded):
+            return SecurityThreat(
+                threat_type=ThreatType.PROFANITY,
+                severity="low",
+                description="Profanity detected",
+                matched_pattern=match.group(),
+                recommended_action="warn"
+            )
 
         return None
 
-    def detect_injection_attempts(self, message: str) -> Optional[SecurityThreat]:
+    def detect_injection_attempts(
+        self, message: str, message_folded: Optional[str] = None
+    ) -> Optional[SecurityThreat]:
         """
         Detect SQL injection, XSS, and command injection attempts.
 
         Args:
             message: Message content to analyze
+            message_folded: Case-folded message, if the caller already has one
 
         Returns:
             SecurityThreat if injection attempt detected, None otherwise
         """
+        if message_folded is None:
+            message_folded = _fold_case(message)
+
         # Check SQL injection
-        for pattern in self.SQL_INJECTION_PATTERNS:
-            if re.search(pattern, message, re.IGNORECASE):
-                return SecurityThreat(
-                    threat_type=ThreatType.INJECTION_ATTEMPT,
-                    severity="high",
-                    description="SQL injection attempt detected",
-                    matched_pattern=pattern,
-                    recommended_action="block"
-                )
+        matched = self._SQL_INJECTION_SET.search(message_folded, message_folded)
+        if matched:
+            return SecurityThreat(
+                threat_type=ThreatType.INJECTION_ATTEMPT,
+                severity="high",
+                description="SQL injection attempt detected",
+                matched_pattern=matched,
+                recommended_action="block"
+            )
 
         # Check XSS
-        for pattern in self.XSS_PATTERNS:
-            if re.search(pattern, message, re.IGNORECASE):
-                return SecurityThreat(
-                    threat_type=ThreatType.INJECTION_ATTEMPT,
-                    severity="high",
-                    description="XSS attempt detected",
-                    matched_pattern=pattern,
-                    recommended_action="block"
-                )
+        matched = self._XSS_SET.search(message_folded, message_folded)
+        if matched:
+            return SecurityThreat(
+                threat_type=ThreatType.INJECTION_ATTEMPT,
+                severity="high",
+                description="XSS attempt detected",
+                matched_pattern=matched,
+                recommended_action="block"
+            )
 
         # Check command injection
-        for pattern in self.COMMAND_INJECTION_PATTERNS:
-            if re.search(pattern, message):
-                return SecurityThreat(
-                    threat_type=ThreatType.INJECTION_ATTEMPT,
-                    severity="critical",
-                    description="Command injection attempt detected",
-                    matched_pattern=pattern,
-                    recommended_action="block"
-                )
+        matched = self._COMMAND_INJECTION_SET.search(message, message_folded)
+        if matched:
+            return SecurityThreat(
+                threat_type=ThreatType.INJECTION_ATTEMPT,
+                severity="critical",
+                description="Command injection attempt detected",
+                matched_pattern=matched,
+                recommended_action="block"
+            )
 
         return None
 
@@ -435,20 +669,15 @@ class SecurityValidator:
         Returns:
             True if valid credit card number
         """
-        if not card_number.isdigit() or len(card_number) not in [13, 14, 15, 16, 19]:
+        if not card_number.isdigit() or len(card_number) not in _CARD_LENGTHS:
             return False
-
-        # Luhn algorithm
-        def luhn_checksum(card):
-            def digits_of(n):
-                return [int(d) for d in str(n)]
-
-            digits = digits_of(card)
-            odd_digits = digits[-1::-2]
-            even_digits = digits[-2::-2]
-            checksum = sum(odd_digits)
-            for d in even_digits:
-                checksum += sum(digits_of(d * 2))
-            return checksum % 10
-
-        return luhn_checksum(card_number) == 0
+        if not card_number.isascii():
+            # Digits from other scripts also match \d; map them to ASCII
+            card_number = "".join(str(int(char)) for char in card_number)
+
+        # Luhn algorithm: double every second digit from the right. Summing
+        # the ASCII bytes keeps the loop in C; each digit adds 48 ("0").
+        kept = card_number[-1::-2]
+        doubled = card_number[-2::-2].translate(_LUHN_DOUBLED)
+        checksum = sum(kept.encode()) + sum(doubled.encode()) - 48 * len(card_number)
+        return checksum % 10 == 0
@@ -6,7 +6,6 @@ to prevent unauthorized requests and replay attacks.
 """
 
 import hmac
-import hashlib
 import base64
 from typing import Dict
 from loguru import logger
@@ -30,6 +29,8 @@ class TwilioSignatureValidator:
             auth_token: Twilio auth token from account settings
         """
         self.auth_token = auth_token
+        # Encoded once instead of on every request
+        self._auth_token_bytes = auth_token.encode('utf-8')
 
     def validate(
         self,
@@ -76,22 +77,16 @@ class TwilioSignatureValidator:
         Returns:
             Base64-encoded HMAC-SHA256 signature
         """
-        # Start with the full URL
-        data = url
+        # Full URL followed by each parameter name and value, sorted by name.
+        # Keys are unique, so sorting items only ever compares keys.
+        data = "".join([url, *(key + value for key, value in sorted(params.items()))])
 
-        # Append parameters in sorted order
-        for key in sorted(params.keys()):
-            data += key + params[key]
-
-        # Compute HMAC-SHA256
-        mac = hmac.new(
-            self.auth_token.encode('utf-8'),
-            data.encode('utf-8'),
-            hashlib.sha256
-        )
+        # One-shot HMAC-SHA256; webhook payloads are small enough that this
+        # beats building an HMAC object and streaming fragments into it
+        digest = hmac.digest(self._auth_token_bytes, data.encode('utf-8'), 'sha256')
 
         # Return base64-encoded signature
-        return base64.b64encode(mac.digest()).decode('utf-8')
+        return base64.b64encode(digest).decode('ascii')
 
 
 def validate_twilio_signature(
@@ -0,0 +1,34 @@
+"""
+Shared fixtures for API tests.
+"""
+import httpx
+import pytest
+import pytest_asyncio
+from fastapi.testclient import TestClient
+
+from src.api.main import app
+
+
+@pytest.fixture(scope="session")
+def client():
+    """Create one test client for the whole session."""
+    return TestClient(app)
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def async_client():
+    """Create one in-process async client for async tests, without TestClient's thread portal."""
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app),
+        base_url="http://testserver"
+    ) as async_client:
+        yield async_client
+
+
+@pytest.fixture(autouse=True)
+def restore_app_state():
+    """Restore app.state after each test so the shared client stays isolated."""
+    saved = dict(app.state._state)
+    yield
+    app.state._state.clear()
+    app.state._state.update(saved)
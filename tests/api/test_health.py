@@ -2,18 +2,11 @@
 Tests for health and readiness endpoints.
 """
 import pytest
-from fastapi.testclient import TestClient
-from unittest.mock import MagicMock, AsyncMock, patch
+from unittest.mock import MagicMock, AsyncMock
 
 from src.api.main import app
 
 
-@pytest.fixture
-def client():
-    """Create test client."""
-    return TestClient(app)
-
-
 @pytest.fixture
 def mock_orchestrator():
     """Create mock orchestrator with repositories."""
@@ -23,6 +16,15 @@ def mock_orchestrator():
     return orchestrator
 
 
+@pytest.fixture
+def patched_db(monkeypatch):
+    """Replace the health route's db_manager with a fake MongoDB client."""
+    fake_db = MagicMock()
+    fake_db.client.admin.command = AsyncMock(return_value={"ok": 1})
+    monkeypatch.setattr("src.api.routes.health.db_manager", fake_db)
+    return fake_db
+
+
 class TestHealthEndpoint:
     """Tests for /health endpoint."""
 
@@ -48,29 +50,20 @@ class TestReadinessEndpoint:
     """Tests for /ready endpoint."""
 
     @pytest.mark.asyncio
-    async def test_ready_when_initialized(self, client, mock_orchestrator):
+    async def test_ready_when_initialized(self, async_client, mock_orchestrator, patched_db):
         """Ready endpoint returns 200 when orchestrator is initialized."""
         app.state.orchestrator = mock_orchestrator
 
-        # Mock the db_manager module's client attribute
-        mock_client = MagicMock()
-        mock_admin = MagicMock()
-        mock_admin.command = AsyncMock(return_value={"ok": 1})
-        mock_client.admin = mock_admin
-
-        with patch("src.api.routes.health.db_manager") as mock_db:
-            mock_db.client = mock_client
-
-            response = client.get("/ready")
+        response = await async_client.get("/ready")
 
-            assert response.status_code == 200
-            data = response.json()
-            assert data["status"] == "ready"
-            assert data["mongodb"] == "connected"
-            assert data["orchestrator"] == "initialized"
+        assert response.status_code == 200
+        data = response.json()
+        assert data["status"] == "ready"
+        assert data["mongodb"] == "connected"
+        assert data["orchestrator"] == "initialized"
 
     @pytest.mark.asyncio
-    async def test_ready_fails_when_repos_not_initialized(self, client):
+    async def test_ready_fails_when_repos_not_initialized(self, async_client):
         """Ready endpoint returns 503 when repositories not initialized."""
         incomplete_orchestrator = MagicMock()
         incomplete_orchestrator.lead_repo = None
@@ -78,7 +71,7 @@ class TestReadinessEndpoint:
 
         app.state.orchestrator = incomplete_orchestrator
 
-        response = client.get("/ready")
+        response = await async_client.get("/ready")
 
         assert response.status_code == 503
         data = response.json()
@@ -86,23 +79,16 @@ class TestReadinessEndpoint:
         assert "Repositories not initialized" in data["reason"]
 
     @pytest.mark.asyncio
-    async def test_ready_fails_when_mongodb_down(self, client, mock_orchestrator):
+    async def test_ready_fails_when_mongodb_down(self, async_client, mock_orchestrator, patched_db):
         """Ready endpoint returns 503 when MongoDB is not reachable."""
         app.state.orchestrator = mock_orchestrator
+        patched_db.client.admin.command.side_effect = Exception("Connection refused")
 
-        mock_client = MagicMock()
-        mock_admin = MagicMock()
-        mock_admin.command = AsyncMock(side_effect=Exception("Connection refused"))
-        mock_client.admin = mock_admin
-
-        with patch("src.api.routes.health.db_manager") as mock_db:
-            mock_db.client = mock_client
-
-            response = client.get("/ready")
+        response = await async_client.get("/ready")
 
-            assert response.status_code == 503
-            data = response.json()
-            assert data["status"] == "not_ready"
+        assert response.status_code == 503
+        data = response.json()
+        assert data["status"] == "not_ready"
 
 
 class TestRootEndpoint:
@@ -2,19 +2,12 @@
 Tests for metrics endpoints.
 """
 import pytest
-from fastapi.testclient import TestClient
 from unittest.mock import AsyncMock, MagicMock
 
 from src.api.main import app
 from src.message_queue import QueueMetrics
 
 
-@pytest.fixture
-def client():
-    """Create test client."""
-    return TestClient(app)
-
-
 @pytest.fixture
 def mock_queue_with_metrics():
     """Create mock queue with realistic metrics."""
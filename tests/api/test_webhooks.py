@@ -2,11 +2,12 @@
 Tests for Twilio webhook endpoints.
 """
 import pytest
-from fastapi.testclient import TestClient
+from datetime import datetime, timezone
 from unittest.mock import AsyncMock, patch, MagicMock
 
 from src.api.main import app
 from src.config import settings
+from src.utils.rate_limiter import RateLimitResult
 
 
 @pytest.fixture(autouse=True)
@@ -15,12 +16,6 @@ def disable_signature_validation(monkeypatch):
     monkeypatch.setattr(settings, "twilio_validate_signature", False)
 
 
-@pytest.fixture
-def client():
-    """Create test client."""
-    return TestClient(app)
-
-
 @pytest.fixture
 def mock_message_buffer():
     """Create mock message buffer."""
@@ -37,24 +32,23 @@ def mock_message_buffer():
 @pytest.fixture
 def mock_rate_limiter():
     """Create mock rate limiter that allows all requests."""
-    from datetime import datetime, timezone
-
     rate_limiter = MagicMock()
-    rate_limiter.is_banned = AsyncMock(return_value=False)
-    rate_limiter.check_rate_limit = AsyncMock(return_value=MagicMock(
-        allowed=True,
-        remaining=9,
-        reset_at=datetime.now(timezone.utc),
-        retry_after=0,
-        reason=None
+    rate_limiter.check_and_detect = AsyncMock(return_value=(
+        RateLimitResult(
+            allowed=True,
+            remaining=9,
+            reset_at=datetime.now(timezone.utc),
+            retry_after=0,
+            reason=None
+        ),
+        False
     ))
-    rate_limiter.detect_spike = AsyncMock(return_value=False)
     return rate_limiter
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def valid_twilio_payload():
-    """Create valid Twilio webhook payload."""
+    """Create valid Twilio webhook payload (read-only, shared by all tests)."""
     return {
         "MessageSid": "SM1234567890abcdef",
         "AccountSid": "AC1234567890abcdef",
@@ -71,13 +65,13 @@ class TestTwilioWebhook:
 
     @pytest.mark.asyncio
     async def test_webhook_buffers_message(
-        self, client, valid_twilio_payload, mock_message_buffer, mock_rate_limiter
+        self, async_client, valid_twilio_payload, mock_message_buffer, mock_rate_limiter
     ):
         """Test webhook successfully buffers message."""
         app.state.message_buffer = mock_message_buffer
         app.state.rate_limiter = mock_rate_limiter
 
-        response = client.post("/webhooks/twilio", data=valid_twilio_payload)
+        response = await async_client.post("/webhooks/twilio", data=valid_twilio_payload)
 
         assert response.status_code == 200
         assert response.headers["content-type"] == "application/json"
@@ -91,13 +85,13 @@ class TestTwilioWebhook:
 
     @pytest.mark.asyncio
     async def test_webhook_extracts_phone_correctly(
-        self, client, valid_twilio_payload, mock_message_buffer, mock_rate_limiter
+        self, async_client, valid_twilio_payload, mock_message_buffer, mock_rate_limiter
     ):
         """Test that phone number is correctly extracted from WhatsApp format."""
         app.state.message_buffer = mock_message_buffer
         app.state.rate_limiter = mock_rate_limiter
 
-        response = client.post("/webhooks/twilio", data=valid_twilio_payload)
+        response = await async_client.post("/webhooks/twilio", data=valid_twilio_payload)
 
         assert response.status_code == 200
 
@@ -107,13 +101,13 @@ class TestTwilioWebhook:
 
     @pytest.mark.asyncio
     async def test_webhook_uses_profile_name(
-        self, client, valid_twilio_payload, mock_message_buffer, mock_rate_limiter
+        self, async_client, valid_twilio_payload, mock_message_buffer, mock_rate_limiter
     ):
         """Test webhook uses ProfileName from payload."""
         app.state.message_buffer = mock_message_buffer
         app.state.rate_limiter = mock_rate_limiter
 
-        response = client.post("/webhooks/twilio", data=valid_twilio_payload)
+        response = await async_client.post("/webhooks/twilio", data=valid_twilio_payload)
 
         assert response.status_code == 200
 
@@ -122,7 +116,7 @@ class TestTwilioWebhook:
 
     @pytest.mark.asyncio
     async def test_webhook_falls_back_to_phone_for_name(
-        self, client, mock_message_buffer, mock_rate_limiter
+        self, async_client, mock_message_buffer, mock_rate_limiter
     ):
         """Test webhook uses phone number when ProfileName not provided."""
         payload = {
@@ -137,7 +131,7 @@ class TestTwilioWebhook:
         app.state.message_buffer = mock_message_buffer
         app.state.rate_limiter = mock_rate_limiter
 
-        response = client.post("/webhooks/twilio", data=payload)
+        response = await async_client.post("/webhooks/twilio", data=payload)
 
         assert response.status_code == 200
 
@@ -156,7 +150,7 @@ class TestTwilioWebhook:
 
     @pytest.mark.asyncio
     async def test_webhook_handles_buffer_error(
-        self, client, valid_twilio_payload, mock_message_buffer, mock_rate_limiter
+        self, async_client, valid_twilio_payload, mock_message_buffer, mock_rate_limiter
     ):
         """Test webhook handles buffer error gracefully."""
         mock_message_buffer.add = AsyncMock(side_effect=Exception("Buffer error"))
@@ -169,7 +163,7 @@ class TestTwilioWebhook:
         ) as mock_send:
             mock_send.return_value = "SM123456789"
 
-            response = client.post("/webhooks/twilio", data=valid_twilio_payload)
+            response = await async_client.post("/webhooks/twilio", data=valid_twilio_payload)
 
             assert response.status_code == 500
             data = response.json()
@@ -179,13 +173,13 @@ class TestTwilioWebhook:
 
     @pytest.mark.asyncio
     async def test_webhook_includes_rate_limit_headers(
-        self, client, valid_twilio_payload, mock_message_buffer, mock_rate_limiter
+        self, async_client, valid_twilio_payload, mock_message_buffer, mock_rate_limiter
     ):
         """Test webhook includes rate limit headers in response."""
         app.state.message_buffer = mock_message_buffer
         app.state.rate_limiter = mock_rate_limiter
 
-        response = client.post("/webhooks/twilio", data=valid_twilio_payload)
+        response = await async_client.post("/webhooks/twilio", data=valid_twilio_payload)
 
         assert response.status_code == 200
         assert "X-RateLimit-Limit" in response.headers
@@ -198,42 +192,62 @@ class TestRateLimiting:
 
     @pytest.mark.asyncio
     async def test_webhook_rejects_rate_limited_request(
-        self, client, valid_twilio_payload, mock_message_buffer
+        self, async_client, valid_twilio_payload, mock_message_buffer
     ):
         """Test webhook returns 429 when rate limited."""
-        from datetime import datetime, timezone
-
         rate_limiter = MagicMock()
-        rate_limiter.is_banned = AsyncMock(return_value=False)
-        rate_limiter.check_rate_limit = AsyncMock(return_value=MagicMock(
-            allowed=False,
-            remaining=0,
-            reset_at=datetime.now(timezone.utc),
-            retry_after=60,
-            reason="Rate limit exceeded"
+        rate_limiter.check_and_detect = AsyncMock(return_value=(
+            RateLimitResult(
+                allowed=False,
+                remaining=0,
+                reset_at=datetime.now(timezone.utc),
+                retry_after=60,
+                reason="Rate limit exceeded"
+            ),
+            False
         ))
 
         app.state.message_buffer = mock_message_buffer
         app.state.rate_limiter = rate_limiter
 
-        response = client.post("/webhooks/twilio", data=valid_twilio_payload)
+        response = await async_client.post("/webhooks/twilio", data=valid_twilio_payload)
 
         assert response.status_code == 429
         data = response.json()
         assert data["status"] == "rate_limited"
 
+    @pytest.mark.asyncio
+    async def test_spike_check_follows_auto_ban_setting(
+        self, async_client, valid_twilio_payload, mock_message_buffer, mock_rate_limiter, monkeypatch
+    ):
+        """Test spikes are only checked when auto-ban on spike is enabled."""
+        monkeypatch.setattr(settings, "rate_limit_auto_ban_on_spike", False)
+        app.state.message_buffer = mock_message_buffer
+        app.state.rate_limiter = mock_rate_limiter
+
+        response = await async_client.post("/webhooks/twilio", data=valid_twilio_payload)
+
+        assert response.status_code == 200
+        mock_rate_limiter.check_and_detect.assert_called_once_with(
+            "+5215538899800", spike_check=False
+        )
+
     @pytest.mark.asyncio
     async def test_webhook_rejects_banned_lead(
-        self, client, valid_twilio_payload, mock_message_buffer
+        self, async_client, valid_twilio_payload, mock_message_buffer
     ):
         """Test webhook returns 429 for banned leads."""
-        from datetime import datetime, timezone
-
         rate_limiter = MagicMock()
-        rate_limiter.is_banned = AsyncMock(return_value=True)
-        rate_limiter.get_ban_info = AsyncMock(return_value=(
-            datetime.now(timezone.utc),
-            "Abuse detected"
+        rate_limiter.check_and_detect = AsyncMock(return_value=(
+            RateLimitResult(
+                allowed=False,
+                remaining=0,
+                reset_at=datetime.now(timezone.utc),
+                retry_after=60,
+                reason="Abuse detected",
+                banned=True
+            ),
+            False
         ))
 
         app.state.message_buffer = mock_message_buffer
@@ -243,32 +257,20 @@ class TestRateLimiting:
             "src.api.routes.webhooks.twilio_service.send_whatsapp_message",
             new_callable=AsyncMock
         ):
-            response = client.post("/webhooks/twilio", data=valid_twilio_payload)
+            response = await async_client.post("/webhooks/twilio", data=valid_twilio_payload)
 
             assert response.status_code == 429
             data = response.json()
             assert data["status"] == "banned"
+            assert data["reason"] == "Abuse detected"
 
 
 class TestSignatureValidation:
     """Tests for Twilio signature validation."""
 
-    @pytest.fixture
-    def test_payload(self):
-        """Create test Twilio webhook payload."""
-        return {
-            "MessageSid": "SM1234567890abcdef",
-            "AccountSid": "AC1234567890abcdef",
-            "From": "whatsapp:+5215538899800",
-            "To": "whatsapp:+14155238886",
-            "Body": "I need pricing for 20 users",
-            "NumMedia": "0",
-            "ProfileName": "Carlos Rodriguez",
-        }
-
     @pytest.mark.asyncio
     async def test_accepts_valid_signature(
-        self, client, test_payload, mock_message_buffer, mock_rate_limiter, monkeypatch
+        self, async_client, valid_twilio_payload, mock_message_buffer, mock_rate_limiter, monkeypatch
     ):
         """Test webhook accepts request with valid signature."""
         from src.utils.twilio_signature import TwilioSignatureValidator
@@ -278,15 +280,15 @@ class TestSignatureValidation:
 
         validator = TwilioSignatureValidator("test_token")
         url = "http://testserver/webhooks/twilio"
-        params = {k: str(v) for k, v in test_payload.items()}
+        params = {k: str(v) for k, v in valid_twilio_payload.items()}
         valid_signature = validator.compute_signature(url, params)
 
         app.state.message_buffer = mock_message_buffer
         app.state.rate_limiter = mock_rate_limiter
 
-        response = client.post(
+        response = await async_client.post(
             "/webhooks/twilio",
-            data=test_payload,
+            data=valid_twilio_payload,
             headers={"X-Twilio-Signature": valid_signature}
         )
 
@@ -294,15 +296,15 @@ class TestSignatureValidation:
 
     @pytest.mark.asyncio
     async def test_rejects_invalid_signature(
-        self, client, test_payload, monkeypatch
+        self, async_client, valid_twilio_payload, monkeypatch
     ):
         """Test webhook rejects request with invalid signature."""
         monkeypatch.setattr(settings, "twilio_validate_signature", True)
         monkeypatch.setattr(settings, "twilio_auth_token", "test_token")
 
-        response = client.post(
+        response = await async_client.post(
             "/webhooks/twilio",
-            data=test_payload,
+            data=valid_twilio_payload,
             headers={"X-Twilio-Signature": "invalid_signature"}
         )
 
@@ -312,13 +314,13 @@ class TestSignatureValidation:
 
     @pytest.mark.asyncio
     async def test_rejects_missing_signature(
-        self, client, test_payload, monkeypatch
+        self, async_client, valid_twilio_payload, monkeypatch
     ):
         """Test webhook rejects request without signature header."""
         monkeypatch.setattr(settings, "twilio_validate_signature", True)
         monkeypatch.setattr(settings, "twilio_auth_token", "test_token")
 
-        response = client.post("/webhooks/twilio", data=test_payload)
+        response = await async_client.post("/webhooks/twilio", data=valid_twilio_payload)
 
         assert response.status_code == 401
         data = response.json()
@@ -326,15 +328,15 @@ class TestSignatureValidation:
 
     @pytest.mark.asyncio
     async def test_error_when_auth_token_not_configured(
-        self, client, test_payload, monkeypatch
+        self, async_client, valid_twilio_payload, monkeypatch
     ):
         """Test webhook returns 500 if auth token not configured."""
         monkeypatch.setattr(settings, "twilio_validate_signature", True)
         monkeypatch.setattr(settings, "twilio_auth_token", None)
 
-        response = client.post(
+        response = await async_client.post(
             "/webhooks/twilio",
-            data=test_payload,
+            data=valid_twilio_payload,
             headers={"X-Twilio-Signature": "some_signature"}
         )
 
@@ -82,8 +82,7 @@ async def clear_database_collections():
     """
     
     tracker = get_cost_tracker()
-    tracker.hourly_usage.total_cost = 0.0
-    tracker.daily_usage.total_cost = 0.0
+    tracker.reset_windows()
 
     yield
     db = db_manager._database
@@ -359,7 +359,7 @@ class TestConversationOrchestrator:
             result = await orchestrator.process_message(message_content, lead)
 
             # Query messages from database
-            messages = await orchestrator.message_repo.get_conversation_history(
+            messages, _ = await orchestrator.message_repo.get_conversation_history(
                 lead_id="+9876543210",
                 limit=10
             )
@@ -422,7 +422,7 @@ class TestConversationOrchestrator:
             assert final_lead.message_count == 4
 
             # Verify message history in database
-            all_messages = await orchestrator.message_repo.get_conversation_history(
+            all_messages, _ = await orchestrator.message_repo.get_conversation_history(
                 lead_id=phone,
                 limit=10
             )
@@ -486,7 +486,7 @@ class TestConversationOrchestrator:
             assert final_lead.message_count == 6  # 3 incoming + 3 assistant
 
             # Verify all messages in database
-            all_messages = await orchestrator.message_repo.get_conversation_history(
+            all_messages, _ = await orchestrator.message_repo.get_conversation_history(
                 lead_id=phone,
                 limit=20
             )
@@ -132,12 +132,30 @@ class TestDatabaseManager:
 
         # Verify messages indexes
         messages_indexes = await manager.database.messages.index_information()
-        assert "idx_lead_messages" in messages_indexes
+        assert "idx_lead_messages_cursor" in messages_indexes
         assert "idx_timestamp" in messages_indexes
 
         # Cleanup
         await manager.disconnect()
 
+    async def test_create_indexes_drops_superseded_index(self):
+        """create_indexes should drop the old lead messages index."""
+        manager = DatabaseManager()
+        await manager.connect()
+        await manager.database.messages.create_index(
+            [("lead_id", 1), ("timestamp", -1)],
+            name="idx_lead_messages"
+        )
+
+        await manager.create_indexes()
+
+        messages_indexes = await manager.database.messages.index_information()
+        assert "idx_lead_messages" not in messages_indexes
+        assert "idx_lead_messages_cursor" in messages_indexes
+
+        # Cleanup
+        await manager.disconnect()
+
     async def test_get_database_helper(self):
         """get_database helper should return connected database."""
         await db_manager.connect()
@@ -119,12 +119,13 @@ class TestMessageRepositoryConversationQueries:
         """Should retrieve full conversation history for a lead."""
         await message_repo.bulk_create(sample_messages)
 
-        history = await message_repo.get_conversation_history(
+        history, next_cursor = await message_repo.get_conversation_history(
             lead_id=sample_messages[0].lead_id,
             limit=100
         )
 
         assert len(history) == 3
+        assert next_cursor is None
         # Should be chronological order
         assert history[0].content == "Hello, I'm interested"
         assert history[1].role == MessageRole.ASSISTANT
@@ -135,28 +136,64 @@ class TestMessageRepositoryConversationQueries:
         message_repo: MessageRepository,
         sample_messages: List[Message]
     ):
-        """Should support pagination with before parameter."""
+        """Should page backwards in time using the returned cursor."""
         await message_repo.bulk_create(sample_messages)
+        lead_id = sample_messages[0].lead_id
 
-        # Get messages before the second message timestamp
-        cutoff = sample_messages[1].timestamp
+        page, cursor = await message_repo.get_conversation_history(
+            lead_id=lead_id,
+            limit=2
+        )
 
-        history = await message_repo.get_conversation_history(
-            lead_id=sample_messages[0].lead_id,
-            before=cutoff
+        # Newest two messages, chronological
+        assert [m.content for m in page] == ["Great! How can I help?", "What's the pricing?"]
+        assert cursor is not None
+
+        older, cursor = await message_repo.get_conversation_history(
+            lead_id=lead_id,
+            limit=2,
+            before=cursor
         )
 
-        # Should only get first message
-        assert len(history) == 1
-        assert history[0].content == "Hello, I'm interested"
+        assert len(older) == 1
+        assert older[0].content == "Hello, I'm interested"
+        assert cursor is None
+
+    async def test_get_conversation_history_pagination_same_timestamp(
+        self,
+        message_repo: MessageRepository
+    ):
+        """Should not skip or duplicate messages sharing a timestamp."""
+        now = dt.datetime.now(dt.UTC)
+        lead_id = "+test5215538899801"
+        await message_repo.bulk_create([
+            Message(lead_id=lead_id, role=MessageRole.LEAD, content=f"msg {i}", timestamp=now)
+            for i in range(5)
+        ])
+
+        seen = []
+        cursor = None
+        while True:
+            page, cursor = await message_repo.get_conversation_history(
+                lead_id=lead_id,
+                limit=2,
+                before=cursor
+            )
+            seen.extend(m.id for m in page)
+            if cursor is None:
+                break
+
+        assert len(seen) == 5
+        assert len(set(seen)) == 5
 
     async def test_get_conversation_history_empty(self, message_repo: MessageRepository):
         """Should return empty list for lead with no messages."""
-        history = await message_repo.get_conversation_history(
+        history, next_cursor = await message_repo.get_conversation_history(
             lead_id="+test9999999999"
         )
 
         assert history == []
+        assert next_cursor is None
 
     async def test_get_recent_messages(
         self,
@@ -406,6 +443,25 @@ class TestMessageRepositoryDeletion:
         )
         assert count == 0
 
+    async def test_delete_messages_for_lead_in_batches(
+        self,
+        message_repo: MessageRepository,
+        sample_messages: List[Message]
+    ):
+        """Should delete everything even when spanning several batches."""
+        await message_repo.bulk_create(sample_messages)
+
+        deleted_count = await message_repo.delete_messages_for_lead(
+            lead_id=sample_messages[0].lead_id,
+            batch_size=2
+        )
+
+        assert deleted_count == 3
+        count = await message_repo.count_messages_for_lead(
+            lead_id=sample_messages[0].lead_id
+        )
+        assert count == 0
+
     async def test_delete_messages_for_lead_nonexistent(
         self,
         message_repo: MessageRepository
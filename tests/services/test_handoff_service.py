@@ -255,6 +255,18 @@ class TestLogOnlyNotifier:
         result = await notifier.notify(request)
         assert result is True
 
+    async def test_service_skips_summary_for_log_only(self, fresh_lead):
+        """Verifies conversation history isn't formatted for the log-only notifier."""
+        notifier = LogOnlyNotifier()
+        notifier.notify = AsyncMock(return_value=True)
+        service = HandoffService(notifier=notifier)
+
+        with patch.object(Lead, "format_history") as mock_format:
+            await service.initiate_handoff(fresh_lead, "Test")
+
+        mock_format.assert_not_called()
+        assert notifier.notify.call_args[0][0].conversation_summary == ""
+
 
 # --- SINGLETON TESTS ---
 
@@ -0,0 +1,199 @@
+"""Tests for the Twilio WhatsApp messaging service."""
+
+import asyncio
+import pytest
+import httpx
+
+from src.services import twilio_service
+from src.services.twilio_service import TwilioAPIError, TwilioService
+
+
+# --- FIXTURES ---
+
+@pytest.fixture
+def sent_requests():
+    """Collects requests seen by the mock transport."""
+    return []
+
+
+@pytest.fixture
+def service(sent_requests):
+    """Returns a TwilioService backed by a mock HTTP transport."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        sent_requests.append(request)
+        return httpx.Response(201, json={"sid": "SM123", "status": "queued"})
+
+    svc = TwilioService()
+    svc.client = httpx.AsyncClient(
+        base_url="https://api.twilio.com/2010-04-01/Accounts/ACtest",
+        transport=httpx.MockTransport(handler)
+    )
+    svc.from_number = "whatsapp:+10000000000"
+    return svc
+
+
+# --- SEND TESTS ---
+
+class TestSendWhatsAppMessage:
+    """Tests for TwilioService.send_whatsapp_message."""
+
+    async def test_returns_message_sid(self, service):
+        """Verifies the SID from the API response is returned."""
+        sid = await service.send_whatsapp_message("+5215538899800", "Hola")
+        assert sid == "SM123"
+
+    async def test_posts_form_to_messages_endpoint(self, service, sent_requests):
+        """Verifies the request targets Messages.json with form fields."""
+        await service.send_whatsapp_message("+5215538899800", "Hola")
+
+        request = sent_requests[0]
+        assert request.method == "POST"
+        assert request.url.path == "/2010-04-01/Accounts/ACtest/Messages.json"
+        body = request.content.decode()
+        assert "To=whatsapp%3A%2B5215538899800" in body
+        assert "From=whatsapp%3A%2B10000000000" in body
+        assert "Body=Hola" in body
+
+    async def test_retries_then_raises_on_http_error(self):
+        """Verifies failed sends are retried and the last error is raised."""
+        calls = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request)
+            return httpx.Response(500, json={"message": "error"})
+
+        svc = TwilioService()
+        svc.client = httpx.AsyncClient(
+            base_url="https://api.twilio.com/2010-04-01/Accounts/ACtest",
+            transport=httpx.MockTransport(handler)
+        )
+
+        with pytest.raises(httpx.HTTPStatusError):
+            await svc.send_whatsapp_message("+5215538899800", "Hola", max_retries=2)
+
+        assert len(calls) == 2
+
+    async def test_error_reports_twilio_code_and_message(self):
+        """Verifies a failed send surfaces Twilio's error code and message."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(400, json={
+                "code": 21211,
+                "message": "The 'To' number whatsapp:+1 is not a valid phone number.",
+                "more_info": "https://www.twilio.com/docs/errors/21211",
+                "status": 400
+            })
+
+        svc = TwilioService()
+        svc.client = httpx.AsyncClient(
+            base_url="https://api.twilio.com/2010-04-01/Accounts/ACtest",
+            transport=httpx.MockTransport(handler)
+        )
+
+        with pytest.raises(TwilioAPIError) as exc_info:
+            await svc.send_whatsapp_message("+1", "Hola", max_retries=1)
+
+        assert exc_info.value.code == 21211
+        assert "21211" in str(exc_info.value)
+        assert "is not a valid phone number" in str(exc_info.value)
+        await svc.close()
+
+    async def test_raises_when_not_configured(self):
+        """Verifies missing credentials raise before sending."""
+        svc = TwilioService()
+        svc.client = None
+
+        with pytest.raises(Exception, match="not configured"):
+            await svc.send_whatsapp_message("+5215538899800", "Hola")
+
+
+# --- QUEUE TESTS ---
+
+class TestSendQueue:
+    """Tests for the coalescing send queue."""
+
+    async def test_concurrent_sends_are_dispatched_together(self):
+        """Verifies queued messages are posted concurrently, not one by one."""
+        in_flight = 0
+        peak = 0
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return httpx.Response(201, json={"sid": "SM123"})
+
+        svc = TwilioService()
+        svc.client = httpx.AsyncClient(
+            base_url="https://api.twilio.com/2010-04-01/Accounts/ACtest",
+            transport=httpx.MockTransport(handler)
+        )
+
+        sids = await asyncio.gather(
+            *(svc.send_whatsapp_message(f"+52155388998{i:02d}", "Hola") for i in range(5))
+        )
+
+        assert sids == ["SM123"] * 5
+        assert peak > 1
+        await svc.close()
+
+    async def test_slow_send_does_not_hold_up_later_sends(self):
+        """Verifies a message queued behind a stalled send still goes out."""
+        release = asyncio.Event()
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            if b"Body=slow" in request.content:
+                await release.wait()
+            return httpx.Response(201, json={"sid": "SM123"})
+
+        svc = TwilioService()
+        svc.client = httpx.AsyncClient(
+            base_url="https://api.twilio.com/2010-04-01/Accounts/ACtest",
+            transport=httpx.MockTransport(handler)
+        )
+
+        slow = asyncio.create_task(svc.send_whatsapp_message("+5215538899800", "slow"))
+        await asyncio.sleep(0)
+        sid = await asyncio.wait_for(svc.send_whatsapp_message("+5215538899801", "fast"), 1)
+
+        assert sid == "SM123"
+        assert not slow.done()
+        release.set()
+        assert await slow == "SM123"
+        await svc.close()
+
+    async def test_close_fails_queued_and_in_flight_sends(self, monkeypatch):
+        """Verifies close() fails pending sends instead of leaving callers waiting."""
+        monkeypatch.setattr(twilio_service, "MAX_CONCURRENT_SENDS", 1)
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            await asyncio.Event().wait()
+
+        svc = TwilioService()
+        svc.client = httpx.AsyncClient(
+            base_url="https://api.twilio.com/2010-04-01/Accounts/ACtest",
+            transport=httpx.MockTransport(handler)
+        )
+
+        in_flight = asyncio.create_task(svc.send_whatsapp_message("+5215538899800", "Hola"))
+        queued = asyncio.create_task(svc.send_whatsapp_message("+5215538899801", "Hola"))
+        await asyncio.sleep(0.01)
+
+        await svc.close()
+
+        for send in (in_flight, queued):
+            with pytest.raises(Exception, match="closed"):
+                await asyncio.wait_for(send, 1)
+
+    async def test_close_stops_sender(self, service):
+        """Verifies close() cancels the background sender task."""
+        await service.send_whatsapp_message("+5215538899800", "Hola")
+        task = service._sender_task
+
+        await service.close()
+
+        assert task.cancelled()
+        assert service._sender_task is None
@@ -6,7 +6,7 @@ Validates circuit breaker behavior for LLM graceful degradation.
 
 import asyncio
 import pytest
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, MagicMock
 from src.utils.circuit_breaker import (
     CircuitBreaker,
     CircuitState,
@@ -89,6 +89,31 @@ class TestCircuitBreaker:
         assert result == "fallback"
         assert call_count == 3  # No additional call made
 
+    @pytest.mark.asyncio
+    async def test_fallback_runs_outside_lock(self, breaker):
+        """Fallback should be built after the state lock is released."""
+        await breaker.force_open()
+
+        def fallback():
+            assert not breaker._lock.locked()
+            return "fallback"
+
+        result = await breaker.call(AsyncMock(return_value="ok"), fallback)
+        assert result == "fallback"
+
+    @pytest.mark.asyncio
+    async def test_closed_success_skips_lock(self, breaker):
+        """Healthy calls in CLOSED state should not take the state lock."""
+        # A spy rather than a held lock, so a regression fails instead of hanging
+        breaker._lock = MagicMock()
+
+        result = await breaker.call(AsyncMock(return_value="ok"), lambda: "fallback")
+
+        assert result == "ok"
+        assert breaker.stats.total_successes == 1
+        breaker._lock.__enter__.assert_not_called()
+        breaker._lock.acquire.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_success_resets_failure_count(self, breaker):
         """Success should reset consecutive failure count."""
@@ -57,6 +57,17 @@ class TestCostTracker:
         expected = (100_000 / 1_000_000) * 0.15 + (100_000 / 1_000_000) * 0.60
         assert cost == pytest.approx(expected, rel=1e-6)
 
+    def test_accumulation_is_exact(self):
+        """Verify many tiny completions sum without float drift."""
+        tracker = CostTracker()
+
+        for _ in range(10_000):
+            tracker.track_completion(model="gpt-4o-mini", input_tokens=7, output_tokens=3)
+
+        # 10k * (7 * $0.15 + 3 * $0.60) per 1M tokens
+        assert tracker.lifetime_usage.cost_units == 10_000 * (7 * 150_000 + 3 * 600_000)
+        assert tracker.lifetime_usage.total_cost == 0.0285
+
     def test_per_agent_tracking(self):
         """Verify per-agent cost attribution."""
         tracker = CostTracker()
@@ -109,6 +120,50 @@ class TestCostTracker:
         assert tracker.hourly_usage.call_count == 5
         assert tracker.daily_usage.call_count == 5
 
+    def test_hourly_window_slides(self, monkeypatch):
+        """Verify usage leaves the hourly window 60 minutes after it was spent."""
+        clock = [1_000_000.0]
+        monkeypatch.setattr("src.utils.cost_tracker.time.monotonic", lambda: clock[0])
+        tracker = CostTracker()
+
+        tracker.track_completion(model="gpt-4o-mini", input_tokens=1000, output_tokens=500)
+        clock[0] += 30 * 60
+        tracker.track_completion(model="gpt-4o-mini", input_tokens=1000, output_tokens=500)
+        assert tracker.hourly_usage.call_count == 2
+
+        # First call ages out; the one 30 minutes later is still in the window
+        clock[0] += 31 * 60
+        tracker.track_completion(model="gpt-4o-mini", input_tokens=1000, output_tokens=500)
+
+        assert tracker.hourly_usage.call_count == 2
+        assert tracker.daily_usage.call_count == 3
+
+    def test_no_boundary_burst_across_hour(self, monkeypatch):
+        """Verify spend just before and after the old reset point is summed."""
+        clock = [1_000_000.0]
+        monkeypatch.setattr("src.utils.cost_tracker.time.monotonic", lambda: clock[0])
+        tracker = CostTracker()
+
+        tracker.track_completion(model="gpt-4o", input_tokens=1_000_000, output_tokens=0)
+        clock[0] += 59 * 60
+        tracker.track_completion(model="gpt-4o", input_tokens=1_000_000, output_tokens=0)
+
+        assert tracker.hourly_usage.total_cost == 5.0
+
+    def test_windows_reset_after_a_day_idle(self, monkeypatch):
+        """Verify both windows are empty after more than 24h without calls."""
+        clock = [1_000_000.0]
+        monkeypatch.setattr("src.utils.cost_tracker.time.monotonic", lambda: clock[0])
+        tracker = CostTracker()
+
+        tracker.track_completion(model="gpt-4o-mini", input_tokens=1000, output_tokens=500)
+        clock[0] += 25 * 3600
+        tracker.track_completion(model="gpt-4o-mini", input_tokens=1000, output_tokens=500)
+
+        assert tracker.hourly_usage.call_count == 1
+        assert tracker.daily_usage.call_count == 1
+        assert tracker.lifetime_usage.call_count == 2
+
     def test_unknown_model_fallback(self):
         """Verify unknown models default to gpt-4o pricing with warning."""
         tracker = CostTracker()
@@ -127,10 +182,10 @@ class TestCostTracker:
         """Verify hourly budget limit triggers exception."""
         # Temporarily set environment to development to enable budget enforcement
         monkeypatch.setenv("ENVIRONMENT", "development")
+        monkeypatch.setenv("HOURLY_COST_LIMIT_USD", "1.0")  # Set very low limit
         get_settings.cache_clear()
 
         tracker = CostTracker()
-        tracker.settings.hourly_cost_limit_usd = 1.0  # Set very low limit
 
         # First call should succeed
         tracker.track_completion(
@@ -156,11 +211,11 @@ class TestCostTracker:
         """Verify daily budget limit triggers exception."""
         # Temporarily set environment to development to enable budget enforcement
         monkeypatch.setenv("ENVIRONMENT", "development")
+        monkeypatch.setenv("DAILY_COST_LIMIT_USD", "1.0")  # Set very low limit
+        monkeypatch.setenv("HOURLY_COST_LIMIT_USD", "100.0")  # High hourly to test daily
         get_settings.cache_clear()
 
         tracker = CostTracker()
-        tracker.settings.daily_cost_limit_usd = 1.0  # Set very low limit
-        tracker.settings.hourly_cost_limit_usd = 100.0  # High hourly to test daily
 
         with pytest.raises(RuntimeError, match="DAILY BUDGET EXCEEDED"):
             tracker.track_completion(
@@ -119,3 +119,8 @@ class TestFallbackMessage:
         result = get_fallback_message()
         assert "fallback" in result.feedback_for_director.lower() or \
                "unavailable" in result.feedback_for_director.lower()
+
+    def test_returns_shared_instance(self):
+        """Should reuse the prebuilt response instead of rebuilding it."""
+        assert get_fallback_message("english") is get_fallback_message("english")
+        assert get_fallback_classification() is get_fallback_classification()
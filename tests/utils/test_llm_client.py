@@ -2,8 +2,11 @@
 Tests for LLM client retry logic and error handling.
 Verifies exponential backoff, error categorization, and fallback behavior.
 """
+import asyncio
+import httpx
 import pytest
 from unittest.mock import AsyncMock, Mock, patch
+from pydantic_ai.exceptions import ModelHTTPError
 from src.utils.llm_client import (
     run_agent_with_retry,
     run_agent_with_fallback,
@@ -11,7 +14,9 @@ from src.utils.llm_client import (
     get_circuit_status,
     is_circuit_open,
     LLMError,
-    LLMCriticalError
+    LLMCriticalError,
+    _categorize_error,
+    _backoff_schedule,
 )
 from src.utils.circuit_breaker import get_openai_circuit, CircuitState
 
@@ -48,6 +53,124 @@ class MockAgent:
         return mock_result
 
 
+class TestErrorCategorization:
+    """Test suite for error message categorization."""
+
+    @pytest.mark.parametrize("message,expected", [
+        ("Rate limit exceeded. Please try again later.", "rate_limit"),
+        ("limit reached for this rate tier", "rate_limit"),
+        ("Request timed out", "timeout"),
+        ("Read TIMEOUT", "timeout"),
+        ("503 Service Unavailable", "server_error"),
+        ("Authentication failed: Invalid API key", "auth"),
+        ("Error code: 401", "auth"),
+        ("Invalid request: Missing required field", "invalid_request"),
+        ("Connection reset by peer", "unknown"),
+    ])
+    def test_categorize_error(self, message, expected):
+        """Verify each message lands in the same bucket as before."""
+        assert _categorize_error(Exception(message)) == expected
+
+    @pytest.mark.parametrize("status,expected", [
+        (429, "rate_limit"),
+        (401, "auth"),
+        (400, "invalid_request"),
+        (503, "server_error"),
+        (418, "unknown"),
+    ])
+    def test_categorize_model_http_error(self, status, expected):
+        """Verify provider HTTP errors are bucketed by status code."""
+        error = ModelHTTPError(status_code=status, model_name="gpt-4o", body="short and stout")
+        assert _categorize_error(error) == expected
+
+    def test_categorize_httpx_errors(self):
+        """Verify httpx timeouts and status errors are bucketed by type."""
+        request = httpx.Request("POST", "https://api.openai.com/v1/chat/completions")
+        response = httpx.Response(502, request=request)
+
+        assert _categorize_error(httpx.ReadTimeout("boom", request=request)) == "timeout"
+        assert _categorize_error(
+            httpx.HTTPStatusError("bad gateway", request=request, response=response)
+        ) == "server_error"
+
+
+class TestBackoffSchedule:
+    """Test suite for the precomputed retry backoff schedule."""
+
+    def test_exponential_and_capped(self):
+        """Verify waits double per attempt and stop at max_wait."""
+        assert _backoff_schedule(2, 10, 4) == (2, 4, 8, 10)
+
+    async def test_published_as_gauge_after_reset(self):
+        """Verify each run republishes the schedule, even when it is already cached."""
+        from src.config import get_settings
+        from src.utils.metrics import metrics
+
+        settings = get_settings()
+        expected = _backoff_schedule(
+            settings.retry_min_wait_seconds, settings.retry_max_wait_seconds, 3
+        )
+
+        await run_agent_with_retry(MockAgent(), "Test prompt", max_retries=3)
+        metrics.reset()
+        await run_agent_with_retry(MockAgent(), "Test prompt", max_retries=3)
+
+        values = {v.labels["attempt"]: v.value for v in metrics.retry_backoff_seconds.collect()}
+        assert values == {"1": expected[0], "2": expected[1], "3": expected[2]}
+
+
+@pytest.mark.asyncio
+class TestConcurrencyLimit:
+    """Test suite for the in-flight LLM call cap."""
+
+    async def test_caps_concurrent_agent_runs(self, monkeypatch):
+        """Verify no more than the semaphore's limit run at once."""
+        monkeypatch.setattr("src.utils.llm_client._llm_semaphore", asyncio.Semaphore(2))
+        in_flight = 0
+        peak = 0
+
+        class SlowAgent:
+            async def run(self, prompt, deps=None):
+                nonlocal in_flight, peak
+                in_flight += 1
+                peak = max(peak, in_flight)
+                await asyncio.sleep(0.01)
+                in_flight -= 1
+                return Mock(output="ok")
+
+        results = await asyncio.gather(
+            *(run_agent_with_retry(SlowAgent(), "prompt") for _ in range(5))
+        )
+
+        assert results == ["ok"] * 5
+        assert peak == 2
+
+
+    async def test_token_taken_after_slot_is_held(self, monkeypatch):
+        """Verify the rate-limit token is taken when the call can go out, not while queued."""
+        monkeypatch.setattr("src.utils.llm_client._llm_semaphore", asyncio.Semaphore(1))
+        events = []
+
+        class RecordingBucket:
+            async def acquire(self):
+                events.append("token")
+
+        class RecordingAgent:
+            async def run(self, prompt, deps=None):
+                events.append("start")
+                await asyncio.sleep(0.01)
+                events.append("end")
+                return Mock(output="ok")
+
+        monkeypatch.setattr("src.utils.llm_client.get_openai_bucket", lambda: RecordingBucket())
+
+        await asyncio.gather(
+            *(run_agent_with_retry(RecordingAgent(), "prompt") for _ in range(2))
+        )
+
+        assert events == ["token", "start", "end"] * 2
+
+
 @pytest.mark.asyncio
 class TestRetryLogic:
     """Test suite for retry logic."""
@@ -1,14 +1,19 @@
 """
 Tests for Prometheus metrics collection.
 """
+import threading
+
 import pytest
 from src.utils.metrics import (
     MetricsRegistry,
     Counter,
+    ScalarCounter,
     Gauge,
+    ScalarGauge,
     Histogram,
     Timer,
     metrics,
+    get_metrics,
 )
 
 
@@ -41,6 +46,50 @@ class TestCounter:
         assert success_value.value == 2
         assert error_value.value == 2
 
+    def test_inc_key_matches_labeled_inc(self):
+        """A prebuilt label key updates the same row as keyword labels."""
+        counter = Counter("test_counter", "Test counter", ["agent", "type"])
+        counter.inc(1, type="input", agent="classifier")
+        counter.inc_key(counter.label_key(agent="classifier", type="input"), 2)
+
+        values = counter.collect()
+        assert len(values) == 1
+        assert values[0].value == 3
+
+    def test_declared_labels_pack_into_bytes_key(self):
+        """Declared label sets use a packed key; others fall back to a tuple."""
+        counter = Counter("test_counter", "Test counter", ["agent", "type"])
+
+        assert counter.label_key(type="input", agent="classifier") == b"classifier\x1finput"
+        assert counter.label_key(endpoint="x") == (("endpoint", "x"),)
+
+        counter.inc(1, agent="classifier", type="input")
+        counter.inc(1, endpoint="x")
+        labels = sorted(tuple(sorted(v.labels.items())) for v in counter.collect())
+        assert labels == [
+            (("agent", "classifier"), ("type", "input")),
+            (("endpoint", "x"),),
+        ]
+
+    def test_counter_concurrent_increments(self):
+        """Concurrent increments from many threads are not lost."""
+        counter = Counter("test_counter", "Test counter", ["agent"])
+
+        def worker():
+            for _ in range(1000):
+                counter.inc(agent="classifier")
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        values = counter.collect()
+        assert len(values) == 1
+        assert values[0].value == 8000
+
+
 
 class TestGauge:
     """Tests for Gauge metric type."""
@@ -74,6 +123,62 @@ class TestGauge:
         assert len(values) == 2
 
 
+class TestScalarCounter:
+    """Tests for label-less ScalarCounter."""
+
+    def test_increment(self):
+        """ScalarCounter accumulates into its single value."""
+        counter = ScalarCounter("test_counter", "Test counter")
+        counter.inc()
+        counter.inc(2.5)
+
+        values = counter.collect()
+        assert len(values) == 1
+        assert values[0].value == 3.5
+        assert values[0].labels == {}
+
+    def test_registry_uses_scalar_counter_without_labels(self):
+        """Registry returns ScalarCounter for label-less counters only."""
+        registry = MetricsRegistry()
+        assert isinstance(registry.queue_completed, ScalarCounter)
+        assert not isinstance(registry.requests_total, ScalarCounter)
+
+
+class TestScalarGauge:
+    """Tests for label-less ScalarGauge."""
+
+    def test_set_inc_dec(self):
+        """ScalarGauge supports set, inc and dec on its single value."""
+        gauge = ScalarGauge("test_gauge", "Test gauge")
+        gauge.set(10)
+        gauge.inc(5)
+        gauge.dec(3)
+
+        values = gauge.collect()
+        assert len(values) == 1
+        assert values[0].value == 12
+        assert values[0].labels == {}
+
+    def test_labels_rejected(self):
+        """Scalar metrics keep the labels parameter but reject any labels."""
+        gauge = ScalarGauge("test_gauge", "Test gauge")
+        counter = ScalarCounter("test_counter", "Test counter")
+
+        with pytest.raises(ValueError, match="test_gauge has no labels"):
+            gauge.set(1, region="us-east")
+        with pytest.raises(ValueError, match="test_counter has no labels"):
+            counter.inc(agent="classifier")
+
+        counter.inc_key(counter.label_key(), 2)
+        assert counter.collect()[0].value == 2
+
+    def test_registry_uses_scalar_gauge_without_labels(self):
+        """Registry returns ScalarGauge for label-less gauges only."""
+        registry = MetricsRegistry()
+        assert isinstance(registry.queue_pending, ScalarGauge)
+        assert not isinstance(registry.retry_backoff_seconds, ScalarGauge)
+
+
 class TestHistogram:
     """Tests for Histogram metric type."""
 
@@ -110,6 +215,18 @@ class TestHistogram:
         assert sum_value.value == pytest.approx(0.05 + 0.3 + 0.8 + 2.0)
         assert count_value.value == 4
 
+    def test_histogram_boundary_value_in_bucket(self):
+        """An observation equal to a bound counts in that bucket (le is inclusive)."""
+        histogram = Histogram("test_histogram", "Test histogram", buckets=(1.0, 0.5))
+        histogram.observe(0.5)
+
+        values = histogram.collect()
+        bucket_05 = next(v for v in values if v.labels.get("le") == "0.5")
+        bucket_10 = next(v for v in values if v.labels.get("le") == "1.0")
+
+        assert bucket_05.value == 1
+        assert bucket_10.value == 1
+
 
 class TestTimer:
     """Tests for Timer context manager."""
@@ -125,15 +242,27 @@ class TestTimer:
         count_value = next(v for v in values if v.labels.get("_metric") == "count")
         assert count_value.value == 1
 
+    def test_histogram_time_reuses_pooled_timer(self):
+        """Histogram.time() hands back the same Timer once it has exited."""
+        histogram = Histogram("test_duration", "Test duration", ["agent"])
+
+        with histogram.time(agent="classifier") as first:
+            pass
+        with histogram.time(agent="director") as second:
+            pass
+
+        assert first is second
+        agents = {v.labels["agent"] for v in histogram.collect() if v.labels.get("_metric") == "count"}
+        assert agents == {"classifier", "director"}
+
 
 class TestMetricsRegistry:
-    """Tests for MetricsRegistry singleton."""
+    """Tests for MetricsRegistry."""
 
-    def test_registry_is_singleton(self):
-        """MetricsRegistry returns same instance."""
-        registry1 = MetricsRegistry()
-        registry2 = MetricsRegistry()
-        assert registry1 is registry2
+    def test_get_metrics_returns_global_instance(self):
+        """get_metrics returns the shared module-level registry."""
+        assert get_metrics() is metrics
+        assert get_metrics() is get_metrics()
 
     def test_registry_has_application_metrics(self):
         """Registry initializes with expected application metrics."""
@@ -145,6 +274,17 @@ class TestMetricsRegistry:
         assert hasattr(registry, 'tokens_input')
         assert hasattr(registry, 'cost_usd')
 
+    def test_track_agent_tokens_drains_without_export(self):
+        """Queued token calls are applied once the drain threshold is reached."""
+        registry = MetricsRegistry()
+
+        for _ in range(registry.PENDING_DRAIN_THRESHOLD):
+            registry.track_agent_tokens("classifier", 10, 5, 0.001, 0.002)
+
+        assert len(registry._pending) == 0
+        [input_value] = registry.tokens_input.collect()
+        assert input_value.value == 10 * registry.PENDING_DRAIN_THRESHOLD
+
     def test_track_agent_tokens(self):
         """track_agent_tokens convenience method works."""
         registry = MetricsRegistry()
@@ -158,6 +298,10 @@ class TestMetricsRegistry:
             output_cost_usd=0.002
         )
 
+        # Calls are queued and applied to the counters at export time
+        assert registry.tokens_input.collect() == []
+        registry.export()
+
         # Verify tokens tracked
         input_values = registry.tokens_input.collect()
         classifier_input = next(
@@ -188,13 +332,26 @@ class TestMetricsRegistry:
         output = registry.export()
 
         # Check format
-        assert "# HELP gp_requests_total" in output
-        assert "# TYPE gp_requests_total counter" in output
-        assert 'gp_requests_total{status="success"} 1' in output
+        assert b"# HELP gp_requests_total" in output
+        assert b"# TYPE gp_requests_total counter" in output
+        assert b'gp_requests_total{status="success"} 1' in output
+
+        assert b"# HELP gp_queue_pending" in output
+        assert b"# TYPE gp_queue_pending gauge" in output
+        assert b"gp_queue_pending 5" in output
+
+    def test_export_histogram_series(self):
+        """Histograms export cumulative _bucket, _sum and _count series."""
+        registry = MetricsRegistry()
+        registry.agent_duration.observe(0.3, agent="classifier")
+
+        output = registry.export()
 
-        assert "# HELP gp_queue_pending" in output
-        assert "# TYPE gp_queue_pending gauge" in output
-        assert "gp_queue_pending 5" in output
+        assert b'gp_agent_duration_seconds_bucket{agent="classifier",le="0.25"} 0' in output
+        assert b'gp_agent_duration_seconds_bucket{agent="classifier",le="0.5"} 1' in output
+        assert b'gp_agent_duration_seconds_bucket{agent="classifier",le="+Inf"} 1' in output
+        assert b'gp_agent_duration_seconds_sum{agent="classifier"} 0.3' in output
+        assert b'gp_agent_duration_seconds_count{agent="classifier"} 1' in output
 
     def test_reset_clears_metrics(self):
         """Reset clears all metric values."""
@@ -228,6 +385,8 @@ class TestGlobalMetrics:
             'agent_calls',
             'agent_errors',
             'agent_duration',
+            'llm_inflight',
+            'retry_backoff_seconds',
             'tokens_input',
             'tokens_output',
             'tokens_total',
@@ -5,11 +5,14 @@ Validates E.164 normalization and Mexico edge cases.
 """
 
 import pytest
+from src.utils import phone_normalizer
 from src.utils.phone_normalizer import (
     PhoneNormalizer,
     PhoneNormalizationError,
     normalize_phone,
     get_phone_normalizer,
+    _normalizer_cache_clear,
+    _parse_and_validate,
 )
 
 
@@ -160,6 +163,36 @@ class TestPhoneNormalizer:
         """Invalid numbers should return False."""
         assert normalizer.are_equivalent("invalid", "+525512345678") is False
 
+    # ===========================================
+    # Batch Normalization
+    # ===========================================
+
+    def test_normalize_many_preserves_order(self, normalizer):
+        """Results line up with inputs; invalid numbers map to None."""
+        results = normalizer.normalize_many(
+            ["+52 1 55 1234 5678", "invalid", "+525512345678", "+52 1 55 1234 5678"]
+        )
+
+        assert [r.e164 if r else None for r in results] == [
+            "+525512345678", None, "+525512345678", "+525512345678"
+        ]
+
+    def test_normalize_many_normalizes_duplicates_once(self, normalizer, monkeypatch):
+        """Repeated inputs are only normalized once."""
+        calls = []
+        original_normalize = phone_normalizer.normalize
+
+        def counting_normalize(phone, default_region=None):
+            calls.append(phone)
+            return original_normalize(phone, default_region)
+
+        monkeypatch.setattr(phone_normalizer, "normalize", counting_normalize)
+
+        results = normalizer.normalize_many(["+525512345678"] * 3)
+
+        assert calls == ["+525512345678"]
+        assert results[0] is results[2]
+
     # ===========================================
     # Metadata
     # ===========================================
@@ -180,6 +213,45 @@ class TestPhoneNormalizer:
         result = normalizer.normalize(original)
         assert result.original == original
 
+    def test_cached_result_keeps_each_original(self, normalizer):
+        """Inputs that clean to the same number share one parse but keep their original."""
+        _normalizer_cache_clear()
+
+        first = normalizer.normalize("+52 55 1234 5678")
+        second = normalizer.normalize("+52 (55) 1234-5678")
+
+        assert _parse_and_validate.cache_info().hits == 1
+        assert first.original == "+52 55 1234 5678"
+        assert second.original == "+52 (55) 1234-5678"
+        assert first.e164 == second.e164 == "+525512345678"
+
+    def test_e164_skips_parser(self, normalizer, monkeypatch):
+        """Cleaned E.164 numbers for known country codes are built directly and still validated."""
+        _normalizer_cache_clear()
+
+        def fail_parse(*args, **kwargs):
+            raise AssertionError("phonenumbers.parse should not be called")
+
+        monkeypatch.setattr("src.utils.phone_normalizer.phonenumbers.parse", fail_parse)
+
+        result = normalizer.normalize("+52 1 55 1234 5678")
+        assert result.e164 == "+525512345678"
+        assert result.is_mobile is True
+        assert result.region == "MX"
+
+        us = normalizer.normalize("+1 (212) 555-1234")
+        assert us.e164 == "+12125551234"
+        assert us.region == "US"
+
+        with pytest.raises(PhoneNormalizationError, match="Invalid phone number"):
+            normalizer.normalize("+524000000000")
+
+    def test_invalid_number_cached_still_raises(self, normalizer):
+        """A cached invalid result raises on every call."""
+        for _ in range(2):
+            with pytest.raises(PhoneNormalizationError, match="Invalid phone number"):
+                normalizer.normalize("+52123")
+
     # ===========================================
     # Display Formatting
     # ===========================================
@@ -199,6 +271,12 @@ class TestConvenienceFunctions:
         result = normalize_phone("+52 1 55 1234 5678")
         assert result == "+525512345678"
 
+    def test_module_functions_match_class(self):
+        """Module-level functions and the PhoneNormalizer shim agree."""
+        assert phone_normalizer.normalize("+52 1 55 1234 5678").e164 == "+525512345678"
+        assert phone_normalizer.are_equivalent("+5215512345678", "5512345678") is True
+        assert PhoneNormalizer().normalize is phone_normalizer.normalize
+
     def test_get_phone_normalizer_singleton(self):
         """Should return same instance."""
         n1 = get_phone_normalizer()
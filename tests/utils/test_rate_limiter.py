@@ -4,9 +4,16 @@ Tests for Rate Limiter.
 
 import pytest
 import asyncio
-from datetime import datetime, timedelta, timezone
+import time
+from collections import deque
+from datetime import datetime, timezone
 
-from src.utils.rate_limiter import InMemoryRateLimiter, RateLimitResult
+from src.utils.rate_limiter import (
+    InMemoryRateLimiter,
+    RateLimitResult,
+    TokenBucket,
+    TokenBucketRateLimiter,
+)
 
 
 class TestInMemoryRateLimiter:
@@ -148,14 +155,59 @@ class TestInMemoryRateLimiter:
         spike_detected = await rate_limiter.detect_spike(lead_id)
         assert spike_detected is False
 
+    @pytest.mark.asyncio
+    async def test_check_and_detect(self, rate_limiter):
+        """Test combined check reports spikes only for allowed requests."""
+        lead_id = "+5215538899800"
+
+        results = [await rate_limiter.check_and_detect(lead_id) for _ in range(6)]
+
+        assert [spike for _, spike in results] == [False, False, True, True, True, False]
+        assert [r.allowed for r, _ in results] == [True] * 5 + [False]
+
+    @pytest.mark.asyncio
+    async def test_check_and_detect_without_spike_check(self, rate_limiter):
+        """Test spike detection is skipped entirely when not requested."""
+        lead_id = "+5215538899800"
+
+        results = [
+            await rate_limiter.check_and_detect(lead_id, spike_check=False) for _ in range(5)
+        ]
+
+        assert [spike for _, spike in results] == [False] * 5
+        assert await rate_limiter.detect_spike(lead_id) is True
+
+    @pytest.mark.asyncio
+    async def test_admit_rejects_banned_lead(self, rate_limiter):
+        """Test admit reports bans without counting the request."""
+        lead_id = "+5215538899800"
+        await rate_limiter.ban_lead(lead_id, 30, "Spam")
+
+        result = await rate_limiter.admit(lead_id)
+
+        assert result.allowed is False
+        assert result.banned is True
+        assert result.reason == "Spam"
+        assert result.reset_at > datetime.now(timezone.utc)
+        assert len(rate_limiter._requests[lead_id]) == 0
+
+    @pytest.mark.asyncio
+    async def test_admit_checks_rate_limit_when_not_banned(self, rate_limiter):
+        """Test admit falls through to the rate limit for unbanned leads."""
+        result = await rate_limiter.admit("+5215538899800")
+
+        assert result.allowed is True
+        assert result.banned is False
+        assert result.remaining == 4
+
     @pytest.mark.asyncio
     async def test_spike_window(self, rate_limiter):
         """Test that spike detection uses time window."""
         lead_id = "+5215538899800"
 
         # Manually add old requests
-        old_time = datetime.now(timezone.utc) - timedelta(seconds=20)
-        rate_limiter._requests[lead_id] = [old_time, old_time]
+        old_time = time.monotonic() - 20
+        rate_limiter._requests[lead_id] = deque([old_time, old_time])
 
         # Add 1 recent request
         await rate_limiter.check_rate_limit(lead_id)
@@ -202,8 +254,8 @@ class TestInMemoryRateLimiter:
         lead_id = "+5215538899800"
 
         # Add old request manually
-        old_time = datetime.now(timezone.utc) - timedelta(seconds=120)
-        rate_limiter._requests[lead_id] = [old_time]
+        old_time = time.monotonic() - 120
+        rate_limiter._requests[lead_id] = deque([old_time])
 
         # Make new request
         result = await rate_limiter.check_rate_limit(lead_id)
@@ -213,6 +265,20 @@ class TestInMemoryRateLimiter:
         assert len(rate_limiter._requests[lead_id]) == 1
         assert result.remaining == 4  # Should count as first request
 
+    @pytest.mark.asyncio
+    async def test_sweep_drops_idle_leads_and_expired_bans(self, rate_limiter):
+        """Test that the periodic sweep removes stale entries."""
+        rate_limiter.SWEEP_INTERVAL = 2
+        rate_limiter._requests["+5215538899801"] = deque([time.monotonic() - 120])
+        await rate_limiter.ban_lead("+5215538899802", 0, "Expired")
+        await rate_limiter.ban_lead("+5215538899803", 60, "Active")
+
+        await rate_limiter.check_rate_limit("+5215538899800")
+        await rate_limiter.check_rate_limit("+5215538899800")
+
+        assert set(rate_limiter._requests) == {"+5215538899800"}
+        assert set(rate_limiter._bans) == {"+5215538899803"}
+
     @pytest.mark.asyncio
     async def test_ban_overrides_rate_limit(self, rate_limiter):
         """Test that banned status is independent of rate limit."""
@@ -268,3 +334,120 @@ class TestInMemoryRateLimiter:
         result = await rate_limiter.check_rate_limit(lead3)
         assert result.allowed is True
         assert result.remaining == 4
+
+
+class TestTokenBucketRateLimiter:
+    """Test suite for TokenBucketRateLimiter."""
+
+    @pytest.fixture
+    def rate_limiter(self):
+        """Create rate limiter with test-friendly settings."""
+        return TokenBucketRateLimiter(
+            max_requests=5,
+            window_seconds=60,
+            spike_threshold=3,
+            spike_window_seconds=10,
+            ban_duration_seconds=30
+        )
+
+    @pytest.mark.asyncio
+    async def test_allows_burst_up_to_capacity(self, rate_limiter):
+        """Test that max_requests are allowed, then the lead is limited."""
+        lead_id = "+5215538899800"
+
+        results = [await rate_limiter.check_rate_limit(lead_id) for _ in range(6)]
+
+        assert [r.remaining for r in results[:5]] == [4, 3, 2, 1, 0]
+        assert results[5].allowed is False
+        assert results[5].retry_after >= 1
+        assert results[5].reset_at > datetime.now(timezone.utc)
+
+    @pytest.mark.asyncio
+    async def test_tokens_refill_over_time(self, rate_limiter, monkeypatch):
+        """Test that one token comes back every window_seconds / max_requests."""
+        lead_id = "+5215538899800"
+        now = [1000.0]
+        monkeypatch.setattr("src.utils.rate_limiter.time.monotonic", lambda: now[0])
+
+        for _ in range(5):
+            await rate_limiter.check_rate_limit(lead_id)
+        assert (await rate_limiter.check_rate_limit(lead_id)).allowed is False
+
+        now[0] += 12
+        result = await rate_limiter.check_rate_limit(lead_id)
+        assert result.allowed is True
+        assert result.remaining == 0
+
+    @pytest.mark.asyncio
+    async def test_spike_detection(self, rate_limiter):
+        """Test spike detection once the spike bucket is drained."""
+        lead_id = "+5215538899800"
+
+        for _ in range(2):
+            await rate_limiter.check_rate_limit(lead_id)
+        assert await rate_limiter.detect_spike(lead_id) is False
+
+        await rate_limiter.check_rate_limit(lead_id)
+        assert await rate_limiter.detect_spike(lead_id) is True
+
+    @pytest.mark.asyncio
+    async def test_ban_via_admit(self, rate_limiter):
+        """Test that the base admit() reports the ban's expiry and reason."""
+        lead_id = "+5215538899800"
+        await rate_limiter.ban_lead(lead_id, 30, "Spam")
+
+        result = await rate_limiter.admit(lead_id)
+
+        assert result.allowed is False
+        assert result.banned is True
+        assert result.reason == "Spam"
+        assert result.reset_at > datetime.now(timezone.utc)
+        assert 1 <= result.retry_after <= 30
+
+    @pytest.mark.asyncio
+    async def test_get_ban_info(self, rate_limiter):
+        """Test ban info is returned while the ban lasts."""
+        lead_id = "+5215538899800"
+        assert await rate_limiter.get_ban_info(lead_id) is None
+
+        await rate_limiter.ban_lead(lead_id, 30, "Spam")
+
+        ban_until, reason = await rate_limiter.get_ban_info(lead_id)
+        assert reason == "Spam"
+        assert ban_until > datetime.now(timezone.utc)
+
+
+class TestTokenBucket:
+    """Test suite for TokenBucket."""
+
+    @pytest.mark.asyncio
+    async def test_burst_up_to_capacity_is_immediate(self):
+        """Test that a full bucket serves a burst without waiting."""
+        bucket = TokenBucket(rate=1.0, capacity=5)
+
+        start = time.monotonic()
+        for _ in range(5):
+            await bucket.acquire()
+
+        assert time.monotonic() - start < 0.1
+
+    @pytest.mark.asyncio
+    async def test_waits_for_refill_when_empty(self):
+        """Test that an empty bucket paces callers to the refill rate."""
+        bucket = TokenBucket(rate=20.0, capacity=1)
+        await bucket.acquire()
+
+        start = time.monotonic()
+        await bucket.acquire()
+
+        assert time.monotonic() - start >= 0.04
+
+    @pytest.mark.asyncio
+    async def test_concurrent_waiters_all_acquire(self):
+        """Test that waiters sleep without holding the lock and all get tokens."""
+        bucket = TokenBucket(rate=50.0, capacity=1)
+
+        await asyncio.wait_for(
+            asyncio.gather(*(bucket.acquire() for _ in range(5))),
+            timeout=2.0
+        )
@@ -194,6 +194,15 @@ class TestTwilioSignatureValidator:
         # Validate
         assert validator.validate(url, params, signature) is True
 
+    def test_many_params(self, validator, auth_token):
+        """Test a webhook-sized payload with many non-ASCII fields."""
+        url = "https://example.com/webhooks/twilio"
+        params = {f"Field{i:02d}": f"valor ñ {i}" for i in range(40)}
+
+        signature = self.compute_test_signature(url, params, auth_token)
+
+        assert validator.compute_signature(url, params) == signature
+
     def test_url_with_query_params(self, validator, auth_token):
         """Test URL with query parameters."""
         url = "https://example.com/webhooks/twilio?foo=bar&baz=qux"